@@ -0,0 +1,3 @@
+# This Python file uses the following encoding: UTF-8
+
+"""This module contains the benchmarks of the program."""
@@ -0,0 +1,83 @@
+# This Python file uses the following encoding: UTF-8
+
+"""Benchmark module on the building of the pedigrees.
+
+This module measures the individuals per second of the
+Builder on synthetic file data of growing sizes, up to a
+million individuals by default. The indexing of the file
+units and the building of the inner units are measured on
+their own, so a linear scaling shows as a constant rate.
+The building in a worker process per CPU is measured too,
+with the linking of the encoded pedigrees in the parent process,
+which has to stay a small share of the sequential building, as
+it bounds the speedup of the building in parallel.
+"""
+
+from time import perf_counter
+
+import os
+import sys
+
+from logic.pedigree_builder import Builder
+
+from benchmarks.benchmark_data import iterate_synthetic_rows
+
+
+def measure_builder(file_data: list) -> tuple:
+    """Measure the seconds of the indexing and of the building.
+
+    This function returns the seconds of the indexing, of the
+    sequential building, of the building in parallel and of the
+    linking of the encoded pedigrees, which is the only part of
+    the building in parallel done in the parent process.
+    """
+    start_time = perf_counter()
+    builder = Builder(file_data)
+    build_time = perf_counter() - start_time
+
+    start_time = perf_counter()
+    builder.build_file_units()
+    index_time = perf_counter() - start_time
+
+    start_time = perf_counter()
+    parallel_builder = Builder(file_data, os.cpu_count() or 1, 256)
+    parallel_time = perf_counter() - start_time
+
+    pedigree_groups = list(Builder.group_file_units(file_data).values())
+    pedigree_encodings = [
+        Builder.encode_pedigree_data(pedigree_data)
+        for pedigree_data in pedigree_groups
+    ]
+
+    start_time = perf_counter()
+    Builder.link_parallel_pedigrees(pedigree_groups, pedigree_encodings)
+    link_time = perf_counter() - start_time
+
+    assert len(builder.file_individuals) == len(file_data)
+    assert len(parallel_builder.file_individuals) == len(file_data)
+    assert link_time < 0.5 * build_time, \
+        'The parent process links too slowly to scale with the cores!'
+    return index_time, build_time, parallel_time, link_time
+
+
+def main() -> None:
+    """Run the benchmark and print the individuals per second."""
+    maximum_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    number_rows = 1000
+
+    while number_rows <= maximum_rows:
+        index_time, build_time, parallel_time, link_time = measure_builder(
+            list(iterate_synthetic_rows(number_rows))
+        )
+        print('{} individuals: {:.0f} indexed/second, {:.0f} built/second, '
+              '{:.0f} built in parallel/second, {:.0%} of the sequential '
+              'building linked in the parent ({:.2f} seconds)'.format(
+                  number_rows, number_rows / index_time,
+                  number_rows / build_time, number_rows / parallel_time,
+                  link_time / build_time, build_time
+              ))
+        number_rows *= 10
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+# This Python file uses the following encoding: UTF-8
+
+"""Benchmark module on the synthetic pedigree data.
+
+This module contains the generators of the synthetic lines,
+which are shared by the benchmarks, so every benchmark
+measures the same shapes of pedigrees.
+"""
+
+from typing import Iterator
+from collections import deque
+
+
+def iterate_synthetic_rows(number_rows: int) -> Iterator[list]:
+    """Iterate over synthetic lines of nuclear families of six rows."""
+    for row_index in range(number_rows):
+        family, member = divmod(row_index, 6)
+        pedigree = 'pedigree' + str(family)
+
+        if member == 0:
+            yield [pedigree, 'father', '0', '0', '1', '2', 'prb']
+        elif member == 1:
+            yield [pedigree, 'mother', '0', '0', '2', '1', 'null']
+        else:
+            child = 'child' + str(member)
+            yield [pedigree, child, 'father', 'mother', '1', '1', 'null']
+
+
+def build_synthetic_pedigree(number_individuals: int) -> list:
+    """Build the lines of a synthetic pedigree of many generations.
+
+    Every couple has a son and a daughter, who are married to
+    founders and form the couples of the next generation. When
+    there are enough individuals, every couple left gets a single
+    child, so every individual is reachable from the proband.
+    """
+    pedigree_data = [
+        ['pedigree', 'founder1', '0', '0', '1', '1', 'null'],
+        ['pedigree', 'founder2', '0', '0', '2', '1', 'null'],
+    ]
+    pedigree_couples = deque([('founder1', 'founder2')])
+
+    while len(pedigree_data) < number_individuals:
+        father, mother = pedigree_couples.popleft()
+        son = 'son' + str(len(pedigree_data))
+        wife = 'wife' + str(len(pedigree_data))
+        daughter = 'daughter' + str(len(pedigree_data))
+        husband = 'husband' + str(len(pedigree_data))
+
+        pedigree_data.extend([
+            ['pedigree', son, father, mother, '1', '1', 'null'],
+            ['pedigree', wife, '0', '0', '2', '1', 'null'],
+            ['pedigree', daughter, father, mother, '2', '1', 'null'],
+            ['pedigree', husband, '0', '0', '1', '1', 'null'],
+        ])
+        pedigree_couples.extend([(son, wife), (husband, daughter)])
+
+    for father, mother in pedigree_couples:
+        child = 'child' + str(len(pedigree_data))
+        pedigree_data.append(
+            ['pedigree', child, father, mother, '1', '1', 'null']
+        )
+
+    pedigree_data[2][6] = 'prb'
+    return pedigree_data
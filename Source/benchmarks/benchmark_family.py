@@ -0,0 +1,62 @@
+# This Python file uses the following encoding: UTF-8
+
+"""Benchmark module on the structure of a single pedigree.
+
+This module measures the individuals per second of the
+linking of the units and of the ranking of the generations
+of a PedigreeFamily on synthetic pedigrees of growing sizes,
+from ten thousand up to a million individuals by default. A
+linear scaling shows as a constant rate.
+"""
+
+from time import perf_counter
+
+import sys
+
+from logic.pedigree_builder import Builder
+from logic.pedigree_family import PedigreeFamily
+
+from benchmarks.benchmark_data import build_synthetic_pedigree
+
+
+def measure_family(pedigree_data: list) -> tuple:
+    """Measure the seconds of the linking and of the ranking."""
+    pedigree_index = {}
+
+    for data_unit in pedigree_data:
+        Builder.add_file_unit(pedigree_index, data_unit)
+
+    pedigree_family = pedigree_index['pedigree']
+    assert isinstance(pedigree_family, PedigreeFamily)
+
+    start_time = perf_counter()
+    pedigree_family.build_mating_units()
+    pedigree_family.build_sibship_units()
+    link_time = perf_counter() - start_time
+
+    start_time = perf_counter()
+    pedigree_family.build_generation_rank()
+    rank_time = perf_counter() - start_time
+
+    assert not pedigree_family.collect_unreachable_individuals()
+    return link_time, rank_time
+
+
+def main() -> None:
+    """Run the benchmark and print the individuals per second."""
+    maximum_individuals = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    number_individuals = 10000
+
+    while number_individuals <= maximum_individuals:
+        pedigree_data = build_synthetic_pedigree(number_individuals)
+        link_time, rank_time = measure_family(pedigree_data)
+        print('{} individuals: {:.0f} linked/second, {:.0f} ranked/second '
+              '({:.2f} seconds)'.format(
+                  len(pedigree_data), len(pedigree_data) / link_time,
+                  len(pedigree_data) / rank_time, rank_time
+              ))
+        number_individuals *= 10
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+# This Python file uses the following encoding: UTF-8
+
+"""Benchmark module on the parsing of tab separated pedigree files.
+
+This module compares the rows per second of the regular
+expressions parsing with the one of the compiled tokenizer,
+sequentially and by byte ranges in worker processes, on a
+synthetic pedigree file with a million rows by default.
+"""
+
+from time import perf_counter
+from tempfile import TemporaryDirectory
+
+import os
+import re
+import sys
+
+from logic.pedigree_builder import Loader
+from logic.pedigree_builder import order_file_lines
+from logic.pedigree_tokenizer import Tokenizer
+
+from benchmarks.benchmark_data import iterate_synthetic_rows
+
+
+def write_synthetic_file(file_path: str, number_rows: int) -> None:
+    """Write a synthetic PED file with nuclear families of six rows."""
+    header_columns = ['#' + column for column in Loader.PEDIGREE_COLUMNS]
+
+    with open(file_path, 'w', encoding='utf-8') as file:
+        file.write('\t'.join(header_columns) + '\n')
+
+        for row in iterate_synthetic_rows(number_rows):
+            file.write('\t\t'.join(row) + '\n')
+
+        file.write('\n')
+
+
+def parse_regular_expressions(file_path: str) -> int:
+    """Parse the file like the Loader did before the tokenizer."""
+    dictionary_order = dict(Loader.PEDIGREE_COLUMNS)
+    number_rows = 0
+
+    with open(file_path, encoding='utf-8') as file:
+        file.readline()
+
+        for file_line in file.readlines()[:-1]:
+            file_line = re.sub(' +', '\t', file_line)
+            file_line = re.sub('\t+', '\t', file_line)
+            file_line = file_line.strip('\n').split('\t')
+
+            ordered_line = []
+
+            for column_name in Loader.PEDIGREE_COLUMNS:
+                ordered_line.append(file_line[dictionary_order[column_name]])
+
+            number_rows += 1
+
+    return number_rows
+
+
+def parse_tokenizer(file_path: str) -> int:
+    """Parse the file with the compiled tokenizer of the Loader."""
+    dictionary_order = dict(Loader.PEDIGREE_COLUMNS)
+    number_rows = 0
+
+    for _ in order_file_lines(file_path, '.ped', dictionary_order):
+        number_rows += 1
+
+    return number_rows
+
+
+def parse_tokenizer_ranges(file_path: str) -> int:
+    """Parse the file by byte ranges in a worker process per CPU."""
+    tokenizer = Tokenizer(tuple(Loader.PEDIGREE_COLUMNS.values()))
+    number_rows = 0
+
+    for _ in tokenizer.tokenize_file_ranges(
+            file_path, os.cpu_count() or 1, 1 << 22):
+        number_rows += 1
+
+    return number_rows
+
+
+def main() -> None:
+    """Run the benchmark and print the rows per second."""
+    number_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    with TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, 'Synthetic.ped')
+        write_synthetic_file(file_path, number_rows)
+
+        for name, parser in (('regular expressions', parse_regular_expressions),
+                             ('compiled tokenizer', parse_tokenizer),
+                             ('tokenizer ranges', parse_tokenizer_ranges)):
+            start_time = perf_counter()
+            parsed_rows = parser(file_path)
+            elapsed_time = perf_counter() - start_time
+
+            assert parsed_rows == number_rows
+            print('{}: {:.0f} rows/second ({:.2f} seconds)'.format(
+                name, parsed_rows / elapsed_time, elapsed_time
+            ))
+
+
+if __name__ == '__main__':
+    main()
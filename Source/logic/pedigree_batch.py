@@ -0,0 +1,235 @@
+# This Python file uses the following encoding: UTF-8
+
+"""The module has the class BatchLoader.
+
+This module contains the logic of loading many pedigree
+files at once from a directory, a glob pattern or a zip
+archive in a pool of worker processes.
+"""
+
+from typing import BinaryIO
+from typing import Iterator
+from functools import lru_cache
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+
+import os
+import glob
+import zipfile
+
+from logic.pedigree_builder import Loader
+from logic.pedigree_builder import split_file_name
+from logic.pedigree_builder import manage_stream_header
+from logic.pedigree_builder import order_stream_lines
+from logic.pedigree_builder import find_first_line
+from logic.pedigree_formats import FORMAT_READERS
+from logic.pedigree_formats import find_format_reader
+from logic.pedigree_validator import Validator
+
+
+@lru_cache(maxsize=None)
+def open_batch_archive(archive_path: str) -> zipfile.ZipFile:
+    """Open a zip archive only once in every single process.
+
+    This function keeps the archive open, so its directory
+    is read once per process and not once per member file.
+    """
+    return zipfile.ZipFile(archive_path)
+
+
+def read_stream_data(file_name: str, file_object: BinaryIO,
+                     file_options: dict) -> list:
+    """Read the validated data of a pedigree file from a stream.
+
+    This function manages the header and the lines of the
+    file by the format given by its name and the options of
+    the loading and validates its data in the same way as
+    the Loader class does.
+    """
+    _, file_suffix, file_compression = split_file_name(file_name)
+
+    if file_compression:
+        file_object = Loader.COMPRESSION_EXTENSIONS[file_compression](
+            file_object, 'rb'
+        )
+
+    reader_class = find_format_reader(file_suffix)
+
+    if reader_class is not None:
+        format_reader = reader_class(file_options)
+        file_data = list(format_reader.read_lines(file_object))
+    else:
+        dictionary_order = manage_stream_header(
+            file_object, file_suffix, file_options['extra_columns']
+        )
+        file_data = list(
+            order_stream_lines(file_object, file_suffix, dictionary_order)
+        )
+
+    first_line = find_first_line(file_suffix)
+    file_violations = Validator.validate_pedigree_data(
+        file_data, range(first_line, len(file_data) + first_line)
+    )
+    assert not file_violations, \
+        '\n'.join(['The file data is not valid!'] + file_violations)
+
+    return file_data
+
+
+def load_batch_member(batch_member: tuple, file_options=None) -> tuple:
+    """Load a single pedigree file of a batch in a worker process.
+
+    This function accepts the path to the archive, which is
+    nothing for a regular file, the name of the file and
+    optionally the options of the loading. It returns the
+    name, the data and the error of the file.
+    """
+    archive_path, file_name = batch_member
+
+    try:
+        file_options = Loader.build_file_options(file_options)
+
+        if archive_path is None:
+            with open(file_name, 'rb') as file:
+                file_data = read_stream_data(file_name, file, file_options)
+        else:
+            with open_batch_archive(archive_path).open(file_name) as file:
+                file_data = read_stream_data(file_name, file, file_options)
+    except (AssertionError, ValueError, StopIteration) as file_error:
+        return file_name, None, file_error
+
+    return file_name, file_data, None
+
+
+class BatchLoader:
+    """BatchLoader Class.
+
+    This class is used to load the data of many pedigree
+    files from a directory, a glob pattern or a zip archive.
+    The members of an archive are read from its stream without
+    extracting them. The files are read and parsed in a pool
+    of worker processes, which are started only once.
+    """
+
+    def __init__(self, batch_path: str, workers: int = 1,
+                 file_options=None) -> None:
+        """Initialize an instance of the BatchLoader class.
+
+        It accepts the path to a directory, a zip archive or
+        a single file, or a glob pattern, the number of the
+        worker processes and optionally a dictionary with the
+        options of the loading of every file. The pedigree files
+        are collected by their suffixes at initialization.
+        """
+        try:
+            not_string_message = 'The batch path is not a string!'
+            not_workers_message = 'The number of workers is not valid!'
+            not_found_message = 'The batch has not any pedigree file!'
+
+            assert isinstance(batch_path, str), not_string_message
+            assert isinstance(workers, int) and workers > 0, \
+                not_workers_message
+
+            self.__batch_path = batch_path
+            self.__workers = workers
+            self.__file_options = Loader.build_file_options(file_options)
+            self.__batch_members = self.collect_batch_members()
+
+            assert self.__batch_members, not_found_message
+        except (AssertionError, ValueError) as file_error:
+            Loader.exit_file_error(file_error)
+
+    @property
+    def batch_path(self) -> str:
+        """Return the batch path property of the class."""
+        return self.__batch_path
+
+    @property
+    def workers(self) -> int:
+        """Return the workers property of the class."""
+        return self.__workers
+
+    @property
+    def file_options(self) -> dict:
+        """Return the file options property of the class."""
+        return self.__file_options
+
+    @property
+    def batch_members(self) -> list:
+        """Return the batch members property of the class."""
+        return self.__batch_members
+
+    @staticmethod
+    def is_pedigree_file(file_name: str) -> bool:
+        """Check if a file is a pedigree file by its suffixes."""
+        file_suffix = split_file_name(file_name)[1].lower()
+        return file_suffix in Loader.TAB_SEPARATED_EXTENSIONS + \
+            Loader.COMMA_SEPARATED_EXTENSIONS + list(FORMAT_READERS)
+
+    @staticmethod
+    def is_batch_path(batch_path: str) -> bool:
+        """Check if a path is a batch of pedigree files.
+
+        This method accepts only zip archives, directories and
+        glob patterns, so any other path is a single file.
+        """
+        return batch_path.lower().endswith('.zip') or \
+            os.path.isdir(batch_path) or glob.has_magic(batch_path)
+
+    def collect_batch_members(self) -> list:
+        """Collect the pedigree files of the batch.
+
+        This method returns the pairs of the path to the archive
+        and the name of every pedigree file. The files in a
+        directory and the files of a glob pattern are sorted by
+        their names, while the members of an archive keep their
+        order in the archive.
+        """
+        if self.batch_path.lower().endswith('.zip') and \
+                os.path.isfile(self.batch_path):
+            try:
+                with zipfile.ZipFile(self.batch_path) as archive:
+                    return [
+                        (self.batch_path, member.filename)
+                        for member in archive.infolist()
+                        if not member.is_dir() and
+                        BatchLoader.is_pedigree_file(member.filename)
+                    ]
+            except zipfile.BadZipFile as zip_error:
+                message = 'The archive is not valid!'
+                raise ValueError(message) from zip_error
+
+        if os.path.isdir(self.batch_path):
+            file_paths = [
+                os.path.join(self.batch_path, file_name)
+                for file_name in os.listdir(self.batch_path)
+            ]
+        elif os.path.isfile(self.batch_path):
+            file_paths = [self.batch_path]
+        else:
+            file_paths = glob.glob(self.batch_path)
+
+        return [
+            (None, file_path) for file_path in sorted(file_paths)
+            if os.path.isfile(file_path) and
+            BatchLoader.is_pedigree_file(file_path)
+        ]
+
+    def stream_batch_data(self) -> Iterator[tuple]:
+        """Stream the names and the validated data of the files.
+
+        This method yields the pairs in the order of the files
+        in the batch, while the next files are read and parsed
+        by the workers. The program exits on the first file,
+        which is not valid, with the error of the file.
+        """
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for file_name, file_data, file_error in executor.map(
+                    load_batch_member, self.batch_members,
+                    repeat(self.file_options)):
+                if file_error is not None:
+                    message = 'The file {} is not valid!'
+                    print(message.format(file_name))
+                    Loader.exit_file_error(file_error)
+
+                yield file_name, file_data
@@ -7,17 +7,179 @@ and building pedigree nuclear families with pedigree units.
 """
 
 from pathlib import Path
+from typing import Union
+from typing import Optional
 from typing import TextIO
+from typing import BinaryIO
+from typing import Iterable
+from typing import Iterator
+from io import BytesIO
 from io import TextIOWrapper
-from collections import defaultdict
+from itertools import groupby
+from concurrent.futures import ProcessPoolExecutor
 
 import os
+import gc
 import sys
-import re
 import csv
+import bz2
+import gzip
+import lzma
 
 from logic.pedigree_units import Individual
 from logic.pedigree_family import PedigreeFamily
+from logic.pedigree_cache import ParseCache
+from logic.pedigree_formats import FormatReader
+from logic.pedigree_formats import find_format_reader
+from logic.pedigree_sorter import ExternalSorter
+from logic.pedigree_table import PedigreeTable
+from logic.pedigree_tokenizer import Tokenizer
+from logic.pedigree_validator import Validator
+
+
+def open_file(file_path: str, file_compression: str, binary_mode=False):
+    """Open a file for reading with its compression.
+
+    This function opens the compressed files as streams,
+    which are decompressed while they are read, so the
+    whole file is never decompressed at the same time.
+    """
+    if file_compression:
+        opener = Loader.COMPRESSION_EXTENSIONS[file_compression]
+    else:
+        opener = open
+
+    if binary_mode:
+        return opener(file_path, 'rb')
+
+    return opener(file_path, 'rt', encoding='utf-8', newline='')
+
+
+def order_column_indices(dictionary_order: dict) -> tuple:
+    """Order the indices of the columns in a file.
+
+    This function returns the indices of the
+    columns in the order of the pedigree columns.
+    """
+    return tuple(
+        dictionary_order[column_name]
+        for column_name in Loader.PEDIGREE_COLUMNS
+    )
+
+
+def tokenize_file_line(file_line: bytes, file_suffix: str,
+                       tokenizer: Tokenizer) -> list:
+    """Tokenize a single line of a file read as bytes.
+
+    This function splits the line by the format of the
+    file and returns its values ordered by the pedigree
+    columns. A missing value raises an index error.
+    """
+    if file_suffix.lower() in Loader.COMMA_SEPARATED_EXTENSIONS:
+        file_values = next(csv.reader([file_line.decode('utf-8')]))
+        return [file_values[index] for index in tokenizer.column_indices]
+
+    return tokenizer.tokenize_line(file_line)
+
+
+def split_file_name(file_name: str) -> tuple:
+    """Split the name of a file into its stem, suffix and compression.
+
+    This function returns the suffix of the format of the file
+    even if the file is compressed, which is the last suffix.
+    """
+    file_compression = ''
+
+    if Path(file_name).suffix.lower() in Loader.COMPRESSION_EXTENSIONS:
+        file_compression = Path(file_name).suffix.lower()
+        file_name = Path(file_name).stem
+
+    return Path(file_name).stem, Path(file_name).suffix, file_compression
+
+
+def manage_stream_header(file_object: BinaryIO, file_suffix: str,
+                         extra_columns=False) -> dict:
+    """Manage the header of a given binary stream.
+
+    This function reads only the first line of the stream
+    and returns the order of the columns by the format
+    of the file, which is given by its suffix.
+    """
+    header_object = TextIOWrapper(
+        BytesIO(file_object.readline()), encoding='utf-8', newline=''
+    )
+
+    if file_suffix.lower() in Loader.TAB_SEPARATED_EXTENSIONS:
+        return Loader.manage_tabbed_separated(header_object, extra_columns)
+    if file_suffix.lower() in Loader.COMMA_SEPARATED_EXTENSIONS:
+        return Loader.manage_comma_separated(header_object, extra_columns)
+
+    raise ValueError("The format of the file is not recognized!")
+
+
+def order_stream_lines(file_object: BinaryIO, file_suffix: str,
+                       dictionary_order: dict) -> Iterator[list]:
+    """Order the lines of a stream by the pedigree columns.
+
+    This function yields the lines of a binary stream after
+    its header one by one with their values ordered by
+    the pedigree columns. The tab separated files are
+    split by a precomputed tokenizer.
+    """
+    column_indices = order_column_indices(dictionary_order)
+
+    if file_suffix.lower() in Loader.TAB_SEPARATED_EXTENSIONS:
+        yield from Tokenizer(column_indices).tokenize_lines(file_object)
+    else:
+        text_object = TextIOWrapper(file_object, encoding='utf-8', newline='')
+
+        for file_line in csv.reader(text_object):
+            yield [file_line[index] for index in column_indices]
+
+
+def order_file_lines(file_path: str, file_suffix: str,
+                     dictionary_order: dict,
+                     file_compression='') -> Iterator[list]:
+    """Order the lines of a file by the pedigree columns.
+
+    This function skips the header of the file and yields
+    its lines one by one with their values ordered by
+    the pedigree columns. The file is read as bytes,
+    which are decompressed while they are read.
+    """
+    with open_file(file_path, file_compression, True) as file:
+        file.readline()
+        yield from order_stream_lines(file, file_suffix, dictionary_order)
+
+
+def read_format_lines(file_path: str, file_compression: str,
+                      format_reader: FormatReader) -> Iterator[list]:
+    """Read the lines of a file by a registered format reader.
+
+    This function yields the lines of a file without a
+    header one by one with their values ordered by the
+    pedigree columns, as they are read by the reader.
+    """
+    with open_file(file_path, file_compression, True) as file:
+        yield from format_reader.read_lines(file)
+
+
+def select_reader_options(file_options: dict) -> dict:
+    """Select the options of the loading, which change the file data."""
+    return {
+        option_name: file_options[option_name]
+        for option_name in Loader.READER_OPTIONS
+    }
+
+
+def find_first_line(file_suffix: str) -> int:
+    """Find the number of the first data line of a file.
+
+    This function returns the first line of the registered
+    format of the file or the line after the header.
+    """
+    reader_class = find_format_reader(file_suffix)
+    return 2 if reader_class is None else reader_class.FIRST_LINE
 
 
 class Loader:
@@ -25,8 +187,10 @@ class Loader:
 
     This class is used to load the whole
     data from a pedigree file. The file
-    can be tabbed separated or comma separated.
-    By default, the file is in PED format.
+    can be tabbed separated or comma separated
+    or in a registered format without a header.
+    By default, the file is in PED format. The file
+    can be compressed with gzip, bzip2 or xz as well.
     """
 
     PEDIGREE_COLUMNS = {
@@ -42,10 +206,45 @@ class Loader:
     TAB_SEPARATED_EXTENSIONS = ['.txt', '.ped']
     COMMA_SEPARATED_EXTENSIONS = ['.csv']
 
-    def __init__(self, file_path: str) -> None:
+    COMPRESSION_EXTENSIONS = {
+        '.gz': gzip.open,
+        '.bz2': bz2.open,
+        '.xz': lzma.open,
+    }
+
+    FILE_OPTIONS = {
+        'streaming': False,
+        'columnar': False,
+        'workers': 1,
+        'chunk_size': 16,
+        'range_size': 1 << 24,
+        'interleaved': False,
+        'run_size': 1 << 16,
+        'cache_directory': None,
+        'cache_size': 1 << 28,
+        'proband_rule': 'affected',
+        'probands': None,
+        'extra_columns': False,
+    }
+
+    READER_OPTIONS = ['proband_rule', 'probands', 'extra_columns']
+
+    ERROR_CODES = {
+        AssertionError: 1,
+        ValueError: 2,
+        StopIteration: 3,
+    }
+
+    def __init__(self, file_path: str, file_options=None) -> None:
         """Initialize an instance of the Loader class.
 
-        It accepts the path to the file with the data.
+        It accepts the path to the file with the data and
+        optionally a dictionary with the options of the loading.
+        In streaming mode the file is not read at initialization,
+        but pedigree by pedigree through the stream method. In
+        columnar mode the file data is kept in a pedigree table.
+        With a cache directory the validated file data is cached
+        and the unchanged file is not parsed and validated again.
         """
         try:
             not_string_message = 'The file path is not a string!'
@@ -62,23 +261,26 @@ class Loader:
 
             self.__file_path = file_path
             self.__file_name = Path(file_path).name
-            self.__file_stem = Path(file_path).stem
-            self.__file_suffix = Path(file_path).suffix
-            self.__file_data = self.read_file_data()
-
-            assert self.validate_file_data(), not_valid_message
-        except AssertionError as assertion_error:
-            print(str(assertion_error))
-            print("Check your file carefully!")
-            sys.exit(1)
-        except ValueError as value_error:
-            print(str(value_error))
-            print("Check your file carefully!")
-            sys.exit(2)
-        except StopIteration as stop_iteration:
-            print(str(stop_iteration))
-            print("Check your file carefully!")
-            sys.exit(3)
+            self.__file_stem, self.__file_suffix, self.__file_compression = \
+                split_file_name(self.__file_name)
+            self.__file_options = Loader.build_file_options(file_options)
+            self.__file_data = []
+
+            if not self.file_options['streaming']:
+                self.__file_data = self.load_cached_data()
+
+            if self.__file_data is None:
+                if self.file_options['columnar']:
+                    self.__file_data = self.read_file_table()
+                else:
+                    self.__file_data = self.read_file_data()
+
+                file_violations = self.validate_file_data()
+                assert not file_violations, \
+                    '\n'.join([not_valid_message] + file_violations)
+                self.store_cached_data()
+        except (AssertionError, ValueError, StopIteration) as file_error:
+            Loader.exit_file_error(file_error)
 
     @property
     def file_path(self) -> str:
@@ -101,16 +303,62 @@ class Loader:
         return self.__file_suffix
 
     @property
-    def file_data(self) -> list:
+    def file_compression(self) -> str:
+        """Return the file compression property of the class."""
+        return self.__file_compression
+
+    @property
+    def file_options(self) -> dict:
+        """Return the file options property of the class."""
+        return self.__file_options
+
+    @property
+    def file_data(self) -> Union[list, PedigreeTable]:
         """Return the file data property of the class."""
         return self.__file_data
 
     @classmethod
-    def manage_tabbed_separated(cls, file_object: TextIO) -> dict:
+    def build_file_options(cls, file_options) -> dict:
+        """Build the options of the loading from the given ones.
+
+        This method fills the missing options with their
+        default values and rejects the unknown options.
+        """
+        assert isinstance(file_options, (dict, type(None))), \
+            'The file options are not a dictionary!'
+
+        built_options = dict(Loader.FILE_OPTIONS)
+
+        for option_name, option_value in (file_options or {}).items():
+            message = 'The file option {} is not recognized!'
+            assert option_name in built_options, message.format(option_name)
+            built_options[option_name] = option_value
+
+        return built_options
+
+    @staticmethod
+    def exit_file_error(file_error: Exception) -> None:
+        """Exit the program because of an error in the file.
+
+        This method prints the error and exits with
+        the code corresponding to the type of the error.
+        """
+        print(str(file_error))
+        print("Check your file carefully!")
+
+        for error_type, error_code in Loader.ERROR_CODES.items():
+            if isinstance(file_error, error_type):
+                sys.exit(error_code)
+
+    @classmethod
+    def manage_tabbed_separated(cls, file_object: TextIO,
+                                extra_columns=False) -> dict:
         """Manage a tab separated file and return its column order.
 
         This method accepts a file object and returns a dictionary
         with the order of the columns in the file as they are given.
+        The unknown columns are skipped only if extra columns are
+        allowed, so they are never read with the pedigree columns.
         """
         try:
             assert isinstance(file_object, TextIOWrapper)
@@ -119,19 +367,14 @@ class Loader:
             raise AssertionError(message) from assertion_error
 
         dictionary_order = {}
+        header_line = Tokenizer.tokenize_header(file_object.readline())
 
-        header_line = file_object.readline()
-        header_line = re.sub(' +', '\t', header_line)
-        header_line = re.sub('\t+', '\t', header_line)
-        header_line = header_line.strip('\n').split('\t')
-
-        for column_name in header_line:
-            if column_name[1:] in Loader.PEDIGREE_COLUMNS:
-                key_column = column_name[1:]
-                dictionary_order[key_column] = header_line.index(column_name)
-            else:
+        for column_index, column_name in enumerate(header_line):
+            if column_name in Loader.PEDIGREE_COLUMNS:
+                dictionary_order[column_name] = column_index
+            elif not extra_columns:
                 message = 'The column name {} is not recognized!'
-                raise ValueError(message.format(column_name[1:]))
+                raise ValueError(message.format(column_name))
 
         if len(dictionary_order) != len(Loader.PEDIGREE_COLUMNS):
             message = 'There is a missing column in the file!'
@@ -140,11 +383,14 @@ class Loader:
         return dictionary_order
 
     @classmethod
-    def manage_comma_separated(cls, file_object: TextIO) -> dict:
+    def manage_comma_separated(cls, file_object: TextIO,
+                               extra_columns=False) -> dict:
         """Manage a comma separated file and its return column order.
 
         This method accepts a file object and returns a dictionary
         with the order of the columns in the file as they are given.
+        The unknown columns are skipped only if extra columns are
+        allowed, so they are never read with the pedigree columns.
         """
         try:
             assert isinstance(file_object, TextIOWrapper)
@@ -166,7 +412,7 @@ class Loader:
         for column_name in header_line:
             if column_name in Loader.PEDIGREE_COLUMNS:
                 dictionary_order[column_name] = header_line.index(column_name)
-            else:
+            elif not extra_columns:
                 message = 'The column name {} is not recognized!'
                 raise ValueError(message.format(column_name))
 
@@ -176,154 +422,193 @@ class Loader:
 
         return dictionary_order
 
-    def read_file_data(self) -> list:
-        """Read the file data from a given file.
+    def manage_file_header(self) -> dict:
+        """Manage the header of a given file.
 
-        This method manages the whole reading of the file,
-        no matter if it is in tab or comma separated format.
+        This method returns the order of the columns in the
+        file, no matter if it is in tab or comma separated format
+        and if it is compressed with gzip, bzip2 or xz.
         """
-        file_data = []
-        buffer_data = []
-
-        with open(self.file_path, encoding='utf-8') as file:
-            if self.file_suffix.lower() in Loader.TAB_SEPARATED_EXTENSIONS:
-                dictionary_order = self.manage_tabbed_separated(file)
-
-                file_lines = file.readlines()
-
-                if len(file_lines) != 1 and file_lines[-1] != '\n':
-                    raise ValueError('The file must end with a new line!')
-
-                for file_line in file_lines[:-1]:
-                    file_line = re.sub(' +', '\t', file_line)
-                    file_line = re.sub('\t+', '\t', file_line)
-                    file_line = file_line.strip('\n').split('\t')
-                    buffer_data.append(file_line)
-            elif self.file_suffix.lower() in Loader.COMMA_SEPARATED_EXTENSIONS:
-                dictionary_order = self.manage_comma_separated(file)
-                csv_reader = csv.reader(file)
-
-                for file_line in csv_reader:
-                    buffer_data.append(file_line)
-            else:
-                raise ValueError("The format of the file is not recognized!")
+        with open_file(self.file_path, self.file_compression, True) as file:
+            return manage_stream_header(
+                file, self.file_suffix, self.file_options['extra_columns']
+            )
 
-            for file_line in buffer_data:
-                ordered_line = []
+    def iterate_file_data(self) -> Iterator[list]:
+        """Iterate the file data from a given file.
 
-                for column_name in Loader.PEDIGREE_COLUMNS:
-                    string_value = file_line[dictionary_order[column_name]]
-                    ordered_line.append(string_value)
-
-                file_data.append(ordered_line)
-
-        return file_data
-
-    def validate_file_data(self) -> bool:
-        """Validate the file data from a given file."""
-        distributed_data = defaultdict(list)
-
-        for data_unit in self.file_data:
-            distributed_data[data_unit[0]].append(data_unit)
-
-        for key in distributed_data:
-            data = distributed_data[key]
-
-            if not Loader.validate_number_individuals(data):
-                return False
+        This method manages the whole reading of the file,
+        no matter if it is in tab or comma separated format
+        and if it is compressed with gzip, bzip2 or xz.
+        The header of the file is managed immediately, while
+        the ordered lines of the file are yielded one by one.
+        With more than one worker an uncompressed tab separated
+        file is tokenized by byte ranges in worker processes.
+        The files without a header are read by the reader,
+        which is registered for their format.
+        """
+        reader_class = find_format_reader(self.file_suffix)
+
+        if reader_class is not None:
+            return read_format_lines(
+                self.file_path, self.file_compression,
+                reader_class(self.file_options)
+            )
+
+        dictionary_order = self.manage_file_header()
+
+        if self.file_options['workers'] > 1 and not self.file_compression \
+                and self.file_suffix.lower() in \
+                Loader.TAB_SEPARATED_EXTENSIONS:
+            tokenizer = Tokenizer(order_column_indices(dictionary_order))
+            return tokenizer.tokenize_file_ranges(
+                self.file_path,
+                self.file_options['workers'],
+                self.file_options['range_size']
+            )
+
+        return order_file_lines(
+            self.file_path, self.file_suffix,
+            dictionary_order, self.file_compression
+        )
 
-            if not Loader.validate_context_individuals(data):
-                return False
+    def read_file_data(self) -> list:
+        """Read the file data from a given file.
 
-            if not Loader.validate_individual_parents(data):
-                return False
+        This method manages the whole reading of the file,
+        no matter if it is in tab or comma separated format.
+        """
+        return list(self.iterate_file_data())
 
-            if not Loader.find_proband_individual(data):
-                return False
+    def read_file_table(self) -> PedigreeTable:
+        """Read the file data from a given file into a table.
 
-        return True
+        This method keeps the lines of the file in the columns
+        of a pedigree table with interned identifiers, so the
+        lines are never kept as lists of strings at the same time.
+        """
+        return PedigreeTable.build_table(self.iterate_file_data())
 
-    @staticmethod
-    def validate_number_individuals(data: list) -> bool:
-        """Validate the number of the individuals in a file.
+    def build_parse_cache(self) -> Optional[ParseCache]:
+        """Build the parse cache from the options of the loading.
 
-        This method checks if the number of the individuals
-        in the file is less than 3 or not (for example 1 or 2).
+        This method returns nothing if there is not any
+        cache directory in the options of the loading.
         """
-        return not len(data) < 3
+        if self.file_options['cache_directory'] is None:
+            return None
 
-    @staticmethod
-    def validate_context_individuals(data: list) -> bool:
-        """Validate the context of the individuals in a file.
+        return ParseCache(
+            self.file_options['cache_directory'],
+            self.file_options['cache_size']
+        )
 
-        This method checks if every individual in the file has
-        its own father and mother in the same file data.
+    def load_cached_data(self) -> Optional[Union[list, PedigreeTable]]:
+        """Load the validated file data from the parse cache.
+
+        This method returns nothing if the file data is not
+        cached, the file was changed after its caching or it
+        was cached with other options of the reading.
         """
-        for data_unit in data:
-            found_father = Loader.find_parent_individual(data, data_unit, 2)
-            found_mother = Loader.find_parent_individual(data, data_unit, 3)
+        parse_cache = self.build_parse_cache()
 
-            if not found_mother or not found_father:
-                return False
+        if parse_cache is None:
+            return None
 
-        return True
+        pedigree_table = parse_cache.load_table(
+            self.file_path, select_reader_options(self.file_options)
+        )
 
-    @staticmethod
-    def validate_individual_parents(data: list) -> bool:
-        """Validate the gender of the parents of an individual.
+        if pedigree_table is None or self.file_options['columnar']:
+            return pedigree_table
 
-        This method validates the gender of the parents of
-        every single individual. For example, if the individual
-        is not a product of two mothers or two fathers.
-        """
-        for unit in data:
-            validated_father = True
-            validated_mother = True
+        return list(pedigree_table)
 
-            if unit[2] != '0':
-                for data_unit in data:
-                    if data_unit[1] == unit[2]:
-                        validated_father = data_unit[4] == '1'
-                        break
+    def store_cached_data(self) -> None:
+        """Store the validated file data in the parse cache."""
+        parse_cache = self.build_parse_cache()
 
-            if unit[3] != '0':
-                for data_unit in data:
-                    if data_unit[1] == unit[3]:
-                        validated_mother = data_unit[4] == '2'
-                        break
+        if parse_cache is not None:
+            pedigree_table = self.file_data
 
-            if not validated_father or not validated_mother:
-                return False
+            if not isinstance(pedigree_table, PedigreeTable):
+                pedigree_table = PedigreeTable.build_table(pedigree_table)
 
-        return True
+            parse_cache.store_table(
+                self.file_path, pedigree_table,
+                select_reader_options(self.file_options)
+            )
 
-    @staticmethod
-    def find_parent_individual(data: list,
-                               data_unit: list, index: int) -> bool:
-        """Find a parent of the individual in the file.
+    def stream_file_data(self) -> Iterator[list]:
+        """Stream the validated file data pedigree by pedigree.
 
-        This method looks for the parent individual of a
-        current one on the read file data of the same file.
+        This method yields the data of every single pedigree
+        in the file after its validation. The lines of a single
+        pedigree must be consecutive in the file, so the whole
+        file is never kept in the memory at the same time. The
+        lines of an interleaved file are grouped by an external
+        merge sort with a bounded number of lines in the memory.
         """
-        if data_unit[index] == '0':
-            return True
-
-        for unit in data:
-            if data_unit[index] == unit[1]:
-                return True
+        try:
+            grouped_pedigrees = set()
+            file_lines = enumerate(
+                self.iterate_file_data(), find_first_line(self.file_suffix)
+            )
+
+            if self.file_options['interleaved']:
+                file_lines = ExternalSorter(
+                    self.file_options['run_size']
+                ).sort_file_lines(file_lines)
+
+            file_groups = groupby(file_lines, lambda x: x[1][0])
+
+            for pedigree_identifier, pedigree_lines in file_groups:
+                if pedigree_identifier in grouped_pedigrees:
+                    message = 'The pedigree {} is not grouped in the file!'
+                    raise ValueError(message.format(pedigree_identifier))
+
+                line_numbers, pedigree_data = zip(*pedigree_lines)
+                grouped_pedigrees.add(pedigree_identifier)
+
+                pedigree_violations = Validator.validate_pedigree_data(
+                    pedigree_data, line_numbers
+                )
+                message = 'The data of the pedigree {} is not valid!'
+                assert not pedigree_violations, '\n'.join(
+                    [message.format(pedigree_identifier)] + pedigree_violations
+                )
+                yield list(pedigree_data)
+        except (AssertionError, ValueError, StopIteration) as file_error:
+            Loader.exit_file_error(file_error)
+
+    def validate_file_data(self) -> list:
+        """Validate the file data from a given file.
+
+        This method validates all the pedigrees in the file
+        in a single pass over its lines or in parallel by more
+        than one worker. It returns the messages of all the
+        violations with the numbers of their lines. The data
+        rows start on the second line after the header or on
+        the first line of a file without a header. A pedigree
+        table is validated by the codes in its columns.
+        """
+        first_line = find_first_line(self.file_suffix)
+        line_numbers = range(first_line, len(self.file_data) + first_line)
 
-        return False
+        if isinstance(self.file_data, PedigreeTable) and \
+                self.file_options['workers'] == 1:
+            return Validator.validate_pedigree_table(
+                self.file_data, first_line
+            )
 
-    @staticmethod
-    def find_proband_individual(data: list) -> bool:
-        """Find a single proband individual in the file.
+        if self.file_options['workers'] > 1:
+            return Validator.validate_parallel_data(
+                self.file_data, line_numbers,
+                self.file_options['workers'],
+                self.file_options['chunk_size']
+            )
 
-        This method looks for the proband individual in
-        the whole file data of the pedigree file.
-        """
-        return len([1 for data_unit in data
-                    if data_unit[6] == 'prb'
-                    ]) == 1
+        return Validator.validate_pedigree_data(self.file_data, line_numbers)
 
 
 class Builder:
@@ -334,26 +619,53 @@ class Builder:
     sibship units inside by given file data.
     """
 
-    def __init__(self, file_data: list) -> None:
+    def __init__(self, file_data: Union[list, PedigreeTable],
+                 workers: int = 1, chunk_size: int = 16) -> None:
         """Initialize an instance of the Builder class.
 
-        It accepts file data from a file.
+        It accepts file data from a file as
+        a list of lines or as a pedigree table.
+        With more than one worker the pedigrees are
+        built in a pool of worker processes, which
+        get the given number of pedigrees at once.
         """
         try:
-            assert isinstance(file_data, list)
+            assert isinstance(file_data, (list, PedigreeTable))
+            assert isinstance(workers, int) and workers > 0
+            assert isinstance(chunk_size, int) and chunk_size > 0
         except AssertionError as assertion_error:
             print(str(assertion_error))
             print("Invalid file data!")
             sys.exit(4)
 
         self.__file_data = file_data
-        self.__file_pedigrees = self.build_file_units()[0]
-        self.__file_individuals = self.build_file_units()[1]
 
-        self.build_inner_units()
+        if workers > 1:
+            self.__file_pedigrees = Builder.build_parallel_pedigrees(
+                Builder.group_file_units(file_data).values(),
+                workers, chunk_size
+            )
+            self.__pedigree_index = {
+                pedigree_family.pedigree_identifier: pedigree_family
+                for pedigree_family in self.__file_pedigrees
+            }
+            self.__file_individuals = [
+                individual
+                for pedigree_family in self.__file_pedigrees
+                for individual in pedigree_family.pedigree_individuals.values()
+            ]
+        else:
+            self.__file_pedigrees, self.__file_individuals = \
+                self.build_file_units()
+            self.__pedigree_index = {
+                pedigree_family.pedigree_identifier: pedigree_family
+                for pedigree_family in self.__file_pedigrees
+            }
+
+            self.build_inner_units()
 
     @property
-    def file_data(self) -> list:
+    def file_data(self) -> Union[list, PedigreeTable]:
         """Return the file data property of the class."""
         return self.__file_data
 
@@ -367,48 +679,289 @@ class Builder:
         """Return the file individuals property of the class."""
         return self.__file_individuals
 
+    @property
+    def pedigree_index(self) -> dict:
+        """Return the pedigree index property of the class."""
+        return self.__pedigree_index
+
+    @staticmethod
+    def add_file_unit(pedigree_index: dict,
+                      data_unit: list) -> Optional[Individual]:
+        """Add a single line of the file data to its pedigree.
+
+        This method builds the individual from the line right
+        into the pedigree with the same identifier, which is
+        created on its first line. It returns nothing if the
+        individual is already in the pedigree.
+        """
+        pedigree_family = pedigree_index.get(data_unit[0])
+
+        if pedigree_family is None:
+            pedigree_family = PedigreeFamily(data_unit[0])
+            pedigree_index[data_unit[0]] = pedigree_family
+
+        if data_unit[1] in pedigree_family.pedigree_individuals:
+            return None
+
+        individual = Individual(data_unit)
+        pedigree_family.add_individual(individual)
+        return individual
+
+    @staticmethod
+    def group_file_units(file_data: Iterable) -> dict:
+        """Group the lines of the file data by their pedigrees.
+
+        This method returns a dictionary with the lines
+        of every pedigree by its identifier in file order.
+        The lines of a pedigree table are grouped by the
+        codes in its column of the pedigree identifiers.
+        """
+        if isinstance(file_data, PedigreeTable):
+            return {
+                pedigree_identifier: [
+                    file_data[row_index] for row_index in row_indices
+                ]
+                for pedigree_identifier, row_indices
+                in file_data.group_row_indices().items()
+            }
+
+        pedigree_groups = {}
+
+        for data_unit in file_data:
+            pedigree_groups.setdefault(data_unit[0], []).append(data_unit)
+
+        return pedigree_groups
+
     def build_file_units(self) -> tuple:
         """Build file units by given data.
 
         This method build the units which comes
         directly from the file data. These units
         are the individuals and the pedigrees
-        (without their internal structure).
+        (without their internal structure). Every
+        individual is built right into its pedigree
+        by the identifiers in a single pass over the
+        file data, so the pedigrees are in file order.
         """
-        file_pedigrees = []
+        pedigree_index = {}
         file_individuals = []
 
-        for file_unit in self.file_data:
-            if PedigreeFamily(file_unit[0]) not in file_pedigrees:
-                file_pedigrees.append(PedigreeFamily(file_unit[0]))
-            if Individual(file_unit) not in file_individuals:
-                file_individuals.append(Individual(file_unit))
+        for data_unit in self.file_data:
+            individual = Builder.add_file_unit(pedigree_index, data_unit)
+
+            if individual is not None:
+                file_individuals.append(individual)
+
+        return list(pedigree_index.values()), file_individuals
+
+    def find_pedigree(self, pedigree_identifier: str) \
+            -> Optional[PedigreeFamily]:
+        """Find a single pedigree by its identifier."""
+        return self.pedigree_index.get(pedigree_identifier)
+
+    def find_individual(self, pedigree_identifier: str,
+                        individual_identifier: str) -> Optional[Individual]:
+        """Find a single individual by its identifiers.
+
+        This method returns nothing if the pedigree or
+        the individual is not in the file data.
+        """
+        pedigree_family = self.find_pedigree(pedigree_identifier)
+
+        if pedigree_family is None:
+            return None
 
-        return file_pedigrees, file_individuals
+        return pedigree_family.pedigree_individuals.get(individual_identifier)
 
     def build_inner_units(self) -> None:
         """Build inner structure units from already built file units.
 
         This method builds the whole structure of a pedigree by
-        distributing the individuals to their corresponding pedigrees
-        and calling the needed methods in every single pedigree for
-        building the hierarchy and the organization of the base units.
+        calling the needed methods in every single pedigree for
+        building the hierarchy and the organization of the base
+        units. The individuals are already in their pedigrees.
         """
-        for file_individual in self.file_individuals:
-            assert isinstance(file_individual, Individual)
+        for file_pedigree in self.file_pedigrees:
+            Builder.build_pedigree_structure(file_pedigree)
+
+    @staticmethod
+    def build_pedigree_structure(pedigree_family: PedigreeFamily) -> None:
+        """Build the inner structure of a single pedigree.
 
-            for file_pedigree in self.file_pedigrees:
-                assert isinstance(file_pedigree, PedigreeFamily)
-                string1 = file_individual.pedigree_identifier
-                string2 = file_pedigree.pedigree_identifier
+        This method calls the needed methods in the pedigree
+        for building the hierarchy of its base units.
+        """
+        assert isinstance(pedigree_family, PedigreeFamily)
+        pedigree_family.build_mating_units()
+        pedigree_family.build_sibship_units()
+        pedigree_family.build_component_ranks()
+        pedigree_family.build_extended_sibship_units()
+        pedigree_family.collect_mating_units_for_individuals()
 
-                if string1 == string2:
-                    file_pedigree.add_individual(file_individual)
+    @staticmethod
+    def build_pedigree_family(pedigree_data: list) -> PedigreeFamily:
+        """Build a single pedigree by given data of the pedigree.
 
-        for file_pedigree in self.file_pedigrees:
-            assert isinstance(file_pedigree, PedigreeFamily)
-            file_pedigree.build_mating_units()
-            file_pedigree.build_sibship_units()
-            file_pedigree.build_generation_rank()
-            file_pedigree.build_extended_sibship_units()
-            file_pedigree.collect_mating_units_for_individuals()
+        This method builds the individuals and the whole
+        structure of the pedigree from the lines of the file,
+        which belong to exactly one pedigree.
+        """
+        assert isinstance(pedigree_data, list)
+        pedigree_index = {}
+
+        for data_unit in pedigree_data:
+            Builder.add_file_unit(pedigree_index, data_unit)
+
+        pedigree_family = pedigree_index[pedigree_data[0][0]]
+        Builder.build_pedigree_structure(pedigree_family)
+        return pedigree_family
+
+    @staticmethod
+    def encode_pedigree_data(pedigree_data: list) -> tuple:
+        """Encode a single pedigree built by given data of the pedigree.
+
+        This method builds the whole pedigree and returns the indices
+        of the lines of its individuals with its encoded structure,
+        so a worker process ships back only flat lists of numbers.
+        """
+        assert isinstance(pedigree_data, list)
+        pedigree_index = {}
+        individual_rows = []
+
+        for row_index, data_unit in enumerate(pedigree_data):
+            if Builder.add_file_unit(pedigree_index, data_unit) is not None:
+                individual_rows.append(row_index)
+
+        pedigree_family = pedigree_index[pedigree_data[0][0]]
+        Builder.build_pedigree_structure(pedigree_family)
+        return individual_rows, pedigree_family.encode_pedigree_structure()
+
+    @staticmethod
+    def link_pedigree_family(pedigree_data: list, individual_rows: list,
+                             pedigree_structure: dict) -> PedigreeFamily:
+        """Link a single pedigree by its data and its encoded structure.
+
+        This method builds the individuals from the encoded lines
+        and decodes the units of the pedigree, so its structure is
+        not searched or derived again.
+        """
+        assert isinstance(pedigree_data, list)
+        pedigree_family = PedigreeFamily(pedigree_data[0][0])
+
+        for row_index in individual_rows:
+            individual = Individual(pedigree_data[row_index])
+            pedigree_family.add_individual(individual)
+
+        pedigree_family.decode_pedigree_structure(pedigree_structure)
+        return pedigree_family
+
+    @staticmethod
+    def link_parallel_pedigrees(pedigree_groups: list,
+                                pedigree_encodings: Iterable) -> list:
+        """Link the pedigrees of groups of lines by their encodings.
+
+        This method only creates the units of every pedigree from
+        its encoded structure. The garbage collector is paused while
+        the units are created, because all of them are kept and its
+        passes over the growing graph of units would be wasted.
+        """
+        collector_enabled = gc.isenabled()
+        gc.disable()
+
+        try:
+            return [
+                Builder.link_pedigree_family(pedigree_data, *pedigree_encoding)
+                for pedigree_data, pedigree_encoding
+                in zip(pedigree_groups, pedigree_encodings)
+            ]
+        finally:
+            if collector_enabled:
+                gc.enable()
+
+    @staticmethod
+    def build_parallel_pedigrees(pedigree_groups: Iterable, workers: int,
+                                 chunk_size: int) -> list:
+        """Build the pedigrees of groups of lines in parallel.
+
+        This method builds every pedigree with its inner structure
+        in a pool of worker processes. A worker ships back only the
+        flat lists of the encoded structure, so no graph of units
+        is pickled, and the pedigrees are only linked from them in
+        this process. The pedigrees are returned in the order of
+        their groups.
+        """
+        assert isinstance(workers, int) and workers > 0
+        assert isinstance(chunk_size, int) and chunk_size > 0
+        pedigree_groups = list(pedigree_groups)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return Builder.link_parallel_pedigrees(
+                pedigree_groups, executor.map(
+                    Builder.encode_pedigree_data,
+                    pedigree_groups,
+                    chunksize=chunk_size
+                )
+            )
+
+    @staticmethod
+    def build_loader_pedigrees(loader: Loader) -> list:
+        """Build the pedigrees of a file in a single pass over its lines.
+
+        This method accepts a streaming loader and consumes its
+        lines one by one. Every line is validated incrementally and
+        its individual is built right into its pedigree, so the file
+        data is never kept in the memory as a whole. The structures
+        of the pedigrees are built after the validation of the file.
+        With more than one worker the lines are grouped by their
+        pedigrees, which are built in a pool of worker processes.
+        """
+        assert isinstance(loader, Loader)
+        assert loader.file_options['streaming']
+
+        file_validator = Validator()
+        workers = loader.file_options['workers']
+        pedigree_groups = {}
+        pedigree_index = {}
+
+        try:
+            file_lines = enumerate(
+                loader.iterate_file_data(), find_first_line(loader.file_suffix)
+            )
+
+            for line_number, data_unit in file_lines:
+                file_validator.add_data_unit(data_unit, line_number)
+
+                if workers > 1:
+                    pedigree_groups.setdefault(data_unit[0], []).append(
+                        data_unit
+                    )
+                else:
+                    Builder.add_file_unit(pedigree_index, data_unit)
+
+            file_violations = file_validator.collect_violations()
+            assert not file_violations, \
+                '\n'.join(['The file data is not valid!'] + file_violations)
+        except (AssertionError, ValueError, StopIteration) as file_error:
+            Loader.exit_file_error(file_error)
+
+        if workers > 1:
+            return Builder.build_parallel_pedigrees(
+                pedigree_groups.values(), workers,
+                loader.file_options['chunk_size']
+            )
+
+        for pedigree_family in pedigree_index.values():
+            Builder.build_pedigree_structure(pedigree_family)
+
+        return list(pedigree_index.values())
+
+    @staticmethod
+    def stream_file_pedigrees(file_groups: Iterable) -> Iterator:
+        """Stream the pedigrees built by given groups of file data.
+
+        This method builds every pedigree only when it is
+        requested, so it can consume the stream of the Loader
+        without keeping all the pedigrees in the memory.
+        """
+        for pedigree_data in file_groups:
+            yield Builder.build_pedigree_family(pedigree_data)
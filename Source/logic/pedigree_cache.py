@@ -0,0 +1,187 @@
+# This Python file uses the following encoding: UTF-8
+
+"""The module has the class ParseCache.
+
+This module contains the logic of keeping the validated
+data of the pedigree files in a directory with binary cache
+files, so the unchanged files are not parsed again.
+"""
+
+from pathlib import Path
+from typing import Optional
+from hashlib import blake2b
+
+import os
+import pickle
+
+from logic.pedigree_table import PedigreeTable
+
+
+class ParseCache:
+    """ParseCache Class.
+
+    This class is used to store and load the validated
+    data of pedigree files as pedigree tables. Every entry
+    is keyed by the path, the size, the modification time
+    and the content hash of its file. The total size of
+    the entries is bounded by evicting the least recently
+    used ones.
+    """
+
+    CACHE_VERSION = 2
+    CACHE_SUFFIX = '.cache'
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, cache_directory: str, maximum_size: int) -> None:
+        """Initialize an instance of the ParseCache class.
+
+        It accepts the path to the directory with the cache
+        files and the maximum size of all the files in bytes.
+        """
+        try:
+            assert isinstance(cache_directory, str)
+            assert isinstance(maximum_size, int) and maximum_size > 0
+        except AssertionError as assertion_error:
+            message = 'The cache constructor arguments are not correct!'
+            raise AssertionError(message) from assertion_error
+
+        self.__cache_directory = Path(cache_directory)
+        self.__maximum_size = maximum_size
+        self.__cache_directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def cache_directory(self) -> Path:
+        """Return the cache directory property of the class."""
+        return self.__cache_directory
+
+    @property
+    def maximum_size(self) -> int:
+        """Return the maximum size property of the class."""
+        return self.__maximum_size
+
+    def locate_entry(self, file_path: str) -> Path:
+        """Locate the cache file of a given pedigree file."""
+        path_hash = blake2b(
+            os.path.abspath(file_path).encode('utf-8'), digest_size=16
+        )
+        return self.cache_directory / (
+            path_hash.hexdigest() + ParseCache.CACHE_SUFFIX
+        )
+
+    @staticmethod
+    def build_file_key(file_path: str, reader_options=None) -> tuple:
+        """Build the key of a given pedigree file.
+
+        This method returns the absolute path, the size, the
+        modification time and the content hash of the file with
+        the options of the reading, which change its data.
+        """
+        file_stat = os.stat(file_path)
+        content_hash = blake2b()
+
+        with open(file_path, 'rb') as file:
+            for file_chunk in iter(
+                    lambda: file.read(ParseCache.CHUNK_SIZE), b''):
+                content_hash.update(file_chunk)
+
+        return (
+            ParseCache.CACHE_VERSION,
+            os.path.abspath(file_path),
+            file_stat.st_size,
+            file_stat.st_mtime_ns,
+            content_hash.hexdigest(),
+            tuple(sorted(
+                (option_name, repr(option_value))
+                for option_name, option_value
+                in (reader_options or {}).items()
+            )),
+        )
+
+    def load_table(self, file_path: str,
+                   reader_options=None) -> Optional[PedigreeTable]:
+        """Load the cached table of a given pedigree file.
+
+        This method reads the cache file at once and returns
+        its table only if the key of the pedigree file did not
+        change and it was read with the same options. The stale
+        or broken cache files are removed.
+        """
+        cache_entry = self.locate_entry(file_path)
+
+        try:
+            file_key, pedigree_table = pickle.loads(cache_entry.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, TypeError,
+                AttributeError, pickle.UnpicklingError):
+            self.invalidate(file_path)
+            return None
+
+        if file_key != ParseCache.build_file_key(file_path,
+                                                 reader_options) or \
+                not isinstance(pedigree_table, PedigreeTable):
+            self.invalidate(file_path)
+            return None
+
+        os.utime(cache_entry)
+        return pedigree_table
+
+    def store_table(self, file_path: str, pedigree_table: PedigreeTable,
+                    reader_options=None) -> None:
+        """Store the table of a given pedigree file.
+
+        This method writes the cache file through a temporary
+        file, so a cache file is never read half written, and
+        evicts the old entries if the cache became too large.
+        """
+        assert isinstance(pedigree_table, PedigreeTable)
+
+        cache_entry = self.locate_entry(file_path)
+        temporary_entry = cache_entry.with_suffix('.tmp')
+        cache_bytes = pickle.dumps(
+            (ParseCache.build_file_key(file_path, reader_options),
+             pedigree_table),
+            protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+        temporary_entry.write_bytes(cache_bytes)
+        os.replace(temporary_entry, cache_entry)
+        self.evict_entries()
+
+    def invalidate(self, file_path: str) -> None:
+        """Remove the cache file of a given pedigree file."""
+        try:
+            self.locate_entry(file_path).unlink()
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        """Remove all the cache files in the cache directory."""
+        for cache_entry in self.collect_entries():
+            cache_entry.unlink()
+
+    def collect_entries(self) -> list:
+        """Collect the cache files from the least recently used."""
+        cache_entries = self.cache_directory.glob(
+            '*' + ParseCache.CACHE_SUFFIX
+        )
+        return sorted(
+            cache_entries, key=lambda entry: entry.stat().st_mtime_ns
+        )
+
+    def evict_entries(self) -> None:
+        """Evict the least recently used cache files.
+
+        This method removes the cache files from the least
+        recently used until their total size fits the maximum.
+        The most recently used cache file is always kept.
+        """
+        cache_entries = self.collect_entries()
+        cache_size = sum(entry.stat().st_size for entry in cache_entries)
+
+        for cache_entry in cache_entries[:-1]:
+            if cache_size <= self.maximum_size:
+                break
+
+            cache_size -= cache_entry.stat().st_size
+            cache_entry.unlink()
@@ -0,0 +1,167 @@
+# This Python file uses the following encoding: UTF-8
+
+"""The module has the functions for the layouts of the components.
+
+This module contains the logic of solving the Interval Graph
+Sandwich Problem and building the layout for every connected
+component of a pedigree on its own, so the search space of every
+component is much smaller than the one of the whole pedigree.
+"""
+
+from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+
+from logic.pedigree_builder import Builder
+from logic.pedigree_family import PedigreeFamily
+from logic.pedigree_graph import Graph
+from logic.pedigree_graph import SandwichInstance
+from logic.pedigree_graph import ProblemSolver
+from logic.pedigree_layouter import Layout
+from logic.pedigree_problem import VertexInterval
+
+
+def solve_component_intervals(
+        component_family: PedigreeFamily) -> Optional[list]:
+    """Solve the intervals of a single connected component.
+
+    This function builds the graph and the sandwich instance of
+    the component and returns its solved intervals or None, if
+    there is not an interval realization for it.
+    """
+    assert isinstance(component_family, PedigreeFamily)
+    graph = Graph(component_family)
+
+    solver = ProblemSolver(SandwichInstance(
+        graph.vertices_pedigree_union,
+        graph.mandatory_graph,
+        graph.forbidden_graph
+    ))
+
+    return solver.solved_intervals
+
+
+def build_component_layout(
+        component_family: PedigreeFamily) -> Optional[Layout]:
+    """Build the layout of a single connected component.
+
+    This function returns the layout of the solved intervals
+    of the component or None, if there is not an interval
+    realization for it.
+    """
+    solved_intervals = solve_component_intervals(component_family)
+
+    if solved_intervals is None:
+        return None
+
+    return Layout(solved_intervals)
+
+
+def select_component_units(component_family: PedigreeFamily) -> tuple:
+    """Select the dictionaries of the units of a single component."""
+    return (
+        component_family.pedigree_individuals,
+        component_family.pedigree_mating_units,
+        component_family.pedigree_sibship_units,
+    )
+
+
+def encode_component_data(component_family: PedigreeFamily) -> tuple:
+    """Encode a single connected component as flat data.
+
+    This function returns the lines of the individuals of the
+    component with its encoded structure, so the component is
+    shipped to a worker process without its graph of units.
+    """
+    assert isinstance(component_family, PedigreeFamily)
+    number_individuals = len(component_family.pedigree_individuals)
+
+    return [
+        individual.encode_individual_data()
+        for individual in component_family.pedigree_individuals.values()
+    ], list(range(number_individuals)), \
+        component_family.encode_pedigree_structure()
+
+
+def solve_component_data(component_data: tuple) -> Optional[list]:
+    """Solve the intervals of a single encoded connected component.
+
+    This function decodes the component from its lines and its
+    structure and returns its solved intervals as flat lists of the
+    kind of the unit, the key of the unit and the two elements,
+    or None, if there is not an interval realization for it.
+    """
+    component_family = Builder.link_pedigree_family(*component_data)
+    solved_intervals = solve_component_intervals(component_family)
+
+    if solved_intervals is None:
+        return None
+
+    unit_keys = {}
+
+    for unit_kind, pedigree_units in enumerate(
+            select_component_units(component_family)):
+        for unit_key, pedigree_unit in pedigree_units.items():
+            unit_keys[id(pedigree_unit)] = (unit_kind, unit_key)
+
+    return [
+        [*unit_keys[id(interval.vertex)],
+         interval.left_element, interval.right_element]
+        for interval in solved_intervals
+    ]
+
+
+def decode_component_layout(component_family: PedigreeFamily,
+                            encoded_intervals: Optional[list]) \
+        -> Optional[Layout]:
+    """Decode the solved intervals of a single connected component.
+
+    This function attaches the encoded intervals to the units
+    of the component and returns their layout or None, if there
+    is not an interval realization for the component.
+    """
+    if encoded_intervals is None:
+        return None
+
+    component_units = select_component_units(component_family)
+
+    return Layout([
+        VertexInterval(
+            component_units[unit_kind][unit_key], left_element, right_element
+        )
+        for unit_kind, unit_key, left_element, right_element
+        in encoded_intervals
+    ])
+
+
+def build_component_layouts(pedigree_family: PedigreeFamily,
+                            workers: int = 1) -> list:
+    """Build the layouts of all the components of a pedigree.
+
+    This function splits the pedigree into its connected components
+    and builds their layouts in the order of the components. With
+    more than one worker and more than one component the intervals
+    are solved in a pool of worker processes, which get and return
+    only flat data, and the layouts are built in this process.
+    """
+    assert isinstance(pedigree_family, PedigreeFamily)
+    assert isinstance(workers, int) and workers > 0
+
+    component_families = pedigree_family.split_pedigree_components()
+
+    if workers == 1 or len(component_families) == 1:
+        return [
+            build_component_layout(component_family)
+            for component_family in component_families
+        ]
+
+    with ProcessPoolExecutor(
+            max_workers=min(workers, len(component_families))) as executor:
+        return [
+            decode_component_layout(component_family, encoded_intervals)
+            for component_family, encoded_intervals in zip(
+                component_families, executor.map(
+                    solve_component_data,
+                    map(encode_component_data, component_families)
+                )
+            )
+        ]
@@ -3,11 +3,14 @@
 """This module has the classes PDFBuilder and LayoutDrawer.
 
 This module contains the logic of drawing the pedigree
-according to a given layout from the same pedigree.
+according to a given layout from the same pedigree or
+according to the layouts of the components of the pedigree.
 """
 
 from copy import deepcopy
 
+import math
+
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 import matplotlib.colors as col
@@ -135,12 +138,14 @@ class LayoutDrawer:
         """Return the colors property of the class."""
         return self.__colors
 
-    def draw(self, pedigree_name: str) -> mpl.figure.Figure:
+    def draw(self, pedigree_name: str, layout_drawers=()) -> mpl.figure.Figure:
         """Create the figure and draw the pedigree name in the file.
 
         This method creates the figure and initializes the axes
         of the plot in order to call the methods for plotting
-        the lines and plotting the individuals in the file.
+        the lines and plotting the individuals in the file. The
+        drawings of the other given layout drawers are plotted
+        in the same axes with their own offsets.
         """
         figure = plt.figure(figsize=self.figsize)
         pedigree_axes_rectangle = (0.1, 0.3, 0.8, 0.6)
@@ -152,12 +157,30 @@ class LayoutDrawer:
 
         figure.text(0.5, 0.9, pedigree_name, horizontalalignment="center")
 
-        self.draw_individuals(axes_pedigree)
-        self.draw_lines(axes_pedigree)
+        for layout_drawer in (self,) + tuple(layout_drawers):
+            assert isinstance(layout_drawer, LayoutDrawer)
+            layout_drawer.draw_individuals(axes_pedigree)
+            layout_drawer.draw_lines(axes_pedigree)
 
         axes_pedigree.plot()
         return figure
 
+    def measure_width(self) -> int:
+        """Measure the width of the drawing with its offset.
+
+        This method returns the rightmost coordinate of the shapes
+        in the drawing with a gap of two shapes after them, which is
+        the offset of a drawing placed right after this one.
+        """
+        right_coordinates = []
+
+        for level in self.layout.positions:
+            for individual in level:
+                assert isinstance(individual, Shape)
+                right_coordinates.append(individual.x_coordinate + 3 * individual.size)
+
+        return self.x_offset + int(math.ceil(max(right_coordinates)))
+
     def draw_individuals(self, axes: plt.Axes) -> None:
         """Draw individuals in the PDF file with their specifics.
 
@@ -281,3 +304,22 @@ class LayoutDrawer:
             line.y2_coordinate = max_y_coordinate - line.y2_coordinate
             line.y1_coordinate += self.layout.positions[0][0].size
             line.y2_coordinate += self.layout.positions[0][0].size
+
+
+def draw_component_layouts(layouts: list, colors: dict, pedigree_name: str) -> mpl.figure.Figure:
+    """Draw the layouts of the components of a pedigree side by side.
+
+    This function places the drawing of every layout right after
+    the drawing of the previous one and plots all of them in a
+    single figure with the name of the pedigree.
+    """
+    assert isinstance(layouts, list) and layouts
+    layout_drawers = []
+    x_offset = 0
+
+    for layout in layouts:
+        layout_drawer = LayoutDrawer(layout, x_offset, 0, colors)
+        layout_drawers.append(layout_drawer)
+        x_offset = layout_drawer.measure_width()
+
+    return layout_drawers[0].draw(pedigree_name, layout_drawers[1:])
@@ -0,0 +1,211 @@
+# This Python file uses the following encoding: UTF-8
+
+"""The module has the class ExtraColumns.
+
+This module contains the logic of reading the columns
+of a pedigree file, which are not pedigree columns, only
+when they are needed. The lines are kept as raw byte
+offsets and the columns are decoded on demand.
+"""
+
+from typing import Iterator
+from array import array
+
+import csv
+
+from logic.pedigree_builder import Loader
+from logic.pedigree_builder import open_file
+from logic.pedigree_tokenizer import Tokenizer
+
+
+class ExtraColumns:
+    """ExtraColumns Class.
+
+    This class is used to access the extra columns of a
+    pedigree file loaded with the extra columns allowed. The
+    loading never reads them, while this class decodes a single
+    value by the byte offset of its line or a whole column in
+    a single pass over the file, which is the only access to
+    the values of a compressed file. The decoded columns are kept
+    in a side table, so every column is decoded only once.
+    The lines are given by their indices in the file data.
+    """
+
+    def __init__(self, loader: Loader) -> None:
+        """Initialize an instance of the ExtraColumns class.
+
+        It accepts a loader of a tab or comma separated file
+        with the extra columns allowed. Only the header of the
+        file is read at initialization.
+        """
+        try:
+            assert isinstance(loader, Loader)
+            assert loader.file_options['extra_columns']
+            assert loader.file_suffix.lower() in \
+                Loader.TAB_SEPARATED_EXTENSIONS + \
+                Loader.COMMA_SEPARATED_EXTENSIONS
+        except AssertionError as assertion_error:
+            message = 'The extra constructor arguments are not correct!'
+            raise AssertionError(message) from assertion_error
+
+        self.__loader = loader
+        self.__comma_separated = loader.file_suffix.lower() in \
+            Loader.COMMA_SEPARATED_EXTENSIONS
+        self.__column_indices = self.manage_extra_header()
+        self.__line_offsets = None
+        self.__decoded_columns = {}
+
+    @property
+    def loader(self) -> Loader:
+        """Return the loader property of the class."""
+        return self.__loader
+
+    @property
+    def column_names(self) -> list:
+        """Return the column names property of the class."""
+        return list(self.__column_indices)
+
+    @property
+    def decoded_columns(self) -> dict:
+        """Return the decoded columns property of the class."""
+        return self.__decoded_columns
+
+    def split_file_line(self, file_line: bytes) -> list:
+        """Split a single line of the file into all its values."""
+        if self.__comma_separated:
+            return next(csv.reader([file_line.decode('utf-8')]))
+
+        return [file_value.decode('utf-8') for file_value in file_line.split()]
+
+    def manage_extra_header(self) -> dict:
+        """Manage the header of the file for the extra columns.
+
+        This method returns a dictionary with the indices of
+        the extra columns in the file by their names.
+        """
+        with open_file(self.loader.file_path,
+                       self.loader.file_compression, True) as file:
+            header_line = file.readline()
+
+        if self.__comma_separated:
+            column_names = [
+                column_name
+                for column_name in self.split_file_line(header_line)
+                if column_name != ''
+            ]
+        else:
+            column_names = Tokenizer.tokenize_header(
+                header_line.decode('utf-8')
+            )
+
+        return {
+            column_name: column_index
+            for column_index, column_name in enumerate(column_names)
+            if column_name not in Loader.PEDIGREE_COLUMNS
+        }
+
+    def find_column_index(self, column_name: str) -> int:
+        """Find the index of an extra column in the file."""
+        if column_name not in self.__column_indices:
+            message = 'The column {} is not an extra column!'
+            raise ValueError(message.format(column_name))
+
+        return self.__column_indices[column_name]
+
+    def index_line_offsets(self) -> array:
+        """Index the byte offsets of the lines of the file.
+
+        This method reads the file once on the first access
+        to a single value and keeps the offsets of its lines
+        after the header.
+        """
+        if self.__line_offsets is None:
+            line_offsets = array('Q')
+
+            with open_file(self.loader.file_path,
+                           self.loader.file_compression, True) as file:
+                file_offset = len(file.readline())
+
+            for file_line in self.iterate_file_lines():
+                line_offsets.append(file_offset)
+                file_offset += len(file_line)
+
+            self.__line_offsets = line_offsets
+
+        return self.__line_offsets
+
+    def iterate_file_lines(self) -> Iterator[bytes]:
+        """Iterate the lines of the file after its header.
+
+        This method yields the raw lines one by one. The last
+        line of a tab separated file is skipped, as it must be
+        an empty one.
+        """
+        with open_file(self.loader.file_path,
+                       self.loader.file_compression, True) as file:
+            file.readline()
+            previous_line = None
+
+            for file_line in file:
+                if previous_line is not None:
+                    yield previous_line
+
+                previous_line = file_line
+
+            if self.__comma_separated and previous_line is not None:
+                yield previous_line
+
+    def get_value(self, line_index: int, column_name: str) -> str:
+        """Get a single value of an extra column.
+
+        This method reads only the line of the value by its
+        byte offset, unless its column is already decoded. The
+        compressed files cannot be read by their offsets without
+        decompressing them from the start, so the whole column
+        is decoded in the side table on the first access instead.
+        """
+        column_index = self.find_column_index(column_name)
+
+        if column_name in self.__decoded_columns or \
+                self.loader.file_compression:
+            return self.get_column(column_name)[line_index]
+
+        line_offset = self.index_line_offsets()[line_index]
+
+        with open_file(self.loader.file_path,
+                       self.loader.file_compression, True) as file:
+            file.seek(line_offset)
+            file_values = self.split_file_line(file.readline())
+
+        try:
+            return file_values[column_index]
+        except IndexError as index_error:
+            message = 'The line {} has a missing value!'
+            raise ValueError(message.format(line_index + 2)) from index_error
+
+    def get_column(self, column_name: str) -> list:
+        """Get all the values of an extra column.
+
+        This method decodes the column in a single pass over
+        the file on its first access and keeps it afterwards.
+        """
+        column_index = self.find_column_index(column_name)
+
+        if column_name not in self.__decoded_columns:
+            column_values = []
+            file_lines = enumerate(self.iterate_file_lines(), 2)
+
+            for line_number, file_line in file_lines:
+                try:
+                    column_values.append(
+                        self.split_file_line(file_line)[column_index]
+                    )
+                except IndexError as index_error:
+                    message = 'The line {} has a missing value!'
+                    raise ValueError(
+                        message.format(line_number)
+                    ) from index_error
+
+            self.__decoded_columns[column_name] = column_values
+
+        return self.__decoded_columns[column_name]
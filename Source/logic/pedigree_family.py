@@ -1,16 +1,23 @@
 # This Python file uses the following encoding: UTF-8
 
-"""The module has the class Pedigree Family.
+"""The module has the classes Adjacency Index, Generation Index, Lineage Index, Change Set and Pedigree Family.
 
 This module contains the class for the pedigree family
-that manages the whole pedigree structure.
+that manages the whole pedigree structure, the classes
+for the adjacency, the generations and the lineages of the units
+in the structure and the class for the changes of the units after a single edit.
 """
 
 from typing import Union
+from typing import Optional
+from typing import Iterator
 from typing import TypeVar
 from typing import Generic
+from collections import defaultdict
+from collections import deque
 
 from logic.pedigree_fields import Role
+from logic.pedigree_kinship import KinshipMatrix
 from logic.pedigree_units import Individual
 from logic.pedigree_units import MatingUnit
 from logic.pedigree_units import SibshipUnit
@@ -18,6 +25,389 @@ from logic.pedigree_units import SibshipUnit
 PedigreeFamilyBase = TypeVar('PedigreeFamilyBase')
 
 
+class AdjacencyIndex:
+    """AdjacencyIndex Class.
+
+    This class is used to keep the adjacency of the
+    units in the structure of a single pedigree. The mating
+    units are indexed by the identifiers of their mates and
+    the sibship units by the keys of their mating units, so
+    every unit is linked to its neighbours in constant time.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an instance of the AdjacencyIndex class.
+
+        The instance does not accept any arguments,
+        the units are added to it one by one.
+        """
+        self.__individual_matings = defaultdict(list)
+        self.__mating_sibships = {}
+        self.__sibship_children = defaultdict(list)
+        self.__sibship_spouses = defaultdict(list)
+
+    @property
+    def individual_matings(self) -> defaultdict:
+        """Return the individual matings property of the class."""
+        return self.__individual_matings
+
+    @property
+    def mating_sibships(self) -> dict:
+        """Return the mating sibships property of the class."""
+        return self.__mating_sibships
+
+    @property
+    def sibship_children(self) -> defaultdict:
+        """Return the sibship children property of the class."""
+        return self.__sibship_children
+
+    @property
+    def sibship_spouses(self) -> defaultdict:
+        """Return the sibship spouses property of the class."""
+        return self.__sibship_spouses
+
+    def add_mating_unit(self, mating_key: str, mating_unit: MatingUnit) -> None:
+        """Add a mating unit to the matings of its mates and its sibship."""
+        assert isinstance(mating_unit, MatingUnit)
+        self.__individual_matings[mating_unit.male_mate_individual.individual_identifier].append(mating_unit)
+        self.__individual_matings[mating_unit.female_mate_individual.individual_identifier].append(mating_unit)
+        self.__mating_sibships[mating_key] = mating_unit.sibship_unit_relation
+
+    def remove_mating_unit(self, mating_key: str, mating_unit: MatingUnit) -> None:
+        """Remove a mating unit from the matings of its mates and its sibship."""
+        assert isinstance(mating_unit, MatingUnit)
+        self.__individual_matings[mating_unit.male_mate_individual.individual_identifier].remove(mating_unit)
+        self.__individual_matings[mating_unit.female_mate_individual.individual_identifier].remove(mating_unit)
+        sibship_unit = self.__mating_sibships.pop(mating_key)
+        self.__sibship_children.pop(str(sibship_unit), None)
+        self.__sibship_spouses.pop(str(sibship_unit), None)
+
+    def get_individual_matings(self, individual: Individual) -> list:
+        """Get the mating units where the individual is a mate."""
+        assert isinstance(individual, Individual)
+        return self.__individual_matings.get(individual.individual_identifier, [])
+
+
+class GenerationIndex:
+    """GenerationIndex Class.
+
+    This class is used to keep the units in the structure
+    of a single pedigree in buckets by their generation ranks.
+    Every bucket maps the keys of its units to the units, so a
+    unit is moved between the buckets in constant time and a
+    whole generation is taken in time of its size.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an instance of the GenerationIndex class.
+
+        The instance does not accept any arguments,
+        the units are added to it one by one.
+        """
+        self.__individual_generations = defaultdict(dict)
+        self.__mating_generations = defaultdict(dict)
+        self.__sibship_generations = defaultdict(dict)
+
+    @property
+    def individual_generations(self) -> defaultdict:
+        """Return the individual generations property of the class."""
+        return self.__individual_generations
+
+    @property
+    def mating_generations(self) -> defaultdict:
+        """Return the mating generations property of the class."""
+        return self.__mating_generations
+
+    @property
+    def sibship_generations(self) -> defaultdict:
+        """Return the sibship generations property of the class."""
+        return self.__sibship_generations
+
+    def find_unit_generations(self, pedigree_unit: Union[Individual, MatingUnit, SibshipUnit]) -> defaultdict:
+        """Find the buckets of the generations for the type of the unit."""
+        if isinstance(pedigree_unit, Individual):
+            return self.__individual_generations
+
+        if isinstance(pedigree_unit, MatingUnit):
+            return self.__mating_generations
+
+        assert isinstance(pedigree_unit, SibshipUnit)
+        return self.__sibship_generations
+
+    def add_unit(self, pedigree_unit: Union[Individual, MatingUnit, SibshipUnit]) -> None:
+        """Add a unit to the bucket of its generation rank.
+
+        This method skips the units without a generation rank.
+        """
+        if pedigree_unit.generation_rank is not None:
+            unit_generations = self.find_unit_generations(pedigree_unit)
+            unit_generations[pedigree_unit.generation_rank][str(pedigree_unit)] = pedigree_unit
+
+    def remove_unit(self, pedigree_unit: Union[Individual, MatingUnit, SibshipUnit]) -> None:
+        """Remove a unit from the bucket of its generation rank.
+
+        This method removes the bucket when it becomes empty.
+        """
+        unit_generations = self.find_unit_generations(pedigree_unit)
+        generation_bucket = unit_generations.get(pedigree_unit.generation_rank)
+
+        if generation_bucket is not None:
+            generation_bucket.pop(str(pedigree_unit), None)
+
+            if not generation_bucket:
+                del unit_generations[pedigree_unit.generation_rank]
+
+
+class LineageIndex:
+    """LineageIndex Class.
+
+    This class is used to keep the transitive ancestors and
+    descendants of the individuals in a single pedigree as integer
+    bitsets. Every individual has a bit in the generation order, where
+    the parents come before their children, so the ancestors of all
+    the individuals are built in a single pass forwards and the
+    descendants in a single pass backwards. The lineage queries are
+    answered by a few bitwise operations on the bitsets.
+    """
+
+    def __init__(self, pedigree_individuals: list) -> None:
+        """Initialize an instance of the LineageIndex class.
+
+        It accepts the individuals of a pedigree in any order.
+        """
+        try:
+            assert isinstance(pedigree_individuals, list)
+            assert all(isinstance(individual, Individual) for individual in pedigree_individuals)
+        except AssertionError as assertion_error:
+            message = 'The lineage index constructor arguments are not correct!'
+            raise AssertionError(message) from assertion_error
+
+        self.__individual_bits = {}
+        self.__bit_individuals = []
+        self.__ancestor_bits = []
+        self.__descendant_bits = []
+        self.__founder_bits = 0
+
+        for kinship_block in KinshipMatrix.order_kinship_blocks(pedigree_individuals):
+            for individual in kinship_block:
+                self.add_individual_bits(individual)
+
+        for individual_bit in reversed(range(len(self.__bit_individuals))):
+            lineage_bits = self.__descendant_bits[individual_bit] | 1 << individual_bit
+
+            for parent_bit in self.find_parent_bits(self.__bit_individuals[individual_bit]):
+                self.__descendant_bits[parent_bit] |= lineage_bits
+
+    @property
+    def individual_bits(self) -> dict:
+        """Return the individual bits property of the class."""
+        return self.__individual_bits
+
+    @property
+    def bit_individuals(self) -> list:
+        """Return the bit individuals property of the class."""
+        return self.__bit_individuals
+
+    @property
+    def ancestor_bits(self) -> list:
+        """Return the ancestor bits property of the class."""
+        return self.__ancestor_bits
+
+    @property
+    def descendant_bits(self) -> list:
+        """Return the descendant bits property of the class."""
+        return self.__descendant_bits
+
+    @property
+    def founder_bits(self) -> int:
+        """Return the founder bits property of the class."""
+        return self.__founder_bits
+
+    def find_parent_bits(self, individual: Individual) -> list:
+        """Find the bits of the known parents of the individual."""
+        return [
+            self.__individual_bits[parent_identifier]
+            for parent_identifier in (individual.individual_father, individual.individual_mother)
+            if parent_identifier in self.__individual_bits
+        ]
+
+    def find_individual_bit(self, individual_identifier: str) -> int:
+        """Find the bit of an individual in the lineage index."""
+        if individual_identifier not in self.__individual_bits:
+            raise ValueError('The individual {} is not in the lineage index!'.format(individual_identifier))
+
+        return self.__individual_bits[individual_identifier]
+
+    def add_individual_bits(self, individual: Individual) -> int:
+        """Add the next bit of an individual with its ancestors.
+
+        This method expects the parents of the individual to be
+        already in the index and returns the bit of the individual.
+        """
+        individual_bit = len(self.__bit_individuals)
+        ancestor_bits = 0
+        parent_bits = self.find_parent_bits(individual)
+
+        for parent_bit in parent_bits:
+            ancestor_bits |= self.__ancestor_bits[parent_bit] | 1 << parent_bit
+
+        if not parent_bits:
+            self.__founder_bits |= 1 << individual_bit
+
+        self.__individual_bits[individual.individual_identifier] = individual_bit
+        self.__bit_individuals.append(individual)
+        self.__ancestor_bits.append(ancestor_bits)
+        self.__descendant_bits.append(0)
+        return individual_bit
+
+    def add_individual(self, individual: Individual) -> None:
+        """Add a new individual to the lineage index.
+
+        This method gives the individual the next bit and adds
+        it to the descendants of all its ancestors, which are
+        visited by the set bits of its ancestors.
+        """
+        assert isinstance(individual, Individual)
+        individual_bit = self.add_individual_bits(individual)
+
+        for ancestor_bit in LineageIndex.iterate_bits(self.__ancestor_bits[individual_bit]):
+            self.__descendant_bits[ancestor_bit] |= 1 << individual_bit
+
+    def remove_individual(self, individual_identifier: str) -> None:
+        """Remove an individual without descendants from the lineage index.
+
+        This method clears the bit of the individual in the descendants
+        of all its ancestors and leaves the bit of the individual unused.
+        """
+        individual_bit = self.find_individual_bit(individual_identifier)
+
+        if self.__descendant_bits[individual_bit]:
+            raise ValueError('The individual {} has descendants in the lineage index!'.format(individual_identifier))
+
+        for ancestor_bit in LineageIndex.iterate_bits(self.__ancestor_bits[individual_bit]):
+            self.__descendant_bits[ancestor_bit] &= ~(1 << individual_bit)
+
+        del self.__individual_bits[individual_identifier]
+        self.__bit_individuals[individual_bit] = None
+        self.__ancestor_bits[individual_bit] = 0
+        self.__founder_bits &= ~(1 << individual_bit)
+
+    @staticmethod
+    def iterate_bits(lineage_bits: int) -> Iterator[int]:
+        """Iterate the positions of the set bits from the lowest one.
+
+        The bits are read from the binary digits of the bitset, which
+        are built once, so the iteration takes linear time in its size.
+        """
+        binary_digits = bin(lineage_bits)[:1:-1]
+        individual_bit = binary_digits.find('1')
+
+        while individual_bit != -1:
+            yield individual_bit
+            individual_bit = binary_digits.find('1', individual_bit + 1)
+
+    def collect_individuals(self, lineage_bits: int) -> list:
+        """Collect the individuals of a bitset in the generation order."""
+        return [self.__bit_individuals[individual_bit] for individual_bit in LineageIndex.iterate_bits(lineage_bits)]
+
+    def is_ancestor(self, ancestor_identifier: str, individual_identifier: str) -> bool:
+        """Return if an individual is an ancestor of another individual."""
+        ancestor_bit = self.find_individual_bit(ancestor_identifier)
+        individual_bit = self.find_individual_bit(individual_identifier)
+        return bool(self.__ancestor_bits[individual_bit] >> ancestor_bit & 1)
+
+    def get_ancestors(self, individual_identifier: str) -> list:
+        """Get all the ancestors of an individual."""
+        return self.collect_individuals(self.__ancestor_bits[self.find_individual_bit(individual_identifier)])
+
+    def get_descendants(self, individual_identifier: str) -> list:
+        """Get all the descendants of an individual."""
+        return self.collect_individuals(self.__descendant_bits[self.find_individual_bit(individual_identifier)])
+
+    def get_common_ancestors(self, first_identifier: str, second_identifier: str) -> list:
+        """Get the common ancestors of two individuals."""
+        return self.collect_individuals(
+            self.__ancestor_bits[self.find_individual_bit(first_identifier)] &
+            self.__ancestor_bits[self.find_individual_bit(second_identifier)]
+        )
+
+    def get_lineage_founders(self, individual_identifier: str) -> list:
+        """Get the founders, from which an individual is descended."""
+        return self.collect_individuals(
+            self.__ancestor_bits[self.find_individual_bit(individual_identifier)] & self.__founder_bits
+        )
+
+    def is_founder_lineage(self, founder_identifier: str, individual_identifier: str) -> bool:
+        """Return if an individual is in the lineage of a founder.
+
+        The lineage of a founder is the founder itself
+        with all its descendants in the pedigree.
+        """
+        founder_bit = self.find_individual_bit(founder_identifier)
+        individual_bit = self.find_individual_bit(individual_identifier)
+        lineage_bits = self.__descendant_bits[founder_bit] | 1 << founder_bit
+        return bool(self.__founder_bits >> founder_bit & 1 and lineage_bits >> individual_bit & 1)
+
+
+class ChangeSet:
+    """ChangeSet Class.
+
+    This class is used to collect the units, which have been
+    added, removed or changed by a single edit of a pedigree.
+    A unit is changed when its relations or its generation rank
+    have changed, so the later stages can update only these units.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an instance of the ChangeSet class.
+
+        The instance does not accept any arguments,
+        the units are recorded to it one by one.
+        """
+        self.__added_units = []
+        self.__removed_units = []
+        self.__changed_units = []
+
+    @property
+    def added_units(self) -> list:
+        """Return the added units property of the class."""
+        return self.__added_units
+
+    @property
+    def removed_units(self) -> list:
+        """Return the removed units property of the class."""
+        return self.__removed_units
+
+    @property
+    def changed_units(self) -> list:
+        """Return the changed units property of the class."""
+        return self.__changed_units
+
+    def __bool__(self) -> bool:
+        """Return if any unit has been recorded to the change set."""
+        return bool(self.added_units or self.removed_units or self.changed_units)
+
+    def record_added(self, pedigree_unit: Union[Individual, MatingUnit, SibshipUnit]) -> None:
+        """Record a unit as added to the pedigree."""
+        self.__added_units.append(pedigree_unit)
+
+    def record_removed(self, pedigree_unit: Union[Individual, MatingUnit, SibshipUnit]) -> None:
+        """Record a unit as removed from the pedigree."""
+        self.__removed_units.append(pedigree_unit)
+
+    def record_changed(self, pedigree_unit: Union[Individual, MatingUnit, SibshipUnit]) -> None:
+        """Record a unit as changed in the pedigree.
+
+        This method skips the units, which have already
+        been recorded by the same change set.
+        """
+        for recorded_units in (self.added_units, self.removed_units, self.changed_units):
+            if any(recorded_unit is pedigree_unit for recorded_unit in recorded_units):
+                return
+
+        self.__changed_units.append(pedigree_unit)
+
+
 class PedigreeFamily(Generic[PedigreeFamilyBase]):
     """PedigreeFamily Class.
 
@@ -41,6 +431,9 @@ class PedigreeFamily(Generic[PedigreeFamilyBase]):
         self.__pedigree_individuals = {}
         self.__pedigree_mating_units = {}
         self.__pedigree_sibship_units = {}
+        self.__adjacency_index = AdjacencyIndex()
+        self.__generation_index = GenerationIndex()
+        self.__lineage_index = None
 
         self.__min_generation_rank = 0
         self.__max_generation_rank = 0
@@ -65,6 +458,21 @@ class PedigreeFamily(Generic[PedigreeFamilyBase]):
         """Return the pedigree sibship units property of the class."""
         return self.__pedigree_sibship_units
 
+    @property
+    def adjacency_index(self) -> AdjacencyIndex:
+        """Return the adjacency index property of the class."""
+        return self.__adjacency_index
+
+    @property
+    def generation_index(self) -> GenerationIndex:
+        """Return the generation index property of the class."""
+        return self.__generation_index
+
+    @property
+    def lineage_index(self) -> Optional[LineageIndex]:
+        """Return the lineage index property of the class."""
+        return self.__lineage_index
+
     @property
     def min_generation_rank(self) -> int:
         """Return the min generation rank property of the class."""
@@ -103,56 +511,53 @@ class PedigreeFamily(Generic[PedigreeFamilyBase]):
         of the sibship units, corresponding to the respective mating
         units. At the end, the mating units are added to the individuals'
         mating units collections, where the individual has taken part
-        in the respective mating unit in the meaning of a mate.
+        in the respective mating unit in the meaning of a mate. Every
+        mating unit is built once and indexed by its mates, so the
+        whole linking takes linear time.
         """
-        for individual in self.pedigree_individuals.items():
-            assert isinstance(individual[1], Individual)
+        for individual in self.pedigree_individuals.values():
+            assert isinstance(individual, Individual)
 
-            condition1 = individual[1].individual_father != '0'
-            condition2 = individual[1].individual_mother != '0'
+            if individual.individual_father == '0' or individual.individual_mother == '0':
+                continue
 
-            if condition1 and condition2:
-                father = self.pedigree_individuals[individual[1].individual_father]
-                mother = self.pedigree_individuals[individual[1].individual_mother]
+            father = self.pedigree_individuals[individual.individual_father]
+            mother = self.pedigree_individuals[individual.individual_mother]
 
-                mating_unit = MatingUnit(self.pedigree_identifier, father, mother)
+            mating_unit = MatingUnit(self.pedigree_identifier, father, mother)
+            mating_key = str(mating_unit)
+
+            if mating_key not in self.pedigree_mating_units:
                 sibship_unit = SibshipUnit(self.pedigree_identifier, mating_unit)
                 mating_unit = MatingUnit(self.pedigree_identifier, father, mother, sibship_unit)
 
-                self.pedigree_mating_units[str(mating_unit)] = mating_unit
+                self.pedigree_mating_units[mating_key] = mating_unit
                 self.pedigree_sibship_units[str(sibship_unit)] = sibship_unit
+                self.adjacency_index.add_mating_unit(mating_key, mating_unit)
 
-                individual[1].mating_unit_relation = self.pedigree_mating_units[str(mating_unit)]
-                individual[1].sibship_unit_relation = self.pedigree_sibship_units[
-                    str(mating_unit.sibship_unit_relation)]
+            mating_unit = self.pedigree_mating_units[mating_key]
+            sibship_unit = self.adjacency_index.mating_sibships[mating_key]
 
-        for individual in self.pedigree_individuals.items():
-            assert isinstance(individual[1], Individual)
-
-            for mating_unit in self.pedigree_mating_units.items():
-                assert isinstance(mating_unit[1], MatingUnit)
+            individual.mating_unit_relation = mating_unit
+            individual.sibship_unit_relation = sibship_unit
+            self.adjacency_index.sibship_children[str(sibship_unit)].append(individual)
 
-                if individual[1] == mating_unit[1].male_mate_individual or \
-                        individual[1] == mating_unit[1].female_mate_individual:
-                    individual[1].mating_instances.append(mating_unit[1])
+        for individual in self.pedigree_individuals.values():
+            individual.mating_instances.extend(self.adjacency_index.get_individual_matings(individual))
 
     def build_sibship_units(self) -> None:
         """Build all the sibship units in the pedigree structure.
 
         The method uses the already created sibship units without data
         and simply adds the needed individuals to the corresponding
-        sibships.
+        sibships, which are taken from the adjacency index.
         """
-        for sibship_unit in self.pedigree_sibship_units.items():
-            assert isinstance(sibship_unit[1], SibshipUnit)
+        for sibship_key, sibship_unit in self.pedigree_sibship_units.items():
+            assert isinstance(sibship_unit, SibshipUnit)
 
-            for individual in self.pedigree_individuals.items():
-                assert isinstance(individual[1], Individual)
-
-                if individual[1].sibship_unit_relation is not None:
-                    if individual[1].sibship_unit_relation == sibship_unit[1]:
-                        sibship_unit[1].add_sibling_individual(individual[1])
-                        individual[1].sibship_unit_relation = sibship_unit[1]
+            for individual in self.adjacency_index.sibship_children[sibship_key]:
+                sibship_unit.add_sibling_individual(individual)
+                individual.sibship_unit_relation = sibship_unit
 
     def get_proband(self) -> Union[Individual, None]:
         """Get the proband individual.
@@ -184,7 +589,18 @@ class PedigreeFamily(Generic[PedigreeFamilyBase]):
 
         return True
 
-    def build_generation_rank(self) -> None:
+    def collect_unreachable_individuals(self) -> list:
+        """Collect the individuals without a generation rank.
+
+        This method returns the individuals, which have not been
+        reached by the ranking from the proband of the pedigree.
+        """
+        return [
+            individual for individual in self.pedigree_individuals.values()
+            if individual.generation_rank is None
+        ]
+
+    def build_generation_rank(self, root_individual: Optional[Individual] = None) -> None:
         """Build the generation rank for all the base units.
 
         The method attaches a generation rank to all the
@@ -194,78 +610,76 @@ class PedigreeFamily(Generic[PedigreeFamilyBase]):
             2. Parents - second given
             3. Children - third given
             4. Mates - last given
-        At the end, the method attaches a generation
-        rank to the mating units and the sibship units.
+        The individuals are ranked by a breadth-first search from
+        the proband or from a given root individual over the adjacency
+        index, so every individual and unit is visited once. The
+        individuals, which cannot be reached from the start of the
+        search, are reported as an error. At the end, the method
+        attaches a generation rank to the mating units and the sibship units.
         """
-        touched_individuals = [self.get_proband()]
+        if root_individual is None:
+            proband = self.get_proband()
+        else:
+            proband = root_individual
+            proband.generation_rank = 0
 
-        if touched_individuals[0] is None:
+        if proband is None:
             raise ValueError('There is not any proband in the pedigree!')
 
-        while self.validate_propagated_rank() is False:
-            next_touched_individuals = []
-
-            for individual in touched_individuals:
-                assert isinstance(individual, Individual)
-
-                for sibship_unit in self.pedigree_sibship_units.items():
-                    assert isinstance(sibship_unit[1], SibshipUnit)
-
-                    if individual.sibship_unit_relation == sibship_unit[1]:
-                        for i, _ in enumerate(sibship_unit[1].siblings_individuals):
-                            sibling = sibship_unit[1].siblings_individuals[i]
-                            assert isinstance(sibling, Individual)
+        touched_individuals = deque([proband])
 
-                            if individual != sibling and sibling.generation_rank is None:
-                                sibling.generation_rank = individual.generation_rank
-                                sibship_unit[1].change_sibling_individual(sibling, i)
-                                next_touched_individuals.append(sibling)
-                        break
+        while touched_individuals:
+            individual = touched_individuals.popleft()
+            assert isinstance(individual, Individual)
 
-                for mating_unit in self.pedigree_mating_units.items():
-                    assert isinstance(mating_unit[1], MatingUnit)
+            if individual.sibship_unit_relation is not None:
+                for sibling in individual.sibship_unit_relation.siblings_individuals:
+                    if sibling.generation_rank is None:
+                        sibling.generation_rank = individual.generation_rank
+                        touched_individuals.append(sibling)
 
-                    if individual.mating_unit_relation == mating_unit[1]:
-                        if mating_unit[1].male_mate_individual.generation_rank is None:
-                            mating_unit[1].male_mate_individual.generation_rank = individual.generation_rank - 1
-                            next_touched_individuals.append(mating_unit[1].male_mate_individual)
+            if individual.mating_unit_relation is not None:
+                for parent in (individual.mating_unit_relation.male_mate_individual,
+                               individual.mating_unit_relation.female_mate_individual):
+                    if parent.generation_rank is None:
+                        parent.generation_rank = individual.generation_rank - 1
+                        touched_individuals.append(parent)
 
-                        if mating_unit[1].female_mate_individual.generation_rank is None:
-                            mating_unit[1].female_mate_individual.generation_rank = individual.generation_rank - 1
-                            next_touched_individuals.append(mating_unit[1].female_mate_individual)
+            individual_matings = self.adjacency_index.get_individual_matings(individual)
 
-                for mating_unit in self.pedigree_mating_units.items():
-                    assert isinstance(mating_unit[1], MatingUnit)
+            for mating_unit in individual_matings:
+                for child in mating_unit.sibship_unit_relation.siblings_individuals:
+                    if child.generation_rank is None:
+                        child.generation_rank = individual.generation_rank + 1
+                        touched_individuals.append(child)
 
-                    if individual in (mating_unit[1].male_mate_individual,
-                       mating_unit[1].female_mate_individual):
-                        assert isinstance(mating_unit[1].sibship_unit_relation, SibshipUnit)
+            for mating_unit in individual_matings:
+                if individual == mating_unit.male_mate_individual:
+                    spouse = mating_unit.female_mate_individual
+                else:
+                    spouse = mating_unit.male_mate_individual
 
-                        for i, _ in enumerate(mating_unit[1].sibship_unit_relation.siblings_individuals):
-                            sibling = mating_unit[1].sibship_unit_relation.siblings_individuals[i]
-                            assert isinstance(sibling, Individual)
+                if spouse.generation_rank is None:
+                    spouse.generation_rank = individual.generation_rank
+                    touched_individuals.append(spouse)
 
-                            if sibling.generation_rank is None:
-                                sibling.generation_rank = individual.generation_rank + 1
-                                mating_unit[1].sibship_unit_relation.change_sibling_individual(sibling, i)
-                                next_touched_individuals.append(sibling)
+        unreachable_individuals = self.collect_unreachable_individuals()
 
-                for mating_unit in self.pedigree_mating_units.items():
-                    assert isinstance(mating_unit[1], MatingUnit)
-
-                    if individual == mating_unit[1].male_mate_individual and \
-                            mating_unit[1].female_mate_individual.generation_rank is None:
-                        mating_unit[1].female_mate_individual.generation_rank = individual.generation_rank
-                        next_touched_individuals.append(mating_unit[1].female_mate_individual)
-                    elif individual == mating_unit[1].female_mate_individual and \
-                            mating_unit[1].male_mate_individual.generation_rank is None:
-                        mating_unit[1].male_mate_individual.generation_rank = individual.generation_rank
-                        next_touched_individuals.append(mating_unit[1].male_mate_individual)
-
-            touched_individuals = next_touched_individuals
+        if unreachable_individuals:
+            message = 'The individuals {} are not reachable from the proband!'
+            raise ValueError(message.format(', '.join(map(str, unreachable_individuals))))
 
         self.transform_generation_rank()
+        self.build_unit_ranks()
+        self.build_generation_index()
 
+    def build_unit_ranks(self) -> None:
+        """Build the generation rank for the mating and sibship units.
+
+        This method takes the ranks of the units from the already
+        ranked individuals. A mating unit is ranked only when both
+        of its mates are in the same generation.
+        """
         for mating_unit in self.pedigree_mating_units.items():
             assert isinstance(mating_unit[1], MatingUnit)
 
@@ -275,9 +689,326 @@ class PedigreeFamily(Generic[PedigreeFamilyBase]):
 
         for sibship_unit in self.pedigree_sibship_units.items():
             assert isinstance(sibship_unit[1], SibshipUnit)
-            sibling = sibship_unit[1].siblings_individuals[0]
-            assert isinstance(sibling, Individual)
-            sibship_unit[1].generation_rank = sibling.generation_rank
+
+            if sibship_unit[1].siblings_individuals:
+                sibling = sibship_unit[1].siblings_individuals[0]
+                assert isinstance(sibling, Individual)
+                sibship_unit[1].generation_rank = sibling.generation_rank
+
+    def encode_generation_ranks(self) -> list:
+        """Encode the generation ranks of the individuals.
+
+        This method returns the ranks in the order of the
+        individuals in the pedigree as a flat list of numbers.
+        """
+        return [
+            individual.generation_rank
+            for individual in self.pedigree_individuals.values()
+        ]
+
+    def encode_pedigree_structure(self) -> dict:
+        """Encode the whole structure of the pedigree as flat lists.
+
+        This method returns the generation ranks of the individuals
+        and of the units with the mates of the mating units and the
+        members of their sibship units as the indices of the individuals
+        in their order. The members of every sibship unit are in the
+        slice between its offset and the next one. The ranks start
+        from one, so a unit without a rank is encoded with zero. Flat
+        lists of numbers are much cheaper to pickle than the graph
+        of the units or many small arrays.
+        """
+        individual_indices = {
+            individual_identifier: individual_index
+            for individual_index, individual_identifier
+            in enumerate(self.pedigree_individuals)
+        }
+        pedigree_structure = {
+            'generation_ranks': self.encode_generation_ranks(),
+            'mating_mates': [],
+            'mating_ranks': [],
+            'sibship_ranks': [],
+            'sibship_offsets': [0],
+            'sibship_children': [],
+            'spouse_offsets': [0],
+            'sibship_spouses': [],
+        }
+
+        for mating_unit in self.pedigree_mating_units.values():
+            sibship_unit = mating_unit.sibship_unit_relation
+
+            pedigree_structure['mating_mates'].extend([
+                individual_indices[mating_unit.male_mate_individual.individual_identifier],
+                individual_indices[mating_unit.female_mate_individual.individual_identifier],
+            ])
+            pedigree_structure['mating_ranks'].append(mating_unit.generation_rank or 0)
+            pedigree_structure['sibship_ranks'].append(sibship_unit.generation_rank or 0)
+
+            for members_key, offsets_key, members in (
+                    ('sibship_children', 'sibship_offsets', sibship_unit.siblings_individuals),
+                    ('sibship_spouses', 'spouse_offsets', sibship_unit.siblings_extended)):
+                pedigree_structure[members_key].extend(
+                    individual_indices[member.individual_identifier] for member in members
+                )
+                pedigree_structure[offsets_key].append(len(pedigree_structure[members_key]))
+
+        return pedigree_structure
+
+    def decode_mating_unit(self, male_mate: Individual, female_mate: Individual,
+                           unit_ranks: tuple) -> MatingUnit:
+        """Decode a single mating unit with its empty sibship unit.
+
+        This method creates the units like the linking of the
+        pedigree, attaches their encoded ranks and adds them to the
+        indexes and the matings of the mates without searching them.
+        """
+        sibship_unit = SibshipUnit(
+            self.pedigree_identifier,
+            MatingUnit(self.pedigree_identifier, male_mate, female_mate)
+        )
+        mating_unit = MatingUnit(self.pedigree_identifier, male_mate, female_mate, sibship_unit)
+        mating_string = mating_unit.mating_string()
+        mating_key, sibship_key = 'MU' + mating_string, 'SU' + mating_string
+        mating_rank, sibship_rank = unit_ranks
+
+        self.pedigree_mating_units[mating_key] = mating_unit
+        self.pedigree_sibship_units[sibship_key] = sibship_unit
+        self.adjacency_index.add_mating_unit(mating_key, mating_unit)
+        male_mate.mating_instances.append(mating_unit)
+        female_mate.mating_instances.append(mating_unit)
+
+        if mating_rank:
+            mating_unit.generation_rank = mating_rank
+            self.generation_index.mating_generations[mating_rank][mating_key] = mating_unit
+
+        if sibship_rank:
+            sibship_unit.generation_rank = sibship_rank
+            self.generation_index.sibship_generations[sibship_rank][sibship_key] = sibship_unit
+
+        return mating_unit
+
+    def decode_sibship_members(self, mating_unit: MatingUnit,
+                               sibship_children: list, sibship_spouses: list) -> None:
+        """Decode the children and the spouses of a single sibship unit."""
+        sibship_unit = mating_unit.sibship_unit_relation
+        sibship_key = 'SU' + mating_unit.mating_string()
+
+        for child in sibship_children:
+            child.mating_unit_relation = mating_unit
+            child.sibship_unit_relation = sibship_unit
+            sibship_unit.add_sibling_individual(child)
+
+        for spouse in sibship_spouses:
+            sibship_unit.add_sibling_individual_mate(spouse)
+
+        if sibship_children:
+            self.adjacency_index.sibship_children[sibship_key].extend(sibship_children)
+
+        if sibship_spouses:
+            self.adjacency_index.sibship_spouses[sibship_key].extend(sibship_spouses)
+
+    def decode_pedigree_structure(self, pedigree_structure: dict) -> None:
+        """Decode the whole structure of the pedigree from flat lists.
+
+        This method accepts the lists of an encoded structure for the
+        individuals, which are already in the pedigree in the same
+        order. The units are only created and linked by the indices
+        and put right in the buckets of their encoded ranks, so the
+        structure is not searched or derived again.
+        """
+        pedigree_individuals = list(self.pedigree_individuals.items())
+        individual_generations = self.generation_index.individual_generations
+        mating_mates = pedigree_structure['mating_mates']
+        sibship_offsets = pedigree_structure['sibship_offsets']
+        spouse_offsets = pedigree_structure['spouse_offsets']
+
+        for (individual_key, individual), generation_rank in zip(
+                pedigree_individuals, pedigree_structure['generation_ranks']):
+            individual.generation_rank = generation_rank
+            individual_generations[generation_rank][individual_key] = individual
+
+        pedigree_individuals = [individual for _, individual in pedigree_individuals]
+
+        for mating_index, unit_ranks in enumerate(zip(pedigree_structure['mating_ranks'],
+                                                      pedigree_structure['sibship_ranks'])):
+            mating_unit = self.decode_mating_unit(
+                pedigree_individuals[mating_mates[2 * mating_index]],
+                pedigree_individuals[mating_mates[2 * mating_index + 1]],
+                unit_ranks
+            )
+            self.decode_sibship_members(mating_unit, [
+                pedigree_individuals[child_index]
+                for child_index in pedigree_structure['sibship_children'][
+                    sibship_offsets[mating_index]:sibship_offsets[mating_index + 1]
+                ]
+            ], [
+                pedigree_individuals[spouse_index]
+                for spouse_index in pedigree_structure['sibship_spouses'][
+                    spouse_offsets[mating_index]:spouse_offsets[mating_index + 1]
+                ]
+            ])
+
+        self.update_generation_bounds()
+
+    def build_generation_index(self) -> None:
+        """Build the generation index of all the base units.
+
+        This method puts every ranked individual, mating unit
+        and sibship unit in the bucket of its generation rank.
+        """
+        self.__generation_index = GenerationIndex()
+
+        for pedigree_units in (self.pedigree_individuals,
+                               self.pedigree_mating_units,
+                               self.pedigree_sibship_units):
+            for pedigree_unit in pedigree_units.values():
+                self.generation_index.add_unit(pedigree_unit)
+
+    def change_generation_rank(self, pedigree_unit: Union[Individual, MatingUnit, SibshipUnit],
+                               generation_rank: int) -> None:
+        """Change the generation rank of a single unit.
+
+        This method moves the unit to the bucket of its new
+        generation rank and updates the min and max generation
+        rank of the pedigree by the ranks of the individuals.
+        """
+        assert isinstance(generation_rank, int)
+        self.generation_index.remove_unit(pedigree_unit)
+        pedigree_unit.generation_rank = generation_rank
+        self.generation_index.add_unit(pedigree_unit)
+        self.update_generation_bounds()
+
+    def update_generation_bounds(self) -> None:
+        """Update the min and max generation rank of the pedigree.
+
+        This method takes the bounds from the buckets of the
+        individuals in the generation index.
+        """
+        if self.generation_index.individual_generations:
+            self.__min_generation_rank = min(self.generation_index.individual_generations)
+            self.__max_generation_rank = max(self.generation_index.individual_generations)
+
+    def find_pedigree_components(self) -> list:
+        """Find the connected components of the pedigree.
+
+        This method returns the lists of the individuals, which are
+        connected by relations of parents, children and mates, with
+        the individuals of every list in their order in the pedigree.
+        Every individual and unit is visited once.
+        """
+        component_indices = {}
+        number_components = 0
+
+        for individual in self.pedigree_individuals.values():
+            if individual.individual_identifier in component_indices:
+                continue
+
+            component_indices[individual.individual_identifier] = number_components
+            touched_individuals = deque([individual])
+
+            while touched_individuals:
+                current_individual = touched_individuals.popleft()
+                related_individuals = []
+
+                if current_individual.mating_unit_relation is not None:
+                    related_individuals.append(current_individual.mating_unit_relation.male_mate_individual)
+                    related_individuals.append(current_individual.mating_unit_relation.female_mate_individual)
+
+                for mating_unit in self.adjacency_index.get_individual_matings(current_individual):
+                    related_individuals.append(mating_unit.male_mate_individual)
+                    related_individuals.append(mating_unit.female_mate_individual)
+                    related_individuals.extend(mating_unit.sibship_unit_relation.siblings_individuals)
+
+                for related_individual in related_individuals:
+                    if related_individual.individual_identifier not in component_indices:
+                        component_indices[related_individual.individual_identifier] = number_components
+                        touched_individuals.append(related_individual)
+
+            number_components += 1
+
+        pedigree_components = [[] for _ in range(number_components)]
+
+        for individual in self.pedigree_individuals.values():
+            pedigree_components[component_indices[individual.individual_identifier]].append(individual)
+
+        return pedigree_components
+
+    def split_pedigree_components(self) -> list:
+        """Split the pedigree into its connected components.
+
+        This method returns a pedigree family for every connected
+        component of the pedigree, which shares the units with the
+        pedigree and has its own indexes. A connected pedigree is
+        returned as the only component of itself.
+        """
+        pedigree_components = self.find_pedigree_components()
+
+        if len(pedigree_components) == 1:
+            return [self]
+
+        component_families = []
+        component_indices = {}
+
+        for component_index, component_individuals in enumerate(pedigree_components):
+            component_family = PedigreeFamily(self.pedigree_identifier)
+            component_families.append(component_family)
+
+            for individual in component_individuals:
+                component_family.add_individual(individual)
+                component_indices[individual.individual_identifier] = component_index
+
+        for mating_key, mating_unit in self.pedigree_mating_units.items():
+            component_family = component_families[
+                component_indices[mating_unit.male_mate_individual.individual_identifier]
+            ]
+            sibship_unit = mating_unit.sibship_unit_relation
+            sibship_key = str(sibship_unit)
+
+            component_family.pedigree_mating_units[mating_key] = mating_unit
+            component_family.pedigree_sibship_units[sibship_key] = sibship_unit
+            component_family.adjacency_index.add_mating_unit(mating_key, mating_unit)
+            component_family.adjacency_index.sibship_children[sibship_key].extend(
+                self.adjacency_index.sibship_children.get(sibship_key, [])
+            )
+            component_family.adjacency_index.sibship_spouses[sibship_key].extend(
+                self.adjacency_index.sibship_spouses.get(sibship_key, [])
+            )
+
+        for component_family in component_families:
+            component_family.build_generation_index()
+            component_family.update_generation_bounds()
+
+        return component_families
+
+    def build_component_ranks(self) -> list:
+        """Build the generation rank for every connected component.
+
+        This method ranks every component of the pedigree on its own,
+        starting from the proband in its component and from the first
+        individual in every other component, so the disconnected parts
+        of the pedigree are ranked instead of being unreachable. Returns
+        the components of the pedigree with their built ranks.
+        """
+        if self.get_proband() is None:
+            raise ValueError('There is not any proband in the pedigree!')
+
+        pedigree_components = self.split_pedigree_components()
+
+        if len(pedigree_components) == 1:
+            self.build_generation_rank()
+            return pedigree_components
+
+        for component_family in pedigree_components:
+            root_individual = component_family.get_proband()
+
+            if root_individual is None:
+                root_individual = next(iter(component_family.pedigree_individuals.values()))
+
+            component_family.build_generation_rank(root_individual)
+
+        self.build_generation_index()
+        self.update_generation_bounds()
+        return pedigree_components
 
     def transform_generation_rank(self) -> None:
         """Transform the generation rank.
@@ -307,43 +1038,47 @@ class PedigreeFamily(Generic[PedigreeFamilyBase]):
         The method uses the already created sibship units with the
         siblings data and fills them with the additional data for
         the orphan spouses of the corresponding siblings in the sibship.
+        Only the mating units of every sibling are visited.
         """
-        for sibship_unit in self.pedigree_sibship_units.items():
-            assert isinstance(sibship_unit[1], SibshipUnit)
-            for sibling in sibship_unit[1].siblings_individuals:
-                for mating_unit in self.pedigree_mating_units.items():
-                    assert isinstance(mating_unit[1], MatingUnit)
+        for sibship_key, sibship_unit in self.pedigree_sibship_units.items():
+            assert isinstance(sibship_unit, SibshipUnit)
 
-                    if sibling == mating_unit[1].male_mate_individual:
-                        condition1 = mating_unit[1].female_mate_individual.individual_father == '0'
-                        condition2 = mating_unit[1].female_mate_individual.individual_mother == '0'
+            for sibling in sibship_unit.siblings_individuals:
+                for mating_unit in self.adjacency_index.get_individual_matings(sibling):
+                    if sibling == mating_unit.male_mate_individual:
+                        spouse = mating_unit.female_mate_individual
+                    else:
+                        spouse = mating_unit.male_mate_individual
 
-                        if condition1 and condition2:
-                            sibship_unit[1].add_sibling_individual_mate(mating_unit[1].female_mate_individual)
-
-                    if sibling == mating_unit[1].female_mate_individual:
-                        condition1 = mating_unit[1].male_mate_individual.individual_father == '0'
-                        condition2 = mating_unit[1].male_mate_individual.individual_mother == '0'
-
-                        if condition1 and condition2:
-                            sibship_unit[1].add_sibling_individual_mate(mating_unit[1].male_mate_individual)
+                    if spouse.individual_father == '0' and spouse.individual_mother == '0':
+                        sibship_unit.add_sibling_individual_mate(spouse)
+                        self.adjacency_index.sibship_spouses[sibship_key].append(spouse)
 
     def get_individuals_by_generation(self, generation_rank: int) -> list:
         """Get all individuals by a given generation.
 
         This method gets a whole generation by a given
         generation rank. Returns the list with the
-        corresponding individuals from the generation.
+        corresponding individuals from the generation,
+        which is taken from the generation index.
         """
-        generation_individuals = []
+        return list(self.generation_index.individual_generations.get(generation_rank, {}).values())
 
-        for individual in self.pedigree_individuals.items():
-            assert isinstance(individual[1], Individual)
+    def get_mating_units_by_generation(self, generation_rank: int) -> list:
+        """Get all mating units by a given generation.
 
-            if individual[1].generation_rank == generation_rank:
-                generation_individuals.append(individual[1])
+        This method returns the mating units, which mates
+        are both in the generation of the given rank.
+        """
+        return list(self.generation_index.mating_generations.get(generation_rank, {}).values())
+
+    def get_sibship_units_by_generation(self, generation_rank: int) -> list:
+        """Get all sibship units by a given generation.
 
-        return generation_individuals
+        This method returns the sibship units, which
+        siblings are in the generation of the given rank.
+        """
+        return list(self.generation_index.sibship_generations.get(generation_rank, {}).values())
 
     def collect_mating_units_for_individuals(self) -> None:
         """Collect the mating units for the individuals.
@@ -352,17 +1087,241 @@ class PedigreeFamily(Generic[PedigreeFamilyBase]):
         correctly associated to the individual, which take part in
         the mating.
         """
-        for individual in self.pedigree_individuals.items():
-            for mating_unit in self.pedigree_mating_units.items():
-                assert isinstance(individual[1], Individual)
-                assert isinstance(mating_unit[1], MatingUnit)
+        for individual in self.pedigree_individuals.values():
+            assert isinstance(individual, Individual)
+
+            for mating_unit in self.adjacency_index.get_individual_matings(individual):
+                if mating_unit not in individual.mating_instances:
+                    individual.mating_instances.append(mating_unit)
+
+    def find_mating_unit(self, male_identifier: str, female_identifier: str) -> Union[MatingUnit, None]:
+        """Find the mating unit of two mates by their identifiers.
+
+        This method returns None, if the mates do not have
+        a mating unit in the pedigree.
+        """
+        for mating_unit in self.adjacency_index.individual_matings.get(male_identifier, []):
+            if mating_unit.female_mate_individual.individual_identifier == female_identifier:
+                return mating_unit
+
+        return None
+
+    def link_mating_unit(self, male_identifier: str, female_identifier: str,
+                         change_set: ChangeSet) -> MatingUnit:
+        """Link the mating unit of two mates into the pedigree structure.
+
+        This method returns the existing mating unit of the mates or
+        builds a new one with an empty sibship unit. The new mating unit
+        is added to the matings of the mates, a founder mate is added
+        to the extended sibship of the other mate and an unranked mate
+        takes the generation rank of the other mate.
+        """
+        male_mate = self.pedigree_individuals.get(male_identifier)
+        female_mate = self.pedigree_individuals.get(female_identifier)
+
+        if male_mate is None or female_mate is None:
+            message = 'The mates {} and {} are not in the pedigree!'
+            raise ValueError(message.format(male_identifier, female_identifier))
+
+        mating_unit = self.find_mating_unit(male_identifier, female_identifier)
+
+        if mating_unit is not None:
+            return mating_unit
+
+        mating_unit = MatingUnit(self.pedigree_identifier, male_mate, female_mate)
+        sibship_unit = SibshipUnit(self.pedigree_identifier, mating_unit)
+        mating_unit = MatingUnit(self.pedigree_identifier, male_mate, female_mate, sibship_unit)
+        mating_key = str(mating_unit)
+
+        self.pedigree_mating_units[mating_key] = mating_unit
+        self.pedigree_sibship_units[str(sibship_unit)] = sibship_unit
+        self.adjacency_index.add_mating_unit(mating_key, mating_unit)
+        change_set.record_added(mating_unit)
+        change_set.record_added(sibship_unit)
+
+        for mate, spouse in ((male_mate, female_mate), (female_mate, male_mate)):
+            mate.mating_instances.append(mating_unit)
+            change_set.record_changed(mate)
+
+            if mate.generation_rank is None and spouse.generation_rank is not None:
+                self.change_generation_rank(mate, spouse.generation_rank)
+
+            if mate.sibship_unit_relation is not None and \
+                    spouse.individual_father == '0' and spouse.individual_mother == '0':
+                mate.sibship_unit_relation.add_sibling_individual_mate(spouse)
+                self.adjacency_index.sibship_spouses[str(mate.sibship_unit_relation)].append(spouse)
+                change_set.record_changed(mate.sibship_unit_relation)
+
+        if male_mate.generation_rank is not None and \
+                male_mate.generation_rank == female_mate.generation_rank:
+            self.change_generation_rank(mating_unit, male_mate.generation_rank)
+
+        mate_ranks = [
+            mate.generation_rank for mate in (male_mate, female_mate)
+            if mate.generation_rank is not None
+        ]
+
+        if mate_ranks:
+            self.change_generation_rank(sibship_unit, max(mate_ranks) + 1)
+
+        return mating_unit
+
+    def add_mating(self, male_identifier: str, female_identifier: str) -> ChangeSet:
+        """Add a mating unit of two individuals of the pedigree.
+
+        This method updates only the mates, their mating unit and the
+        extended sibships of the mates. Returns the change set of the edit.
+        """
+        change_set = ChangeSet()
+        self.link_mating_unit(male_identifier, female_identifier, change_set)
+        return change_set
+
+    def remove_mating(self, male_identifier: str, female_identifier: str) -> ChangeSet:
+        """Remove a mating unit of two individuals of the pedigree.
+
+        This method removes the mating unit and its sibship unit, which
+        must not have any children left, from the pedigree structure and
+        from the extended sibships of the mates. Returns the change set.
+        """
+        mating_unit = self.find_mating_unit(male_identifier, female_identifier)
+
+        if mating_unit is None:
+            message = 'The mates {} and {} do not have a mating unit in the pedigree!'
+            raise ValueError(message.format(male_identifier, female_identifier))
+
+        sibship_unit = mating_unit.sibship_unit_relation
+
+        if sibship_unit.siblings_individuals:
+            raise ValueError('The mating unit {} has children in the pedigree!'.format(mating_unit))
+
+        change_set = ChangeSet()
+        mating_key = str(mating_unit)
+
+        del self.pedigree_mating_units[mating_key]
+        del self.pedigree_sibship_units[str(sibship_unit)]
+        self.adjacency_index.remove_mating_unit(mating_key, mating_unit)
+        self.generation_index.remove_unit(mating_unit)
+        self.generation_index.remove_unit(sibship_unit)
+        change_set.record_removed(mating_unit)
+        change_set.record_removed(sibship_unit)
+
+        for mate, spouse in ((mating_unit.male_mate_individual, mating_unit.female_mate_individual),
+                             (mating_unit.female_mate_individual, mating_unit.male_mate_individual)):
+            mate.mating_instances.remove(mating_unit)
+            change_set.record_changed(mate)
 
-                condition1 = mating_unit[1].male_mate_individual == individual
-                condition2 = mating_unit[1].female_mate_individual == individual
+            if mate.sibship_unit_relation is not None and \
+                    spouse.individual_father == '0' and spouse.individual_mother == '0':
+                mate.sibship_unit_relation.remove_sibling_individual_mate(spouse)
+                self.adjacency_index.sibship_spouses[str(mate.sibship_unit_relation)].remove(spouse)
+                change_set.record_changed(mate.sibship_unit_relation)
 
-                if condition1 or condition2:
-                    if mating_unit not in individual[1].mating_instances:
-                        individual[1].mating_instances.append(mating_unit)
+        return change_set
+
+    def add_relative(self, individual: Individual) -> ChangeSet:
+        """Add a single individual to the built pedigree.
+
+        This method links the individual into the sibship of its
+        parents, whose mating unit is built if it does not exist,
+        and ranks it one generation below its parents. A founder
+        stays unranked until it is added as a mate. Returns the
+        change set of the edit.
+        """
+        assert isinstance(individual, Individual)
+        identifiers = [individual.individual_father, individual.individual_mother]
+
+        if individual.pedigree_identifier != self.pedigree_identifier or \
+                individual.individual_identifier in self.pedigree_individuals or \
+                any(identifier != '0' and identifier not in self.pedigree_individuals
+                    for identifier in identifiers):
+            message = 'The individual {} cannot be added to the pedigree!'
+            raise ValueError(message.format(individual.individual_identifier))
+
+        change_set = ChangeSet()
+        self.add_individual(individual)
+        change_set.record_added(individual)
+
+        if self.lineage_index is not None:
+            self.lineage_index.add_individual(individual)
+
+        if '0' in identifiers:
+            return change_set
+
+        mating_unit = self.link_mating_unit(identifiers[0], identifiers[1], change_set)
+        sibship_unit = mating_unit.sibship_unit_relation
+
+        individual.mating_unit_relation = mating_unit
+        individual.sibship_unit_relation = sibship_unit
+        sibship_unit.add_sibling_individual(individual)
+        self.adjacency_index.sibship_children[str(sibship_unit)].append(individual)
+        change_set.record_changed(sibship_unit)
+
+        parent_ranks = [
+            parent.generation_rank for parent in (mating_unit.male_mate_individual, mating_unit.female_mate_individual)
+            if parent.generation_rank is not None
+        ]
+
+        if parent_ranks:
+            self.change_generation_rank(individual, max(parent_ranks) + 1)
+
+            if sibship_unit.generation_rank is None:
+                self.change_generation_rank(sibship_unit, individual.generation_rank)
+
+        return change_set
+
+    def remove_relative(self, individual_identifier: str) -> ChangeSet:
+        """Remove a single individual from the built pedigree.
+
+        This method removes the individual, which must not be a mate
+        in any mating unit, from the sibship of its parents. The lineage
+        index is checked first, so a failed removal changes nothing.
+        Returns the change set of the edit.
+        """
+        individual = self.pedigree_individuals.get(individual_identifier)
+
+        if individual is None:
+            raise ValueError('The individual {} is not in the pedigree!'.format(individual_identifier))
+
+        if self.adjacency_index.get_individual_matings(individual):
+            raise ValueError('The individual {} has matings in the pedigree!'.format(individual_identifier))
+
+        if self.lineage_index is not None:
+            self.lineage_index.remove_individual(individual_identifier)
+
+        change_set = ChangeSet()
+        del self.pedigree_individuals[individual_identifier]
+        self.generation_index.remove_unit(individual)
+        change_set.record_removed(individual)
+
+        sibship_unit = individual.sibship_unit_relation
+
+        if sibship_unit is not None:
+            sibship_unit.remove_sibling_individual(individual)
+            self.adjacency_index.sibship_children[str(sibship_unit)].remove(individual)
+            change_set.record_changed(sibship_unit)
+
+        self.update_generation_bounds()
+        return change_set
+
+    def build_lineage_index(self) -> LineageIndex:
+        """Build the lineage index of the individuals.
+
+        This method precomputes the ancestors and the descendants of
+        all the individuals, keeps the index up to date with the added
+        and removed relatives and returns it for the lineage queries.
+        """
+        self.__lineage_index = LineageIndex(list(self.pedigree_individuals.values()))
+        return self.__lineage_index
+
+    def build_kinship_matrix(self, sparse_mode: bool = False) -> KinshipMatrix:
+        """Build the kinship coefficients of the individuals.
+
+        This method orders the individuals by their generation ranks
+        and their links to the fathers and the mothers. The whole matrix
+        is built at once, while in the sparse mode only the queried
+        coefficients are computed and memoized.
+        """
+        return KinshipMatrix(list(self.pedigree_individuals.values()), sparse_mode)
 
     def print_pedigree_family_data(self) -> None:
         """Print the data for the pedigree.
@@ -0,0 +1,196 @@
+# This Python file uses the following encoding: UTF-8
+
+"""The module has the class Follower.
+
+This module contains the logic of following a growing
+pedigree file and building only the pedigrees whose
+lines were appended to the file since the last reading.
+"""
+
+from typing import Iterator
+from typing import Optional
+from collections import defaultdict
+
+import os
+import time
+
+from logic.pedigree_builder import Loader
+from logic.pedigree_builder import Builder
+from logic.pedigree_builder import order_column_indices
+from logic.pedigree_builder import tokenize_file_line
+from logic.pedigree_formats import find_format_reader
+from logic.pedigree_tokenizer import Tokenizer
+from logic.pedigree_validator import Validator
+
+
+class Follower:
+    """Follower Class.
+
+    This class is used to follow a pedigree file which is
+    appended to. It remembers the byte offset after the last
+    complete line it read, so every poll parses only the new
+    lines and validates only the pedigrees with new lines. The
+    pedigrees which are not valid yet are kept until they are.
+    """
+
+    def __init__(self, loader: Loader) -> None:
+        """Initialize an instance of the Follower class.
+
+        It accepts a loader of an uncompressed file with a
+        header in streaming mode, which manages the header of
+        the file. The files of the registered formats without a
+        header are not accepted, as their probands depend
+        on whole families.
+        """
+        try:
+            assert isinstance(loader, Loader)
+            assert loader.file_options['streaming']
+            assert not loader.file_compression
+            assert find_format_reader(loader.file_suffix) is None
+        except AssertionError as assertion_error:
+            message = 'The follower constructor arguments are not correct!'
+            raise AssertionError(message) from assertion_error
+
+        self.__loader = loader
+        self.__tokenizer = Tokenizer(
+            order_column_indices(loader.manage_file_header())
+        )
+        self.__file_offset = 0
+        self.__line_number = 1
+        self.__pedigree_groups = defaultdict(lambda: ([], []))
+        self.__pedigree_violations = {}
+
+    @property
+    def loader(self) -> Loader:
+        """Return the loader property of the class."""
+        return self.__loader
+
+    @property
+    def file_offset(self) -> int:
+        """Return the file offset property of the class."""
+        return self.__file_offset
+
+    @property
+    def pedigree_violations(self) -> dict:
+        """Return the pedigree violations property of the class."""
+        return self.__pedigree_violations
+
+    def read_appended_lines(self) -> list:
+        """Read the complete lines appended after the file offset.
+
+        This method returns the new lines with their numbers
+        and moves the file offset after the last complete line.
+        A file which became shorter is read from its beginning.
+        """
+        if os.path.getsize(self.loader.file_path) < self.file_offset:
+            self.__file_offset = 0
+            self.__line_number = 1
+            self.__pedigree_groups.clear()
+            self.__pedigree_violations.clear()
+
+        with open(self.loader.file_path, 'rb') as file:
+            if self.file_offset == 0:
+                file.readline()
+                self.__file_offset = file.tell()
+
+            file.seek(self.file_offset)
+            file_lines = file.read().split(b'\n')[:-1]
+
+        appended_lines = []
+
+        for file_line in file_lines:
+            self.__file_offset += len(file_line) + 1
+            self.__line_number += 1
+            appended_lines.append((self.__line_number, file_line))
+
+        return appended_lines
+
+    def tokenize_line(self, file_line: bytes) -> list:
+        """Tokenize a single line of the followed file."""
+        return tokenize_file_line(
+            file_line, self.loader.file_suffix, self.__tokenizer
+        )
+
+    def read_appended_data(self) -> list:
+        """Read the tokenized lines appended after the file offset.
+
+        This method returns the new lines which are not empty with
+        their numbers. A line with a missing value is an error and
+        the file offset stays before the new lines, so they are
+        read again by the next call.
+        """
+        file_offset, first_line = self.__file_offset, self.__line_number
+        appended_data = []
+
+        for line_number, file_line in self.read_appended_lines():
+            if not file_line.strip():
+                continue
+
+            try:
+                appended_data.append(
+                    (line_number, self.tokenize_line(file_line))
+                )
+            except IndexError as index_error:
+                self.__file_offset, self.__line_number = \
+                    file_offset, first_line
+                message = 'The line {} has a missing value!'
+                raise ValueError(message.format(line_number)) from index_error
+
+        return appended_data
+
+    def poll(self) -> list:
+        """Poll the file for appended lines once.
+
+        This method parses the new lines, validates again only
+        the pedigrees with new lines and returns the families
+        of those of them which are valid. The violations of
+        the other pedigrees are kept by their identifiers.
+        """
+        changed_pedigrees = {}
+
+        for line_number, data_unit in self.read_appended_data():
+            pedigree_group = self.__pedigree_groups[data_unit[0]]
+            pedigree_group[0].append(data_unit)
+            pedigree_group[1].append(line_number)
+
+            changed_pedigrees[data_unit[0]] = None
+
+        pedigree_families = []
+
+        for pedigree_identifier in changed_pedigrees:
+            pedigree_data, line_numbers = \
+                self.__pedigree_groups[pedigree_identifier]
+            pedigree_violations = Validator.validate_pedigree_data(
+                pedigree_data, line_numbers
+            )
+
+            if pedigree_violations:
+                self.__pedigree_violations[pedigree_identifier] = \
+                    pedigree_violations
+            else:
+                self.__pedigree_violations.pop(pedigree_identifier, None)
+                pedigree_families.append(
+                    Builder.build_pedigree_family(pedigree_data)
+                )
+
+        return pedigree_families
+
+    def follow(self, poll_interval: float,
+               number_polls: Optional[int] = None) -> Iterator:
+        """Follow the file and yield the families of its new lines.
+
+        This method polls the file in the given interval in
+        seconds, forever or the given number of times, and
+        yields every family built from the appended lines.
+        """
+        try:
+            while number_polls is None or number_polls > 0:
+                yield from self.poll()
+
+                if number_polls is not None:
+                    number_polls -= 1
+
+                if number_polls != 0:
+                    time.sleep(poll_interval)
+        except ValueError as file_error:
+            Loader.exit_file_error(file_error)
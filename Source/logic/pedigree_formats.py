@@ -0,0 +1,199 @@
+# This Python file uses the following encoding: UTF-8
+
+"""The module has the classes FormatReader, FamReader and LinkageReader.
+
+This module contains the registry of the readers of the
+pedigree file formats without a header. Every reader turns
+the lines of its format into the lines of the pedigree columns.
+"""
+
+from typing import Type
+from typing import BinaryIO
+from typing import Iterator
+from typing import Optional
+from abc import ABC
+from abc import abstractmethod
+from operator import itemgetter
+from itertools import groupby
+
+from logic.pedigree_tokenizer import Tokenizer
+
+
+FORMAT_READERS = {}
+
+
+def register_format_reader(reader_class: Type['FormatReader']) -> type:
+    """Register a reader class for the suffixes of its format.
+
+    This function is used as a decorator of the reader
+    classes and returns the registered class unchanged.
+    """
+    for file_extension in reader_class.FILE_EXTENSIONS:
+        FORMAT_READERS[file_extension] = reader_class
+
+    return reader_class
+
+
+def find_format_reader(file_suffix: str) -> Optional[type]:
+    """Find the registered reader class of a file suffix."""
+    return FORMAT_READERS.get(file_suffix.lower())
+
+
+class FormatReader(ABC):
+    """FormatReader Class.
+
+    This class is used as the abstract base of the readers
+    of the pedigree file formats. A reader is created with the
+    options of the loading and yields the lines of a binary
+    stream as lists with the values of the pedigree columns.
+    """
+
+    FILE_EXTENSIONS = []
+    FIRST_LINE = 1
+
+    def __init__(self, reader_options: dict) -> None:
+        """Initialize an instance of the FormatReader class.
+
+        It accepts the options of the loading, which
+        configure the reading of the format.
+        """
+        try:
+            assert isinstance(reader_options, dict)
+        except AssertionError as assertion_error:
+            message = 'The reader constructor arguments are not correct!'
+            raise AssertionError(message) from assertion_error
+
+        self.__reader_options = reader_options
+
+    @property
+    def reader_options(self) -> dict:
+        """Return the reader options property of the class."""
+        return self.__reader_options
+
+    @abstractmethod
+    def read_lines(self, file_object: BinaryIO) -> Iterator[list]:
+        """Read the lines of a binary stream in the pedigree columns."""
+
+
+@register_format_reader
+class FamReader(FormatReader):
+    """FamReader Class.
+
+    This class is used to read the PLINK files without a
+    header, which have six columns: the family, the individual,
+    the father, the mother, the sex and the phenotype. The
+    proband of every family is chosen by a rule or an option.
+    """
+
+    FILE_EXTENSIONS = ['.fam']
+
+    SEX_VALUES = {'1': '1', '2': '2'}
+    STATUS_VALUES = {'1': '1', '2': '2'}
+    PROBAND_RULES = ['affected', 'first']
+
+    def __init__(self, reader_options: dict) -> None:
+        """Initialize an instance of the FamReader class.
+
+        It accepts the options of the loading with the
+        rule for choosing the probands, which is the first
+        affected or the first individual of every family,
+        and the probands given by the family identifiers.
+        """
+        super().__init__(reader_options)
+
+        try:
+            assert reader_options.get('proband_rule', 'affected') in \
+                FamReader.PROBAND_RULES
+            assert isinstance(reader_options.get('probands') or {}, dict)
+        except AssertionError as assertion_error:
+            message = 'The proband options are not correct!'
+            raise AssertionError(message) from assertion_error
+
+        self.__tokenizer = Tokenizer((0, 1, 2, 3, 4, 5))
+        self.__proband_pedigrees = set()
+
+    def tokenize_lines(self, file_object: BinaryIO) -> Iterator[list]:
+        """Tokenize the lines of a binary stream.
+
+        This method yields the first six values of every line
+        with the sex and the status in the pedigree values.
+        The empty lines are allowed only at the end of the file.
+        """
+        empty_line = None
+
+        for line_number, file_line in enumerate(file_object, 1):
+            if not file_line.strip():
+                empty_line = empty_line or line_number
+                continue
+
+            try:
+                assert empty_line is None
+                data_unit = self.__tokenizer.tokenize_line(file_line)
+            except (AssertionError, IndexError) as line_error:
+                message = 'The line {} has a missing value!'
+                raise ValueError(
+                    message.format(empty_line or line_number)
+                ) from line_error
+
+            data_unit[4] = self.SEX_VALUES.get(data_unit[4], '0')
+            data_unit[5] = self.STATUS_VALUES.get(data_unit[5], '0')
+            yield data_unit
+
+    def find_proband_identifier(self, pedigree_identifier: str,
+                                pedigree_data: list) -> Optional[str]:
+        """Find the proband of a group of lines of a family.
+
+        This method returns the proband given by the options
+        or chosen by the rule. Only the first group of lines
+        of every family has a proband.
+        """
+        if pedigree_identifier in self.__proband_pedigrees:
+            return None
+
+        self.__proband_pedigrees.add(pedigree_identifier)
+        probands = self.reader_options.get('probands') or {}
+
+        if pedigree_identifier in probands:
+            return probands[pedigree_identifier]
+
+        if self.reader_options.get('proband_rule', 'affected') == 'affected':
+            for data_unit in pedigree_data:
+                if data_unit[5] == '2':
+                    return data_unit[1]
+
+        return pedigree_data[0][1]
+
+    def read_lines(self, file_object: BinaryIO) -> Iterator[list]:
+        """Read the lines of a binary stream in the pedigree columns.
+
+        This method groups the consecutive lines of every
+        family, chooses its proband and yields the lines
+        with the role of every individual.
+        """
+        file_groups = groupby(self.tokenize_lines(file_object), itemgetter(0))
+
+        for pedigree_identifier, pedigree_lines in file_groups:
+            pedigree_data = list(pedigree_lines)
+            proband_identifier = self.find_proband_identifier(
+                pedigree_identifier, pedigree_data
+            )
+
+            for data_unit in pedigree_data:
+                data_unit.append(
+                    'prb' if data_unit[1] == proband_identifier else 'null'
+                )
+                yield data_unit
+
+
+@register_format_reader
+class LinkageReader(FamReader):
+    """LinkageReader Class.
+
+    This class is used to read the LINKAGE files in the
+    pre-makeped format, which have the same first six columns
+    as the PLINK files, followed by the columns of the markers.
+    The affection status is 0 for unknown, 1 for unaffected
+    and 2 for affected, so the markers are simply skipped.
+    """
+
+    FILE_EXTENSIONS = ['.pre']
@@ -0,0 +1,251 @@
+# This Python file uses the following encoding: UTF-8
+
+"""The module has the class OffsetIndex.
+
+This module contains the logic of indexing the byte ranges
+of the pedigrees in a pedigree file in a sidecar file, so
+selected pedigrees are read without parsing the whole file.
+"""
+
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+
+import os
+import csv
+import json
+
+from logic.pedigree_builder import Loader
+from logic.pedigree_builder import order_column_indices
+from logic.pedigree_builder import tokenize_file_line
+from logic.pedigree_formats import find_format_reader
+from logic.pedigree_tokenizer import Tokenizer
+from logic.pedigree_validator import Validator
+
+
+class OffsetIndex:
+    """OffsetIndex Class.
+
+    This class is used to map the identifiers of the
+    pedigrees in a file to the byte ranges of their lines.
+    The index is built in a single pass over the file and
+    kept in a sidecar file next to it, which is built again
+    when the size or the modification time of the file change.
+    """
+
+    INDEX_VERSION = 1
+    INDEX_SUFFIX = '.index'
+
+    def __init__(self, loader: Loader) -> None:
+        """Initialize an instance of the OffsetIndex class.
+
+        It accepts a loader of an uncompressed file with a header
+        in streaming mode, which manages the header of the file.
+        The files of the registered formats without a header are
+        not accepted, as their probands depend on whole families.
+        The index is loaded from its sidecar file or built if it
+        is not valid. The program exits on an error in the file.
+        """
+        try:
+            assert isinstance(loader, Loader)
+            assert loader.file_options['streaming']
+            assert not loader.file_compression
+            assert find_format_reader(loader.file_suffix) is None
+        except AssertionError as assertion_error:
+            message = 'The index constructor arguments are not correct!'
+            raise AssertionError(message) from assertion_error
+
+        self.__loader = loader
+        self.__tokenizer = Tokenizer(
+            order_column_indices(loader.manage_file_header())
+        )
+        self.__index_path = loader.file_path + OffsetIndex.INDEX_SUFFIX
+        self.__pedigree_ranges = self.load_index()
+
+        if self.__pedigree_ranges is None:
+            try:
+                self.__pedigree_ranges = self.build_index()
+            except ValueError as file_error:
+                Loader.exit_file_error(file_error)
+
+            self.store_index()
+
+    @property
+    def loader(self) -> Loader:
+        """Return the loader property of the class."""
+        return self.__loader
+
+    @property
+    def index_path(self) -> str:
+        """Return the index path property of the class."""
+        return self.__index_path
+
+    @property
+    def pedigree_ranges(self) -> dict:
+        """Return the pedigree ranges property of the class."""
+        return self.__pedigree_ranges
+
+    def build_file_key(self) -> list:
+        """Build the key of the file from its size and time."""
+        file_stat = os.stat(self.loader.file_path)
+        return [
+            OffsetIndex.INDEX_VERSION,
+            file_stat.st_size,
+            file_stat.st_mtime_ns,
+        ]
+
+    def load_index(self) -> Optional[dict]:
+        """Load the index from its sidecar file.
+
+        This method returns nothing if the sidecar file
+        does not exist, it is broken or the file changed.
+        """
+        try:
+            with open(self.index_path, encoding='utf-8') as index_file:
+                index_data = json.load(index_file)
+
+            if index_data['file_key'] == self.build_file_key():
+                return index_data['pedigree_ranges']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        return None
+
+    def store_index(self) -> None:
+        """Store the index in its sidecar file.
+
+        This method writes the sidecar file through a temporary
+        file. If the directory is not writable, the index is
+        kept only in the memory.
+        """
+        index_data = {
+            'file_key': self.build_file_key(),
+            'pedigree_ranges': self.pedigree_ranges,
+        }
+        temporary_path = self.index_path + '.tmp'
+
+        try:
+            with open(temporary_path, 'w', encoding='utf-8') as index_file:
+                json.dump(index_data, index_file)
+
+            os.replace(temporary_path, self.index_path)
+        except OSError:
+            pass
+
+    def read_pedigree_identifier(self, file_line: bytes) -> str:
+        """Read only the pedigree identifier of a single line."""
+        pedigree_index = self.__tokenizer.column_indices[0]
+
+        if self.loader.file_suffix.lower() in \
+                Loader.COMMA_SEPARATED_EXTENSIONS:
+            file_values = next(csv.reader([file_line.decode('utf-8')]))
+            return file_values[pedigree_index]
+
+        file_values = file_line.split(None, pedigree_index + 1)
+        return file_values[pedigree_index].decode('utf-8')
+
+    def build_index(self) -> dict:
+        """Build the index in a single pass over the file.
+
+        This method maps every pedigree identifier to a list
+        of byte ranges with the number of their first line. The
+        consecutive lines of a pedigree are a single range and
+        an empty line always ends the range before it.
+        """
+        pedigree_ranges = {}
+        previous_identifier = None
+        line_number = 2
+
+        with open(self.loader.file_path, 'rb') as file:
+            file.readline()
+            file_offset = file.tell()
+
+            for file_line in file:
+                next_offset = file_offset + len(file_line)
+
+                if not file_line.strip():
+                    previous_identifier = None
+                else:
+                    try:
+                        pedigree_identifier = \
+                            self.read_pedigree_identifier(file_line)
+                    except IndexError as index_error:
+                        message = 'The line {} has a missing value!'
+                        raise ValueError(
+                            message.format(line_number)
+                        ) from index_error
+
+                    if pedigree_identifier == previous_identifier:
+                        pedigree_ranges[pedigree_identifier][-1][1] = \
+                            next_offset
+                    else:
+                        pedigree_ranges.setdefault(
+                            pedigree_identifier, []
+                        ).append([file_offset, next_offset, line_number])
+
+                    previous_identifier = pedigree_identifier
+
+                file_offset = next_offset
+                line_number += 1
+
+        return pedigree_ranges
+
+    def read_pedigree_data(self, pedigree_identifier: str) -> list:
+        """Read the validated data of a single pedigree.
+
+        This method seeks to the byte ranges of the pedigree
+        and parses only their lines. The data is validated
+        with the numbers of the lines in the file.
+        """
+        if pedigree_identifier not in self.pedigree_ranges:
+            message = 'The pedigree {} is not in the file!'
+            raise ValueError(message.format(pedigree_identifier))
+
+        pedigree_data = []
+        line_numbers = []
+
+        with open(self.loader.file_path, 'rb') as file:
+            for range_start, range_end, first_line in \
+                    self.pedigree_ranges[pedigree_identifier]:
+                file.seek(range_start)
+                range_lines = file.read(range_end - range_start).split(b'\n')
+
+                if range_lines[-1] == b'':
+                    range_lines.pop()
+
+                for line_number, file_line in \
+                        enumerate(range_lines, first_line):
+                    try:
+                        pedigree_data.append(tokenize_file_line(
+                            file_line, self.loader.file_suffix,
+                            self.__tokenizer
+                        ))
+                    except IndexError as index_error:
+                        message = 'The line {} has a missing value!'
+                        raise ValueError(
+                            message.format(line_number)
+                        ) from index_error
+
+                    line_numbers.append(line_number)
+
+        pedigree_violations = Validator.validate_pedigree_data(
+            pedigree_data, line_numbers
+        )
+        message = 'The data of the pedigree {} is not valid!'
+        assert not pedigree_violations, '\n'.join(
+            [message.format(pedigree_identifier)] + pedigree_violations
+        )
+
+        return pedigree_data
+
+    def stream_pedigree_data(self, pedigree_identifiers: Iterable) -> Iterator:
+        """Stream the validated data of the selected pedigrees.
+
+        This method yields the data of every single selected
+        pedigree and exits the program on an error in the file.
+        """
+        try:
+            for pedigree_identifier in pedigree_identifiers:
+                yield self.read_pedigree_data(pedigree_identifier)
+        except (AssertionError, ValueError) as file_error:
+            Loader.exit_file_error(file_error)
@@ -0,0 +1,344 @@
+# This Python file uses the following encoding: UTF-8
+
+"""The module has the class KinshipMatrix.
+
+This module contains the logic of computing the kinship
+coefficients and the inbreeding coefficients of the individuals
+in a pedigree by the tabular method. The individuals are taken
+generation by generation, so every block of individuals is
+computed from the blocks of their parents with NumPy at once.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from logic.pedigree_units import Individual
+
+
+class KinshipMatrix:
+    """KinshipMatrix Class.
+
+    This class is used to compute the kinship coefficients of
+    the individuals in a single pedigree. The individuals are ordered
+    by their generation ranks in blocks, where every individual comes
+    after its parents. In the dense mode the whole matrix is built
+    block by block, while in the sparse mode no matrix is built and
+    every pairwise coefficient is computed on demand from the
+    coefficients of the ancestors, which are memoized.
+    """
+
+    def __init__(self, pedigree_individuals: list,
+                 sparse_mode: bool = False) -> None:
+        """Initialize an instance of the KinshipMatrix class.
+
+        It accepts the individuals of a pedigree and
+        optionally if the matrix is in the sparse mode.
+        """
+        try:
+            assert isinstance(pedigree_individuals, list)
+            assert all(isinstance(individual, Individual)
+                       for individual in pedigree_individuals)
+            assert isinstance(sparse_mode, bool)
+        except AssertionError as assertion_error:
+            message = 'The kinship constructor arguments are not correct!'
+            raise AssertionError(message) from assertion_error
+
+        self.__sparse_mode = sparse_mode
+        self.__kinship_blocks = KinshipMatrix.order_kinship_blocks(
+            pedigree_individuals
+        )
+        self.__kinship_individuals = [
+            individual
+            for kinship_block in self.__kinship_blocks
+            for individual in kinship_block
+        ]
+        self.__individual_indices = {
+            individual.individual_identifier: individual_index
+            for individual_index, individual
+            in enumerate(self.__kinship_individuals)
+        }
+        self.__parent_indices = self.find_parent_indices()
+        self.__coefficient_cache = {}
+        self.__kinship_matrix = None
+
+        if not sparse_mode:
+            self.__kinship_matrix = self.build_dense_matrix()
+
+    @property
+    def sparse_mode(self) -> bool:
+        """Return the sparse mode property of the class."""
+        return self.__sparse_mode
+
+    @property
+    def kinship_individuals(self) -> list:
+        """Return the kinship individuals property of the class."""
+        return self.__kinship_individuals
+
+    @property
+    def individual_indices(self) -> dict:
+        """Return the individual indices property of the class."""
+        return self.__individual_indices
+
+    @property
+    def coefficient_cache(self) -> dict:
+        """Return the coefficient cache property of the class."""
+        return self.__coefficient_cache
+
+    @property
+    def kinship_matrix(self) -> Optional[np.ndarray]:
+        """Return the kinship matrix property of the class."""
+        return self.__kinship_matrix
+
+    @staticmethod
+    def order_kinship_blocks(pedigree_individuals: list) -> list:
+        """Order the individuals in blocks after their parents.
+
+        This method takes the individuals by their generation ranks
+        and puts every individual in the block after the blocks of
+        its parents. The ranks of a pedigree almost always keep the
+        parents in earlier generations, so a single pass is enough.
+        """
+        individual_levels = {}
+        ranked_individuals = sorted(
+            pedigree_individuals,
+            key=lambda individual: individual.generation_rank or 0
+        )
+        pending_individuals = ranked_individuals
+
+        while pending_individuals:
+            next_pending_individuals = []
+
+            for individual in pending_individuals:
+                parent_levels = [
+                    individual_levels.get(parent_identifier)
+                    for parent_identifier in (individual.individual_father,
+                                              individual.individual_mother)
+                    if parent_identifier != '0'
+                ]
+
+                if None in parent_levels:
+                    next_pending_individuals.append(individual)
+                else:
+                    individual_levels[individual.individual_identifier] = \
+                        max(parent_levels, default=-1) + 1
+
+            if len(next_pending_individuals) == len(pending_individuals):
+                message = 'The parents of the individuals {} ' \
+                    'cannot be ordered!'
+                raise ValueError(message.format(', '.join(
+                    map(str, next_pending_individuals)
+                )))
+
+            pending_individuals = next_pending_individuals
+
+        kinship_blocks = [[] for _ in range(
+            max(individual_levels.values(), default=-1) + 1
+        )]
+
+        for individual in ranked_individuals:
+            kinship_blocks[
+                individual_levels[individual.individual_identifier]
+            ].append(individual)
+
+        return kinship_blocks
+
+    def find_parent_indices(self) -> tuple:
+        """Find the indices of the parents of all the individuals.
+
+        This method returns the lists of the indices of the fathers
+        and the mothers in the order of the kinship individuals, where
+        an unknown parent has the index of the last row of the matrix,
+        which is kept with zeros.
+        """
+        unknown_index = len(self.kinship_individuals)
+        fathers = []
+        mothers = []
+
+        for individual in self.kinship_individuals:
+            fathers.append(self.individual_indices.get(
+                individual.individual_father, unknown_index
+            ))
+            mothers.append(self.individual_indices.get(
+                individual.individual_mother, unknown_index
+            ))
+
+        return fathers, mothers
+
+    def build_dense_matrix(self) -> np.ndarray:
+        """Build the whole kinship matrix block by block.
+
+        This method computes every block of individuals at once.
+        The coefficients of the individuals with the individuals of
+        the earlier blocks are the means of the coefficients of their
+        parents, while the ones inside the block are the means of the
+        coefficients between the parents of both individuals.
+        """
+        number_individuals = len(self.kinship_individuals)
+        kinship_matrix = np.zeros((number_individuals + 1,
+                                   number_individuals + 1))
+        start_index = 0
+
+        for kinship_block in self.__kinship_blocks:
+            final_index = start_index + len(kinship_block)
+            fathers, mothers = (
+                np.array(parent_indices[start_index:final_index])
+                for parent_indices in self.__parent_indices
+            )
+
+            kinship_matrix[start_index:final_index, :start_index] = 0.5 * (
+                kinship_matrix[fathers, :start_index] +
+                kinship_matrix[mothers, :start_index]
+            )
+            kinship_matrix[:start_index, start_index:final_index] = \
+                kinship_matrix[start_index:final_index, :start_index].T
+
+            kinship_matrix[start_index:final_index,
+                           start_index:final_index] = 0.25 * (
+                kinship_matrix[np.ix_(fathers, fathers)] +
+                kinship_matrix[np.ix_(fathers, mothers)] +
+                kinship_matrix[np.ix_(mothers, fathers)] +
+                kinship_matrix[np.ix_(mothers, mothers)]
+            )
+
+            block_indices = np.arange(start_index, final_index)
+            kinship_matrix[block_indices, block_indices] = 0.5 * (
+                1.0 + kinship_matrix[fathers, mothers]
+            )
+            start_index = final_index
+
+        return kinship_matrix[:number_individuals, :number_individuals]
+
+    def find_individual_index(self, individual_identifier: str) -> int:
+        """Find the index of an individual in the kinship matrix."""
+        if individual_identifier not in self.individual_indices:
+            message = 'The individual {} is not in the kinship matrix!'
+            raise ValueError(message.format(individual_identifier))
+
+        return self.individual_indices[individual_identifier]
+
+    @staticmethod
+    def order_kinship_key(first_index: int, second_index: int) -> tuple:
+        """Order the indices of two individuals as a key of the cache."""
+        if first_index < second_index:
+            return second_index, first_index
+
+        return first_index, second_index
+
+    def find_parent_keys(self, coefficient_key: tuple) -> list:
+        """Find the keys of the coefficients of the parents.
+
+        This method returns the keys of the coefficients from
+        which the coefficient of the given key is computed.
+        """
+        first_index, second_index = coefficient_key
+        father_index = self.__parent_indices[0][first_index]
+        mother_index = self.__parent_indices[1][first_index]
+
+        if first_index == second_index:
+            return [
+                KinshipMatrix.order_kinship_key(father_index, mother_index)
+            ]
+
+        return [
+            KinshipMatrix.order_kinship_key(father_index, second_index),
+            KinshipMatrix.order_kinship_key(mother_index, second_index),
+        ]
+
+    def compute_kinship(self, first_index: int, second_index: int) -> float:
+        """Compute the kinship coefficient of two individuals.
+
+        This method applies the recursion of the tabular method on
+        the later of the individuals, which cannot be an ancestor
+        of the other one. The recursion is unrolled on an explicit
+        stack of keys, so the depth of the pedigree is not bounded
+        by the recursion limit. The computed coefficients are memoized.
+        """
+        unknown_index = len(self.kinship_individuals)
+        pending_keys = [
+            KinshipMatrix.order_kinship_key(first_index, second_index)
+        ]
+
+        while pending_keys:
+            coefficient_key = pending_keys[-1]
+
+            if coefficient_key[0] == unknown_index or \
+                    coefficient_key in self.coefficient_cache:
+                pending_keys.pop()
+                continue
+
+            parent_keys = self.find_parent_keys(coefficient_key)
+            missing_keys = [
+                parent_key for parent_key in parent_keys
+                if parent_key[0] != unknown_index and
+                parent_key not in self.coefficient_cache
+            ]
+
+            if missing_keys:
+                pending_keys.extend(missing_keys)
+                continue
+
+            parent_coefficients = [
+                self.coefficient_cache.get(parent_key, 0.0)
+                for parent_key in parent_keys
+            ]
+
+            if coefficient_key[0] == coefficient_key[1]:
+                coefficient = 0.5 * (1.0 + parent_coefficients[0])
+            else:
+                coefficient = 0.5 * sum(parent_coefficients)
+
+            self.coefficient_cache[coefficient_key] = coefficient
+            pending_keys.pop()
+
+        return self.coefficient_cache.get(
+            KinshipMatrix.order_kinship_key(first_index, second_index), 0.0
+        )
+
+    def get_kinship(self, first_identifier: str,
+                    second_identifier: str) -> float:
+        """Get the kinship coefficient of two individuals.
+
+        This method reads the coefficient from the matrix in
+        the dense mode and computes it in the sparse mode.
+        """
+        first_index = self.find_individual_index(first_identifier)
+        second_index = self.find_individual_index(second_identifier)
+
+        if self.kinship_matrix is not None:
+            return float(self.kinship_matrix[first_index, second_index])
+
+        return self.compute_kinship(first_index, second_index)
+
+    def get_inbreeding(self, individual_identifier: str) -> float:
+        """Get the inbreeding coefficient of a single individual.
+
+        This method returns the kinship coefficient of the parents
+        of the individual, which is zero for the founders.
+        """
+        individual_index = self.find_individual_index(individual_identifier)
+        return 2.0 * self.compute_diagonal(individual_index) - 1.0
+
+    def compute_diagonal(self, individual_index: int) -> float:
+        """Compute the kinship coefficient of an individual with itself."""
+        if self.kinship_matrix is not None:
+            return float(self.kinship_matrix[individual_index,
+                                             individual_index])
+
+        return self.compute_kinship(individual_index, individual_index)
+
+    def build_inbreeding_coefficients(self) -> np.ndarray:
+        """Build the inbreeding coefficients of all the individuals.
+
+        This method returns the coefficients in the order of the
+        kinship individuals, from the diagonal of the matrix in
+        the dense mode or from the memoized pairwise coefficients
+        in the sparse mode.
+        """
+        if self.kinship_matrix is not None:
+            return 2.0 * np.diagonal(self.kinship_matrix) - 1.0
+
+        return np.array([
+            2.0 * self.compute_diagonal(individual_index) - 1.0
+            for individual_index in range(len(self.kinship_individuals))
+        ])
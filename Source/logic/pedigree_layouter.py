@@ -496,14 +496,15 @@ class Layout:
 
     @staticmethod
     def get_matings_on_level(level: list) -> set:
-        """Get all the matings on a given level."""
+        """Get all the matings with children on a given level."""
         result = set()
 
         for individual in level:
             assert isinstance(individual, Individual)
 
             for mating_unit in individual.mating_instances:
-                result.add(mating_unit)
+                if mating_unit.sibship_unit_relation.siblings_individuals:
+                    result.add(mating_unit)
 
         return result
 
@@ -0,0 +1,119 @@
+# This Python file uses the following encoding: UTF-8
+
+"""The module has the class PedigreeMapping.
+
+This module contains a lazy mapping of the pedigrees of
+the file data by their identifiers. Every pedigree is built
+only when it is accessed and the built pedigrees are kept
+in a cache with an optional bound on their number.
+"""
+
+from typing import Union
+from typing import Optional
+from typing import Iterator
+from collections import OrderedDict
+from collections.abc import Mapping
+
+from logic.pedigree_builder import Builder
+from logic.pedigree_family import PedigreeFamily
+from logic.pedigree_table import PedigreeTable
+
+
+class PedigreeMapping(Mapping):
+    """PedigreeMapping Class.
+
+    This class is used to access the pedigrees of the file
+    data by their identifiers without building all of them.
+    The lines are grouped by their pedigrees in a single pass
+    at initialization, while the individuals and the inner
+    structure of a pedigree are built on its first access. The
+    lines of a pedigree table are grouped as their row indices
+    and decoded only on the first access of their pedigree. With
+    a maximum size the least recently used pedigrees are evicted
+    from the cache and built again on their next access.
+    """
+
+    def __init__(self, file_data: Union[list, PedigreeTable],
+                 maximum_size: Optional[int] = None) -> None:
+        """Initialize an instance of the PedigreeMapping class.
+
+        It accepts file data from a file as a list of lines
+        or as a pedigree table and optionally the maximum
+        number of the built pedigrees kept in the cache.
+        """
+        try:
+            assert isinstance(file_data, (list, PedigreeTable))
+            assert maximum_size is None or \
+                isinstance(maximum_size, int) and maximum_size > 0
+        except AssertionError as assertion_error:
+            message = 'The mapping constructor arguments are not correct!'
+            raise AssertionError(message) from assertion_error
+
+        self.__maximum_size = maximum_size
+        self.__file_data = file_data
+        self.__pedigree_lines = {}
+        self.__built_pedigrees = OrderedDict()
+
+        if isinstance(file_data, PedigreeTable):
+            self.__pedigree_lines = file_data.group_row_indices()
+        else:
+            for data_unit in file_data:
+                self.__pedigree_lines.setdefault(data_unit[0], []).append(
+                    data_unit
+                )
+
+    @property
+    def maximum_size(self) -> Optional[int]:
+        """Return the maximum size property of the class."""
+        return self.__maximum_size
+
+    @property
+    def built_pedigrees(self) -> OrderedDict:
+        """Return the built pedigrees property of the class."""
+        return self.__built_pedigrees
+
+    def __getitem__(self, pedigree_identifier: str) -> PedigreeFamily:
+        """Return a single pedigree and build it on its first access."""
+        pedigree_family = self.__built_pedigrees.get(pedigree_identifier)
+
+        if pedigree_family is not None:
+            self.__built_pedigrees.move_to_end(pedigree_identifier)
+            return pedigree_family
+
+        pedigree_family = Builder.build_pedigree_family(
+            self.read_pedigree_lines(pedigree_identifier)
+        )
+        self.__built_pedigrees[pedigree_identifier] = pedigree_family
+
+        if self.maximum_size is not None and \
+                len(self.__built_pedigrees) > self.maximum_size:
+            self.__built_pedigrees.popitem(last=False)
+
+        return pedigree_family
+
+    def read_pedigree_lines(self, pedigree_identifier: str) -> list:
+        """Read the lines of a single pedigree from the file data.
+
+        The lines of a pedigree table are kept only as their row
+        indices, so they are decoded when the pedigree is built.
+        """
+        pedigree_lines = self.__pedigree_lines[pedigree_identifier]
+
+        if isinstance(self.__file_data, PedigreeTable):
+            return [
+                self.__file_data[row_index] for row_index in pedigree_lines
+            ]
+
+        return pedigree_lines
+
+    def __contains__(self, pedigree_identifier: object) -> bool:
+        """Return if a pedigree is in the file data without building it."""
+        return pedigree_identifier in self.__pedigree_lines
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate the identifiers of the pedigrees in file order."""
+        return iter(self.__pedigree_lines)
+
+    def __len__(self) -> int:
+        """Return the number of the pedigrees in the file data."""
+        return len(self.__pedigree_lines)
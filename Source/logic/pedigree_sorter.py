@@ -0,0 +1,173 @@
+# This Python file uses the following encoding: UTF-8
+
+"""The module has the class ExternalSorter.
+
+This module contains the logic of grouping the lines of
+a pedigree file by their pedigrees with an external merge
+sort, which keeps a bounded number of lines in the memory.
+"""
+
+from typing import BinaryIO
+from typing import Iterable
+from typing import Iterator
+from operator import itemgetter
+from itertools import count
+from contextlib import ExitStack
+
+import os
+import heapq
+import pickle
+import tempfile
+
+
+class ExternalSorter:
+    """ExternalSorter Class.
+
+    This class is used to group the numbered lines of
+    a file by their pedigrees. The lines are sorted in runs
+    of a bounded size, which are written to temporary files
+    and merged. The pedigrees keep the order of their first
+    lines and the lines of a pedigree keep their own order.
+    """
+
+    MERGE_FAN_IN = 64
+
+    def __init__(self, run_size: int,
+                 merge_fan_in: int = MERGE_FAN_IN) -> None:
+        """Initialize an instance of the ExternalSorter class.
+
+        It accepts the maximum number of the lines which are
+        sorted in the memory at the same time and optionally
+        the maximum number of the runs merged at the same time.
+        """
+        try:
+            assert isinstance(run_size, int) and run_size > 0
+            assert isinstance(merge_fan_in, int) and merge_fan_in > 1
+        except AssertionError as assertion_error:
+            message = 'The sorter constructor arguments are not correct!'
+            raise AssertionError(message) from assertion_error
+
+        self.__run_size = run_size
+        self.__merge_fan_in = merge_fan_in
+        self.__pedigree_ranks = {}
+        self.__run_counter = count()
+
+    @property
+    def run_size(self) -> int:
+        """Return the run size property of the class."""
+        return self.__run_size
+
+    @property
+    def merge_fan_in(self) -> int:
+        """Return the merge fan in property of the class."""
+        return self.__merge_fan_in
+
+    def rank_file_line(self, file_line: tuple) -> tuple:
+        """Rank a numbered line by its pedigree and its number.
+
+        This method returns the key of the line, which is
+        the rank of the first line of its pedigree and the
+        number of the line itself.
+        """
+        line_number, data_unit = file_line
+        pedigree_rank = self.__pedigree_ranks.setdefault(
+            data_unit[0], len(self.__pedigree_ranks)
+        )
+        return pedigree_rank, line_number, data_unit
+
+    def write_sorted_run(self, run_directory: str,
+                         ranked_lines: Iterable) -> str:
+        """Write a sorted run of ranked lines to a temporary file.
+
+        This method returns the path of the file, which
+        is closed right after the lines are written.
+        """
+        run_path = os.path.join(
+            run_directory, 'run' + str(next(self.__run_counter))
+        )
+
+        with open(run_path, 'wb') as run_file:
+            for ranked_line in ranked_lines:
+                pickle.dump(ranked_line, run_file, pickle.HIGHEST_PROTOCOL)
+
+        return run_path
+
+    @staticmethod
+    def read_sorted_run(run_file: BinaryIO) -> Iterator[tuple]:
+        """Read a sorted run of ranked lines from a temporary file."""
+        while True:
+            try:
+                yield pickle.load(run_file)
+            except EOFError:
+                return
+
+    @staticmethod
+    def merge_sorted_runs(run_paths: list, *file_runs) -> Iterator[tuple]:
+        """Merge sorted runs from their files and from the memory.
+
+        This method opens the files of the runs only while
+        their lines are merged and deletes them afterwards.
+        """
+        with ExitStack() as exit_stack:
+            sorted_runs = [
+                ExternalSorter.read_sorted_run(
+                    exit_stack.enter_context(open(run_path, 'rb'))
+                )
+                for run_path in run_paths
+            ]
+            yield from heapq.merge(
+                *sorted_runs, *file_runs, key=itemgetter(0, 1)
+            )
+
+        for run_path in run_paths:
+            os.remove(run_path)
+
+    def reduce_sorted_runs(self, run_directory: str, run_paths: list) -> list:
+        """Reduce the number of the sorted runs to the merge fan in.
+
+        This method merges the runs in passes, where every
+        group of runs up to the merge fan in is merged into a
+        single run, so only a bounded number of files is open.
+        """
+        while len(run_paths) > self.merge_fan_in:
+            run_paths = [
+                self.write_sorted_run(
+                    run_directory, ExternalSorter.merge_sorted_runs(
+                        run_paths[run_index:run_index + self.merge_fan_in]
+                    )
+                )
+                for run_index in range(0, len(run_paths), self.merge_fan_in)
+            ]
+
+        return run_paths
+
+    def sort_file_lines(self, file_lines: Iterable) -> Iterator[tuple]:
+        """Sort the numbered lines of a file by their pedigrees.
+
+        This method accepts pairs of line numbers and lines
+        and yields them grouped by their pedigrees. Only the
+        lines of a single run are kept in the memory, while
+        the other runs are merged from their temporary files.
+        When there are more runs than the merge fan in, they
+        are merged in more than one pass.
+        """
+        with tempfile.TemporaryDirectory() as run_directory:
+            run_paths = []
+            file_run = []
+
+            for file_line in file_lines:
+                file_run.append(self.rank_file_line(file_line))
+
+                if len(file_run) == self.run_size:
+                    file_run.sort(key=itemgetter(0, 1))
+                    run_paths.append(
+                        self.write_sorted_run(run_directory, file_run)
+                    )
+                    file_run = []
+
+            file_run.sort(key=itemgetter(0, 1))
+            run_paths = self.reduce_sorted_runs(run_directory, run_paths)
+
+            for _, line_number, data_unit in ExternalSorter.merge_sorted_runs(
+                    run_paths, file_run):
+                yield line_number, data_unit
@@ -0,0 +1,177 @@
+# This Python file uses the following encoding: UTF-8
+
+"""The module has the class PedigreeTable.
+
+This module contains a columnar representation of the
+data of a pedigree file. The identifiers are interned as
+integer codes and the other values are kept as small integers.
+"""
+
+from typing import Iterable
+from typing import Iterator
+from array import array
+from collections import Counter
+
+
+class PedigreeTable:
+    """PedigreeTable Class.
+
+    This class is used to keep the lines of a pedigree
+    file in columns. The pedigree, individual, father and
+    mother identifiers share one table of interned strings,
+    where the code 0 is the unknown parent. The sex, the status
+    and the role are codes in small vocabularies of values.
+    """
+
+    IDENTIFIER_COLUMNS = (
+        'pedigree_identifier',
+        'individual_identifier',
+        'individual_father',
+        'individual_mother',
+    )
+
+    VALUE_COLUMNS = {
+        'individual_sex': ('0', '1', '2'),
+        'individual_status': ('0', '1', '2'),
+        'individual_role': ('null', 'prb'),
+    }
+
+    MAXIMUM_VALUES = 256
+
+    def __init__(self) -> None:
+        """Initialize an instance of the PedigreeTable class.
+
+        The instance does not accept any arguments,
+        the lines are added to it one by one.
+        """
+        self.__identifiers = ['0']
+        self.__identifier_codes = {'0': 0}
+
+        self.__columns = {}
+        self.__column_values = {}
+        self.__column_codes = {}
+
+        for column_name in PedigreeTable.IDENTIFIER_COLUMNS:
+            self.__columns[column_name] = array('I')
+
+        for column_name, values in PedigreeTable.VALUE_COLUMNS.items():
+            self.__columns[column_name] = array('B')
+            self.__column_values[column_name] = list(values)
+            self.__column_codes[column_name] = {
+                value: code for code, value in enumerate(values)
+            }
+
+    @property
+    def identifiers(self) -> list:
+        """Return the identifiers property of the class."""
+        return self.__identifiers
+
+    @property
+    def column_values(self) -> dict:
+        """Return the column values property of the class."""
+        return self.__column_values
+
+    def __len__(self) -> int:
+        """Return the number of the lines in the table."""
+        return len(self.__columns['pedigree_identifier'])
+
+    def __iter__(self) -> Iterator[list]:
+        """Iterate the lines of the table as lists of strings."""
+        decoders = [self.identifiers] * len(PedigreeTable.IDENTIFIER_COLUMNS)
+        decoders += [
+            self.column_values[column_name]
+            for column_name in PedigreeTable.VALUE_COLUMNS
+        ]
+
+        for codes in zip(*self.__columns.values()):
+            yield [decoder[code] for decoder, code in zip(decoders, codes)]
+
+    def __getitem__(self, index: int) -> list:
+        """Return a single line of the table as a list of strings."""
+        data_unit = []
+
+        for column_name, column in self.__columns.items():
+            decoder = self.__column_values.get(column_name, self.__identifiers)
+            data_unit.append(decoder[column[index]])
+
+        return data_unit
+
+    def intern_identifier(self, identifier: str) -> int:
+        """Return the integer code of an identifier.
+
+        This method adds the identifier to the
+        interned strings if it is not there yet.
+        """
+        code = self.__identifier_codes.get(identifier)
+
+        if code is None:
+            code = len(self.__identifiers)
+            self.__identifier_codes[identifier] = code
+            self.__identifiers.append(identifier)
+
+        return code
+
+    def encode_value(self, column_name: str, value: str) -> int:
+        """Return the small integer code of a value in a column."""
+        column_codes = self.__column_codes[column_name]
+        code = column_codes.get(value)
+
+        if code is None:
+            code = len(column_codes)
+
+            if code == PedigreeTable.MAXIMUM_VALUES:
+                message = 'The column {} has too many different values!'
+                raise ValueError(message.format(column_name))
+
+            column_codes[value] = code
+            self.__column_values[column_name].append(value)
+
+        return code
+
+    def add_data_unit(self, data_unit: list) -> None:
+        """Add a single line of a pedigree to the table."""
+        for column_name, value in zip(self.__columns, data_unit):
+            if column_name in self.__column_codes:
+                code = self.encode_value(column_name, value)
+            else:
+                code = self.intern_identifier(value)
+
+            self.__columns[column_name].append(code)
+
+    def get_column(self, column_name: str) -> array:
+        """Return the codes of a single column of the table."""
+        return self.__columns[column_name]
+
+    def group_row_indices(self) -> dict:
+        """Group the indices of the lines by their pedigrees.
+
+        This method scans only the column of the pedigree codes
+        and returns the indices of the lines of every pedigree
+        by its identifier in file order.
+        """
+        row_groups = {}
+
+        for row_index, code in enumerate(
+                self.__columns['pedigree_identifier']):
+            row_groups.setdefault(code, array('I')).append(row_index)
+
+        return {
+            self.__identifiers[code]: row_indices
+            for code, row_indices in row_groups.items()
+        }
+
+    def count_values(self, column_name: str) -> dict:
+        """Count the lines by the values in a single column."""
+        column_counter = Counter(self.__columns[column_name])
+        decoder = self.__column_values.get(column_name, self.__identifiers)
+        return {decoder[code]: count for code, count in column_counter.items()}
+
+    @classmethod
+    def build_table(cls, data: Iterable) -> 'PedigreeTable':
+        """Build a table from the given lines of pedigrees."""
+        pedigree_table = cls()
+
+        for data_unit in data:
+            pedigree_table.add_data_unit(data_unit)
+
+        return pedigree_table
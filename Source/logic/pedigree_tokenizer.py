@@ -0,0 +1,235 @@
+# This Python file uses the following encoding: UTF-8
+
+"""The module has the class Tokenizer.
+
+This module contains the logic of splitting the lines
+of a tab or space separated pedigree file into the values
+of the pedigree columns in a single pass over every line.
+"""
+
+from typing import BinaryIO
+from typing import Iterator
+from operator import itemgetter
+from itertools import islice
+from contextlib import closing
+from collections import deque
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+
+import os
+
+
+class Tokenizer:
+    """Tokenizer Class.
+
+    This class is used to split the lines of a tab
+    or space separated file on the runs of whitespace.
+    It works on bytes and decodes only the values of
+    the needed columns in their precomputed order. The
+    columns after the last needed one are never split.
+    """
+
+    def __init__(self, column_indices: tuple) -> None:
+        """Initialize an instance of the Tokenizer class.
+
+        It accepts the indices of the needed columns in
+        the file, given in the order of the pedigree columns.
+        """
+        try:
+            assert isinstance(column_indices, tuple)
+            assert len(column_indices) > 1
+            assert all(isinstance(index, int) for index in column_indices)
+        except AssertionError as assertion_error:
+            message = 'The tokenizer constructor arguments are not correct!'
+            raise AssertionError(message) from assertion_error
+
+        self.__column_indices = column_indices
+        self.__column_getter = itemgetter(*column_indices)
+        self.__split_count = max(column_indices) + 1
+
+    @property
+    def column_indices(self) -> tuple:
+        """Return the column indices property of the class."""
+        return self.__column_indices
+
+    @staticmethod
+    def tokenize_header(header_line: str) -> list:
+        """Tokenize the header line of a file.
+
+        This method returns the names of the columns in
+        the header without their leading number sign.
+        """
+        assert isinstance(header_line, str)
+        return [column_name[1:] for column_name in header_line.split()]
+
+    def tokenize_line(self, file_line: bytes) -> list:
+        """Tokenize a single line of a file.
+
+        This method splits the line on the runs of whitespace
+        and decodes only the values of the needed columns.
+        """
+        file_values = self.__column_getter(
+            file_line.split(None, self.__split_count)
+        )
+        return [file_value.decode('utf-8') for file_value in file_values]
+
+    def tokenize_lines(self, file_object: BinaryIO) -> Iterator[list]:
+        """Tokenize the lines of a file after its header.
+
+        This method yields the tokenized lines one by one.
+        The last line of the file must be an empty one and
+        it is skipped as it is not a part of the file data.
+        """
+        column_getter = self.__column_getter
+        split_count = self.__split_count
+        previous_line = None
+        line_number = 1
+
+        try:
+            for file_line in file_object:
+                if previous_line is not None:
+                    yield [
+                        file_value.decode('utf-8')
+                        for file_value in column_getter(
+                            previous_line.split(None, split_count)
+                        )
+                    ]
+
+                previous_line = file_line
+                line_number += 1
+        except IndexError as index_error:
+            message = 'The line {} has a missing value!'
+            raise ValueError(message.format(line_number)) from index_error
+
+        if previous_line not in (b'\n', b'\r\n'):
+            raise ValueError('The file must end with a new line!')
+
+    def tokenize_file_ranges(self, file_path: str, workers: int,
+                             range_size: int) -> Iterator[list]:
+        """Tokenize the lines of a file after its header in parallel.
+
+        This method splits the file into byte ranges aligned
+        to the new lines and tokenizes them in a pool of worker
+        processes. At most one range per worker is tokenized at
+        the same time, so only their lines are kept in the memory.
+        The lines are yielded in the order of the file with
+        the same errors as the sequential method.
+        """
+        assert isinstance(workers, int) and workers > 0
+        assert isinstance(range_size, int) and range_size > 0
+
+        with open(file_path, 'rb') as file:
+            file.readline()
+            file_ranges = split_file_ranges(file, file.tell(), range_size)
+
+        range_arguments = (
+            (file_path, self.column_indices, range_start, range_end,
+             range_index == len(file_ranges) - 1)
+            for range_index, (range_start, range_end)
+            in enumerate(file_ranges)
+        )
+        line_number = 2
+        final_line = None
+
+        with ProcessPoolExecutor(max_workers=workers) as executor, \
+                closing(map_file_ranges(executor, range_arguments,
+                                        workers)) as range_results:
+            for range_data, range_lines, missing_index, final_line in \
+                    range_results:
+                if missing_index is not None:
+                    message = 'The line {} has a missing value!'
+                    raise ValueError(
+                        message.format(line_number + missing_index)
+                    )
+
+                yield from range_data
+                line_number += range_lines
+
+        if final_line not in (b'\n', b'\r\n'):
+            raise ValueError('The file must end with a new line!')
+
+
+def map_file_ranges(executor: Executor, range_arguments: Iterator,
+                    workers: int) -> Iterator[tuple]:
+    """Map the byte ranges of a file to their tokenized lines.
+
+    This function yields the results of the ranges in their order,
+    while at most the given number of ranges are submitted to the
+    executor at the same time. The next range is submitted as soon
+    as a result is taken, and the ranges left are cancelled when
+    the results are not needed anymore.
+    """
+    range_futures = deque(
+        executor.submit(tokenize_file_range, range_argument)
+        for range_argument in islice(range_arguments, workers)
+    )
+
+    try:
+        while range_futures:
+            range_result = range_futures.popleft().result()
+
+            for range_argument in islice(range_arguments, 1):
+                range_futures.append(
+                    executor.submit(tokenize_file_range, range_argument)
+                )
+
+            yield range_result
+    finally:
+        for range_future in range_futures:
+            range_future.cancel()
+
+
+def split_file_ranges(file_object: BinaryIO, range_start: int,
+                      range_size: int) -> list:
+    """Split a file into byte ranges aligned to the new lines.
+
+    This function returns the pairs of start and end offsets
+    of the ranges from the given offset to the end of the file.
+    Every range except the last one ends right after a new line.
+    """
+    file_size = os.fstat(file_object.fileno()).st_size
+    file_ranges = []
+
+    while range_start < file_size:
+        file_object.seek(range_start + range_size - 1)
+        file_object.readline()
+        range_end = min(file_object.tell(), file_size)
+
+        file_ranges.append((range_start, range_end))
+        range_start = range_end
+
+    return file_ranges
+
+
+def tokenize_file_range(file_range: tuple) -> tuple:
+    """Tokenize a byte range of a file in a worker process.
+
+    This function returns the tokenized lines of the range, the
+    number of its lines, the index of the first line with a missing
+    value and the last line of the file if the range is the last one.
+    The last line of the file is not tokenized, as it must be empty.
+    """
+    file_path, column_indices, range_start, range_end, last_range = \
+        file_range
+    tokenizer = Tokenizer(column_indices)
+
+    with open(file_path, 'rb') as file:
+        file.seek(range_start)
+        file_lines = file.read(range_end - range_start).split(b'\n')
+
+    final_line = file_lines.pop()
+
+    if last_range and final_line == b'':
+        final_line = file_lines.pop() + b'\n'
+    elif not last_range:
+        final_line = None
+
+    range_data = []
+
+    for line_index, file_line in enumerate(file_lines):
+        try:
+            range_data.append(tokenizer.tokenize_line(file_line))
+        except IndexError:
+            return range_data, line_index, line_index, final_line
+
+    return range_data, len(file_lines), None, final_line
@@ -190,6 +190,29 @@ class Individual(Generic[IndividualBase]):
         return Role.__members__[string.upper()] \
             if string != 'null' else Sex.UNKNOWN
 
+    def encode_individual_data(self) -> list:
+        """Encode the individual data of the individual.
+
+        This method returns the line of the individual,
+        from which an equal individual is built again.
+        """
+        if self.individual_role == Role.PROBAND:
+            individual_role = 'prb'
+        elif isinstance(self.individual_role, Role):
+            individual_role = self.individual_role.name.lower()
+        else:
+            individual_role = 'null'
+
+        return [
+            self.pedigree_identifier,
+            self.individual_identifier,
+            self.individual_father,
+            self.individual_mother,
+            str(self.individual_sex.value),
+            str(self.individual_status.value),
+            individual_role,
+        ]
+
     def has_parents(self) -> bool:
         """Check if the individual has parents."""
         condition1 = self.individual_father != '0'
@@ -421,6 +444,16 @@ class SibshipUnit(Generic[SibshipUnitBase]):
         assert isinstance(sibling_individual_mate, Individual)
         self.__siblings_extended.append(sibling_individual_mate)
 
+    def remove_sibling_individual(self, sibling_individual: Individual) -> None:
+        """Remove an individual from the collection of siblings."""
+        assert isinstance(sibling_individual, Individual)
+        self.__siblings_individuals.remove(sibling_individual)
+
+    def remove_sibling_individual_mate(self, sibling_individual_mate: Individual) -> None:
+        """Remove an individual mate from the collection of extended siblings."""
+        assert isinstance(sibling_individual_mate, Individual)
+        self.__siblings_extended.remove(sibling_individual_mate)
+
     def change_sibling_individual(self, sibling_individual: Individual, index_child: int) -> None:
         """Change an individual from the collection of siblings."""
         assert isinstance(sibling_individual, Individual)
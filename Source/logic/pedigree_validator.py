@@ -0,0 +1,327 @@
+# This Python file uses the following encoding: UTF-8
+
+"""The module has the class Validator.
+
+This module contains the logic of validating the data
+of a pedigree file in a single pass over its lines with
+an index of the individuals in every single pedigree.
+"""
+
+from typing import Iterable
+from typing import Optional
+from itertools import chain
+from operator import itemgetter
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from logic.pedigree_table import PedigreeTable
+
+
+class Validator:
+    """Validator Class.
+
+    This class is used to validate the lines of one
+    or more pedigrees. Every line is indexed by its
+    pedigree and individual identifier, so all the checks
+    take linear time and every violation is collected
+    with the number of its line in the file.
+    """
+
+    MINIMUM_INDIVIDUALS = 3
+
+    PARENT_COLUMNS = {
+        2: ('father', '1', 'male'),
+        3: ('mother', '2', 'female'),
+    }
+
+    def __init__(self) -> None:
+        """Initialize an instance of the Validator class.
+
+        The instance does not accept any arguments,
+        the lines are added to it one by one.
+        """
+        self.__pedigree_lines = {}
+        self.__pedigree_sizes = defaultdict(int)
+        self.__pedigree_probands = defaultdict(list)
+        self.__pedigree_individuals = defaultdict(dict)
+
+        self.__pending_parents = []
+        self.__violations = []
+
+    @property
+    def pedigree_lines(self) -> dict:
+        """Return the pedigree lines property of the class."""
+        return self.__pedigree_lines
+
+    def add_data_unit(self, data_unit: list, line_number: int) -> None:
+        """Add a single line of a pedigree to the validation.
+
+        This method indexes the individual from the line and
+        checks its parents if they are already indexed. The
+        checks of the other parents are postponed to the end.
+        """
+        pedigree_identifier = data_unit[0]
+        individuals = self.__pedigree_individuals[pedigree_identifier]
+
+        self.__pedigree_lines.setdefault(pedigree_identifier, line_number)
+        self.__pedigree_sizes[pedigree_identifier] += 1
+
+        if data_unit[6] == 'prb':
+            self.__pedigree_probands[pedigree_identifier].append(line_number)
+
+        individuals.setdefault(data_unit[1], data_unit[4])
+
+        for parent_column in Validator.PARENT_COLUMNS:
+            if data_unit[parent_column] == '0':
+                continue
+
+            if data_unit[parent_column] in individuals:
+                self.validate_parent_individual(
+                    data_unit, parent_column, line_number
+                )
+            else:
+                self.__pending_parents.append(
+                    (data_unit, parent_column, line_number)
+                )
+
+    def add_data_units(self, data: list, line_numbers: Iterable) -> None:
+        """Add the lines of a pedigree with their numbers."""
+        for data_unit, line_number in zip(data, line_numbers):
+            self.add_data_unit(data_unit, line_number)
+
+    def add_table_units(self, pedigree_table: PedigreeTable,
+                        first_line: int) -> None:
+        """Add all the lines of a pedigree table to the validation.
+
+        This method checks the lines by the integer codes in the
+        columns of the table, so the lines are never decoded into
+        strings. Only the lines with violations are decoded. The
+        parents are checked in the same order as the lines added
+        one by one, so are their violations.
+        """
+        self.count_table_units(pedigree_table, first_line)
+
+        pedigree_codes = pedigree_table.get_column('pedigree_identifier')
+        sex_codes = pedigree_table.get_column('individual_sex')
+        parent_codes = {
+            2: pedigree_table.get_column('individual_father'),
+            3: pedigree_table.get_column('individual_mother'),
+        }
+
+        individual_sexes = {}
+        parent_checks = ([], [])
+
+        for row_index, individual_key in enumerate(zip(
+                pedigree_codes,
+                pedigree_table.get_column('individual_identifier'))):
+            individual_sexes.setdefault(individual_key, sex_codes[row_index])
+
+            for parent_column, codes in parent_codes.items():
+                if codes[row_index] != 0:
+                    parent_checks[
+                        (individual_key[0], codes[row_index])
+                        not in individual_sexes
+                    ].append((row_index, parent_column))
+
+        sex_values = pedigree_table.column_values['individual_sex']
+
+        for row_index, parent_column in chain(*parent_checks):
+            parent_sex = individual_sexes.get((
+                pedigree_codes[row_index],
+                parent_codes[parent_column][row_index]
+            ))
+
+            if parent_sex is None or sex_values[parent_sex] != \
+                    Validator.PARENT_COLUMNS[parent_column][1]:
+                self.check_parent_sex(
+                    pedigree_table[row_index], parent_column,
+                    row_index + first_line,
+                    None if parent_sex is None else sex_values[parent_sex]
+                )
+
+    def count_table_units(self, pedigree_table: PedigreeTable,
+                          first_line: int) -> None:
+        """Count the lines and the probands of the pedigrees in a table.
+
+        This method keeps the first line, the number of
+        the lines and the lines of the probands of every
+        pedigree by the codes in the columns of the table.
+        """
+        identifiers = pedigree_table.identifiers
+        proband_code = \
+            pedigree_table.column_values['individual_role'].index('prb')
+
+        for line_number, pedigree_code, role_code in zip(
+                range(first_line, len(pedigree_table) + first_line),
+                pedigree_table.get_column('pedigree_identifier'),
+                pedigree_table.get_column('individual_role')):
+            pedigree_identifier = identifiers[pedigree_code]
+
+            self.__pedigree_lines.setdefault(pedigree_identifier, line_number)
+            self.__pedigree_sizes[pedigree_identifier] += 1
+
+            if role_code == proband_code:
+                self.__pedigree_probands[pedigree_identifier].append(
+                    line_number
+                )
+
+    def validate_parent_individual(self, data_unit: list,
+                                   parent_column: int,
+                                   line_number: int) -> None:
+        """Validate a single parent of the individual in a line.
+
+        This method checks if the parent exists in the same
+        pedigree and if the sex of the parent is correct.
+        """
+        individuals = self.__pedigree_individuals[data_unit[0]]
+        self.check_parent_sex(
+            data_unit, parent_column, line_number,
+            individuals.get(data_unit[parent_column])
+        )
+
+    def check_parent_sex(self, data_unit: list, parent_column: int,
+                         line_number: int,
+                         individual_sex: Optional[str]) -> None:
+        """Check the sex of a single parent of the individual in a line.
+
+        This method adds a violation if the parent is not in the
+        pedigree, which is given by a missing sex, or if the sex
+        of the parent is not the one of its column.
+        """
+        parent_name, parent_sex, sex_name = \
+            Validator.PARENT_COLUMNS[parent_column]
+        parent_identifier = data_unit[parent_column]
+
+        if individual_sex is None:
+            message = 'The {} {} of the individual {} ' \
+                'is not in the pedigree {}!'
+            self.add_violation(line_number, message.format(
+                parent_name, parent_identifier, data_unit[1], data_unit[0]
+            ))
+        elif individual_sex != parent_sex:
+            message = 'The {} {} of the individual {} is not a {}!'
+            self.add_violation(line_number, message.format(
+                parent_name, parent_identifier, data_unit[1], sex_name
+            ))
+
+    def add_violation(self, line_number: int, message: str) -> None:
+        """Add a violation with the number of its line."""
+        self.__violations.append((line_number, message))
+
+    def collect_violations(self) -> list:
+        """Collect all the violations of the added lines.
+
+        This method returns the violations as
+        messages ordered by the numbers of their lines.
+        """
+        return Validator.format_violations(self.collect_line_violations())
+
+    def collect_line_violations(self) -> list:
+        """Collect all the violations with the numbers of their lines.
+
+        This method checks the postponed parents, the number of
+        the individuals and the probands in every pedigree. It
+        returns the pairs of line numbers and messages in order.
+        """
+        for pending_parent in self.__pending_parents:
+            self.validate_parent_individual(*pending_parent)
+
+        self.__pending_parents = []
+
+        for pedigree_identifier, first_line in self.pedigree_lines.items():
+            if self.__pedigree_sizes[pedigree_identifier] < \
+                    Validator.MINIMUM_INDIVIDUALS:
+                message = 'The pedigree {} has less than {} individuals!'
+                self.add_violation(first_line, message.format(
+                    pedigree_identifier, Validator.MINIMUM_INDIVIDUALS
+                ))
+
+            proband_lines = self.__pedigree_probands[pedigree_identifier]
+
+            if not proband_lines:
+                message = 'The pedigree {} has not any proband!'
+                self.add_violation(
+                    first_line, message.format(pedigree_identifier)
+                )
+
+            for proband_line in proband_lines[1:]:
+                message = 'The pedigree {} has more than one proband!'
+                self.add_violation(
+                    proband_line, message.format(pedigree_identifier)
+                )
+
+        self.__violations.sort(key=itemgetter(0))
+        return self.__violations
+
+    @staticmethod
+    def format_violations(line_violations: Iterable) -> list:
+        """Format the pairs of line numbers and messages."""
+        message = 'Line {}: {}'
+        return [message.format(*violation) for violation in line_violations]
+
+    @staticmethod
+    def validate_pedigree_data(data: list, line_numbers: Iterable) -> list:
+        """Validate the lines of a pedigree with their numbers.
+
+        This method returns the messages of all the violations
+        in the lines. The lines are valid if the list is empty.
+        """
+        validator = Validator()
+        validator.add_data_units(data, line_numbers)
+        return validator.collect_violations()
+
+    @staticmethod
+    def validate_pedigree_table(pedigree_table: PedigreeTable,
+                                first_line: int) -> list:
+        """Validate the lines of a pedigree table by their codes.
+
+        This method returns the same messages as the validation
+        of the decoded lines, where the first line of the table
+        has the given number.
+        """
+        validator = Validator()
+        validator.add_table_units(pedigree_table, first_line)
+        return validator.collect_violations()
+
+    @staticmethod
+    def validate_parallel_data(data: list, line_numbers: Iterable,
+                               workers: int, chunk_size: int) -> list:
+        """Validate the lines of many pedigrees in parallel.
+
+        This method groups the lines by their pedigrees and
+        validates the groups in a pool of worker processes. The
+        violations of the groups are merged in the order of the
+        lines, so the result is the same as the sequential one.
+        """
+        assert isinstance(workers, int) and workers > 0
+        assert isinstance(chunk_size, int) and chunk_size > 0
+
+        pedigree_groups = defaultdict(lambda: ([], []))
+
+        for data_unit, line_number in zip(data, line_numbers):
+            pedigree_group = pedigree_groups[data_unit[0]]
+            pedigree_group[0].append(data_unit)
+            pedigree_group[1].append(line_number)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            group_violations = executor.map(
+                validate_pedigree_group,
+                pedigree_groups.values(),
+                chunksize=chunk_size
+            )
+            line_violations = sorted(
+                chain.from_iterable(group_violations), key=itemgetter(0)
+            )
+
+        return Validator.format_violations(line_violations)
+
+
+def validate_pedigree_group(pedigree_group: tuple) -> list:
+    """Validate a group of lines of a pedigree in a worker process.
+
+    This function accepts the lines of the pedigree with their
+    numbers and returns the violations with the line numbers.
+    """
+    validator = Validator()
+    validator.add_data_units(*pedigree_group)
+    return validator.collect_line_violations()
@@ -7,20 +7,23 @@ import sys
 import shutil
 import argparse
 
+from typing import Iterable
+
 import matplotlib.pyplot as plt
 
 from logic.pedigree_builder import Loader
 from logic.pedigree_builder import Builder
+from logic.pedigree_follower import Follower
+from logic.pedigree_index import OffsetIndex
+from logic.pedigree_batch import BatchLoader
+from logic.pedigree_formats import find_format_reader
 
 from logic.pedigree_family import PedigreeFamily
 
-from logic.pedigree_graph import Graph
-from logic.pedigree_graph import SandwichInstance
-from logic.pedigree_graph import ProblemSolver
+from logic.pedigree_composer import build_component_layouts
 
-from logic.pedigree_layouter import Layout
-from logic.pedigree_drawer import LayoutDrawer
 from logic.pedigree_drawer import PDFBuilder
+from logic.pedigree_drawer import draw_component_layouts
 from logic.pedigree_drawer import validate_colors_statuses
 
 
@@ -67,52 +70,118 @@ def manage_existing_pedigree(pedigree_identifier: str) -> bool:
     return True
 
 
+def visualize_pedigree(pedigree: PedigreeFamily, colors: dict, workers: int = 1) -> None:
+    """Manage the visualization of a single pedigree.
+
+    Every connected component of the pedigree gets its own layout
+    and the drawings of the components are composed side by side.
+    """
+    assert isinstance(pedigree, PedigreeFamily)
+
+    if not manage_existing_pedigree(pedigree.pedigree_identifier):
+        return
+
+    layouts = build_component_layouts(pedigree, workers)
+
+    if any(layout is None for layout in layouts):
+        message = 'There is not an interval realization for the pedigree {}!'
+        raise Exception(message.format(pedigree.pedigree_identifier))
+
+    figure = draw_component_layouts(layouts, colors, pedigree.pedigree_identifier)
+    file_name = './Visualizations/' + pedigree.pedigree_identifier + '.pdf'
+
+    with PDFBuilder(file_name) as pdf_drawer:
+        pdf_drawer.savefig(figure)
+        plt.close(figure)
+        print('A visualization of the pedigree was created!')
+
+
+def check_offset_access(loader: Loader, option_name: str) -> None:
+    """Check if the pedigree file can be read by its byte offsets."""
+    if loader.file_compression:
+        message = 'The option {} cannot be used with a compressed file!'
+        Loader.exit_file_error(ValueError(message.format(option_name)))
+
+    if find_format_reader(loader.file_suffix) is not None:
+        message = 'The option {} cannot be used with a file without a header!'
+        Loader.exit_file_error(ValueError(message.format(option_name)))
+
+
+def load_pedigrees(arguments: argparse.Namespace) -> Iterable:
+    """Load the pedigrees of the file by the command line arguments."""
+    if BatchLoader.is_batch_path(arguments.file_name):
+        batch_loader = BatchLoader(arguments.file_name, arguments.workers, {
+            'proband_rule': arguments.proband_rule,
+            'extra_columns': arguments.extra_flag,
+        })
+        return (
+            pedigree
+            for _, file_data in batch_loader.stream_batch_data()
+            for pedigree in Builder(file_data).file_pedigrees
+        )
+
+    fused_flag = not arguments.columnar_flag and \
+        arguments.cache_directory is None
+    loader = Loader(arguments.file_name, {
+        'streaming': fused_flag or arguments.stream_flag or
+        arguments.interleaved_flag or
+        arguments.follow_interval is not None or
+        arguments.family_identifiers is not None,
+        'columnar': arguments.columnar_flag,
+        'interleaved': arguments.interleaved_flag,
+        'workers': arguments.workers,
+        'cache_directory': arguments.cache_directory,
+        'proband_rule': arguments.proband_rule,
+        'extra_columns': arguments.extra_flag,
+    })
+
+    if arguments.family_identifiers is not None:
+        check_offset_access(loader, '-family')
+        pedigrees = Builder.stream_file_pedigrees(
+            OffsetIndex(loader).stream_pedigree_data(
+                arguments.family_identifiers.split(',')
+            )
+        )
+    elif arguments.follow_interval is not None:
+        check_offset_access(loader, '-follow')
+        pedigrees = Follower(loader).follow(arguments.follow_interval)
+    elif arguments.stream_flag or arguments.interleaved_flag:
+        pedigrees = Builder.stream_file_pedigrees(loader.stream_file_data())
+    elif fused_flag:
+        pedigrees = Builder.build_loader_pedigrees(loader)
+    else:
+        pedigrees = Builder(loader.file_data, arguments.workers).file_pedigrees
+
+    return pedigrees
+
+
 def main() -> None:
     """Manage the consequence in the logic of pedigree vizualization."""
     parser = argparse.ArgumentParser(description='Manage a Pedigree File.')
     parser.add_argument('-o', dest='file_name')
     parser.add_argument('-clean', action='store_true', dest='clean_flag')
+    parser.add_argument('-stream', action='store_true', dest='stream_flag')
+    parser.add_argument('-columnar', action='store_true', dest='columnar_flag')
+    parser.add_argument('-interleaved', action='store_true',
+                        dest='interleaved_flag')
+    parser.add_argument('-workers', type=int, default=1, dest='workers')
+    parser.add_argument('-cache', dest='cache_directory')
+    parser.add_argument('-follow', type=float, dest='follow_interval')
+    parser.add_argument('-family', '--family', dest='family_identifiers')
+    parser.add_argument('-proband', choices=['affected', 'first'],
+                        default='affected', dest='proband_rule')
+    parser.add_argument('-extra', action='store_true', dest='extra_flag')
     arguments = parser.parse_args()
 
     if arguments.file_name:
-        loader = Loader(arguments.file_name)
-        builder = Builder(loader.file_data)
-
+        pedigrees = load_pedigrees(arguments)
         colors = manage_input_colors()
 
         if not os.path.isdir('./Visualizations'):
             os.mkdir('./Visualizations')
 
-        for pedigree in builder.file_pedigrees:
-            assert isinstance(pedigree, PedigreeFamily)
-
-            if not manage_existing_pedigree(pedigree.pedigree_identifier):
-                continue
-
-            graph = Graph(pedigree)
-
-            sandwich = SandwichInstance(
-                graph.vertices_pedigree_union,
-                graph.mandatory_graph,
-                graph.forbidden_graph
-            )
-
-            solver = ProblemSolver(sandwich)
-
-            if solver.solved_intervals is None:
-                message = 'There is not an interval realization for the pedigree {}!'
-                raise Exception(message.format(pedigree.pedigree_identifier))
-
-            if solver.solved_intervals is not None:
-                layouter = Layout(solver.solved_intervals)
-                layout_drawer = LayoutDrawer(layouter, 0, 0, colors)
-                figure = layout_drawer.draw(pedigree.pedigree_identifier)
-                file_name = './Visualizations/' + pedigree.pedigree_identifier + '.pdf'
-
-                with PDFBuilder(file_name) as pdf_drawer:
-                    pdf_drawer.savefig(figure)
-                    plt.close(figure)
-                    print('A visualization of the pedigree was created!')
+        for pedigree in pedigrees:
+            visualize_pedigree(pedigree, colors, arguments.workers)
 
     if arguments.clean_flag:
         if not os.path.isdir('./Visualizations'):
@@ -0,0 +1,137 @@
+# This Python file uses the following encoding: UTF-8
+
+"""Test module on the class BatchLoader."""
+
+import gzip
+import shutil
+import inspect
+import zipfile
+import pytest
+
+from logic.pedigree_builder import Loader
+from logic.pedigree_batch import BatchLoader
+from logic.pedigree_batch import load_batch_member
+
+
+@pytest.fixture(name='batch_directory')
+def fixture_batch_directory(tmp_path):
+    """Return a fixture of a directory with valid pedigree files."""
+    batch_directory = tmp_path / 'Batch'
+    batch_directory.mkdir()
+
+    shutil.copy('../../Examples/CSV Examples/Pedigree1.csv', batch_directory / 'A.csv')
+    shutil.copy('../../Examples/PED Examples/Pedigree1.ped', batch_directory / 'B.ped')
+    shutil.copy('../../Examples/TXT Examples/Pedigree7.txt', batch_directory / 'C.txt')
+
+    with open('../../Examples/TXT Examples/Pedigree6.txt', 'rb') as file:
+        (batch_directory / 'D.txt.gz').write_bytes(gzip.compress(file.read()))
+
+    (batch_directory / 'Notes.md').write_text('Not a pedigree file.\n')
+    return batch_directory
+
+
+@pytest.fixture(name='expected_data')
+def fixture_expected_data() -> list:
+    """Return a fixture of the data of the valid pedigree files."""
+    return [
+        Loader('../../Examples/CSV Examples/Pedigree1.csv').file_data,
+        Loader('../../Examples/PED Examples/Pedigree1.ped').file_data,
+        Loader('../../Examples/TXT Examples/Pedigree7.txt').file_data,
+        Loader('../../Examples/TXT Examples/Pedigree6.txt').file_data,
+    ]
+
+
+def test_batch_instances(batch_directory):
+    """Test BatchLoader Class Instances."""
+    batch_loader = BatchLoader(str(batch_directory), 2)
+
+    assert isinstance(batch_loader, BatchLoader)
+    assert inspect.isclass(BatchLoader)
+    assert batch_loader.batch_path == str(batch_directory)
+    assert batch_loader.workers == 2
+    assert [file_path for _, file_path in batch_loader.batch_members] == [
+        str(batch_directory / file_name)
+        for file_name in ['A.csv', 'B.ped', 'C.txt', 'D.txt.gz']
+    ]
+
+
+def test_batch_constructor(tmp_path):
+    """Test BatchLoader Class Constructor."""
+    for batch_arguments, error_code in [
+        ((1331,), 1),
+        ((str(tmp_path), 0), 1),
+        ((str(tmp_path),), 1),
+        ((str(tmp_path / '*.ped'),), 1),
+    ]:
+        with pytest.raises(SystemExit) as pytest_wrapped_error:
+            BatchLoader(*batch_arguments)
+
+        assert pytest_wrapped_error.value.code == error_code
+
+    (tmp_path / 'Broken.zip').write_bytes(b'not an archive')
+
+    with pytest.raises(SystemExit) as pytest_wrapped_error:
+        BatchLoader(str(tmp_path / 'Broken.zip'))
+
+    assert pytest_wrapped_error.value.code == 2
+
+
+def test_batch_path_method(batch_directory):
+    """Test BatchLoader Path Method."""
+    assert BatchLoader.is_batch_path(str(batch_directory))
+    assert BatchLoader.is_batch_path(str(batch_directory / '*.txt'))
+    assert BatchLoader.is_batch_path(str(batch_directory / 'Pedigree?.ped'))
+    assert BatchLoader.is_batch_path(str(batch_directory / 'Missing.ZIP'))
+
+    assert not BatchLoader.is_batch_path(str(batch_directory / 'B.ped'))
+    assert not BatchLoader.is_batch_path(str(batch_directory / 'Mistyped.ped'))
+
+
+def test_batch_directory_method(batch_directory, expected_data):
+    """Test BatchLoader Directory Method."""
+    batch_loader = BatchLoader(str(batch_directory), 2)
+    batch_data = list(batch_loader.stream_batch_data())
+
+    assert [file_name for file_name, _ in batch_data] == \
+        [file_path for _, file_path in batch_loader.batch_members]
+    assert [file_data for _, file_data in batch_data] == expected_data
+
+    glob_loader = BatchLoader(str(batch_directory / '*.txt'))
+    assert [file_data for _, file_data in glob_loader.stream_batch_data()] == \
+        expected_data[2:3]
+
+
+def test_batch_archive_method(batch_directory, expected_data, tmp_path):
+    """Test BatchLoader Archive Method."""
+    archive_path = tmp_path / 'Batch.zip'
+
+    with zipfile.ZipFile(archive_path, 'w') as archive:
+        for file_name in ['A.csv', 'B.ped', 'C.txt', 'D.txt.gz', 'Notes.md']:
+            archive.write(batch_directory / file_name, 'inner/' + file_name)
+
+        archive.writestr('empty/', '')
+
+    batch_loader = BatchLoader(str(archive_path), 2)
+    batch_data = list(batch_loader.stream_batch_data())
+
+    assert batch_loader.batch_members == [
+        (str(archive_path), 'inner/' + file_name)
+        for file_name in ['A.csv', 'B.ped', 'C.txt', 'D.txt.gz']
+    ]
+    assert [file_data for _, file_data in batch_data] == expected_data
+
+
+def test_batch_error_method(batch_directory):
+    """Test BatchLoader Error Method."""
+    shutil.copy('../../Examples/PED Examples/Pedigree7.ped', batch_directory / 'E.ped')
+    file_name, file_data, file_error = load_batch_member((None, str(batch_directory / 'E.ped')))
+
+    assert file_name == str(batch_directory / 'E.ped')
+    assert file_data is None
+    assert isinstance(file_error, AssertionError)
+    assert str(file_error).startswith('The file data is not valid!')
+
+    with pytest.raises(SystemExit) as pytest_wrapped_error:
+        list(BatchLoader(str(batch_directory)).stream_batch_data())
+
+    assert pytest_wrapped_error.value.code == 1
@@ -8,6 +8,10 @@ import inspect
 import pytest
 import os
 import stat
+import gc
+import bz2
+import gzip
+import lzma
 
 from logic.pedigree_builder import Loader
 from logic.pedigree_builder import Builder
@@ -288,21 +292,13 @@ def test_loader_methods(loader1, loader2, loader3):
     assert inspect.ismethod(loader2.validate_file_data)
     assert inspect.ismethod(loader3.validate_file_data)
 
-    assert inspect.isfunction(loader1.validate_number_individuals)
-    assert inspect.isfunction(loader2.validate_number_individuals)
-    assert inspect.isfunction(loader3.validate_number_individuals)
+    assert inspect.ismethod(loader1.stream_file_data)
+    assert inspect.ismethod(loader2.stream_file_data)
+    assert inspect.ismethod(loader3.stream_file_data)
 
-    assert inspect.isfunction(loader1.validate_context_individuals)
-    assert inspect.isfunction(loader2.validate_context_individuals)
-    assert inspect.isfunction(loader3.validate_context_individuals)
-
-    assert inspect.isfunction(loader1.find_parent_individual)
-    assert inspect.isfunction(loader2.find_parent_individual)
-    assert inspect.isfunction(loader3.find_parent_individual)
-
-    assert inspect.isfunction(loader1.find_proband_individual)
-    assert inspect.isfunction(loader2.find_proband_individual)
-    assert inspect.isfunction(loader3.find_proband_individual)
+    assert loader1.validate_file_data() == []
+    assert loader2.validate_file_data() == []
+    assert loader3.validate_file_data() == []
 
 
 def test_managing_tabbed_separated_file_method(column_order):
@@ -575,3 +571,249 @@ def test_builder_build_inner_units_method(builder1, builder2, builder3):
     assert isinstance(builder1.build_inner_units(), type(None))
     assert isinstance(builder2.build_inner_units(), type(None))
     assert isinstance(builder3.build_inner_units(), type(None))
+
+
+def test_loader_streaming_method(valid_data, tmp_path):
+    """Test Loader Streaming Method."""
+    loader = Loader('../../Examples/PED Examples/Pedigree1.ped', {'streaming': True})
+
+    assert loader.file_data == []
+    assert loader.file_options['streaming'] is True
+    assert list(loader.stream_file_data()) == [valid_data]
+
+    with pytest.raises(SystemExit) as pytest_wrapped_error:
+        Loader('../../Examples/PED Examples/Pedigree1.ped', {'unknown': True})
+
+    assert pytest_wrapped_error.value.code == 1
+
+    loader = Loader('../../Examples/PED Examples/Pedigree7.ped', {'streaming': True})
+
+    with pytest.raises(SystemExit) as pytest_wrapped_error:
+        list(loader.stream_file_data())
+
+    assert pytest_wrapped_error.value.code == 1
+
+    file_path = tmp_path / 'Interleaved.ped'
+    file_path.write_text(
+        '#pedigree_identifier\t#individual_identifier\t#individual_father\t'
+        '#individual_mother\t#individual_sex\t#individual_status\t#individual_role\n'
+        'ped1\tfather\t0\t0\t1\t1\tprb\n'
+        'ped1\tmother\t0\t0\t2\t1\tnull\n'
+        'ped1\tson\tfather\tmother\t1\t1\tnull\n'
+        'ped2\tfather\t0\t0\t1\t1\tprb\n'
+        'ped2\tmother\t0\t0\t2\t1\tnull\n'
+        'ped2\tson\tfather\tmother\t1\t1\tnull\n'
+        'ped1\tdau\tfather\tmother\t2\t1\tnull\n'
+        '\n'
+    )
+    loader = Loader(str(file_path), {'streaming': True})
+
+    with pytest.raises(SystemExit) as pytest_wrapped_error:
+        list(loader.stream_file_data())
+
+    assert pytest_wrapped_error.value.code == 2
+
+
+def test_loader_compression_method(tmp_path):
+    """Test Loader Compression Method."""
+    for file_path in [
+        '../../Examples/CSV Examples/Pedigree1.csv',
+        '../../Examples/TXT Examples/Pedigree7.txt',
+    ]:
+        loader = Loader(file_path)
+
+        with open(file_path, 'rb') as file:
+            file_bytes = file.read()
+
+        for file_compression, compressor in [
+            ('.gz', gzip.compress), ('.bz2', bz2.compress), ('.xz', lzma.compress)
+        ]:
+            compressed_path = tmp_path / (loader.file_name + file_compression)
+            compressed_path.write_bytes(compressor(file_bytes))
+            compressed_loader = Loader(str(compressed_path))
+
+            assert compressed_loader.file_name == loader.file_name + file_compression
+            assert compressed_loader.file_stem == loader.file_stem
+            assert compressed_loader.file_suffix == loader.file_suffix
+            assert compressed_loader.file_compression == file_compression
+            assert compressed_loader.file_data == loader.file_data
+
+            streaming_loader = Loader(str(compressed_path), {'streaming': True})
+            assert [
+                data_unit
+                for pedigree_data in streaming_loader.stream_file_data()
+                for data_unit in pedigree_data
+            ] == loader.file_data
+
+    assert Loader('../../Examples/PED Examples/Pedigree1.ped').file_compression == ''
+
+    compressed_path = tmp_path / 'Pedigree.zip.gz'
+    compressed_path.write_bytes(gzip.compress(b'data'))
+
+    with pytest.raises(SystemExit) as pytest_wrapped_error:
+        Loader(str(compressed_path))
+
+    assert pytest_wrapped_error.value.code == 2
+
+
+def test_loader_ranges_method():
+    """Test Loader Ranges Method."""
+    for file_path in [
+        '../../Examples/PED Examples/Pedigree1.ped',
+        '../../Examples/TXT Examples/Pedigree6.txt',
+        '../../Examples/TXT Examples/Pedigree7.txt',
+    ]:
+        loader = Loader(file_path, {'workers': 2, 'range_size': 64})
+
+        assert loader.file_data == Loader(file_path).file_data
+        assert list(loader.iterate_file_data()) == loader.file_data
+
+    for file_path in [
+        '../../Examples/PED Examples/Pedigree3.ped',
+        '../../Examples/TXT Examples/Pedigree5.txt',
+    ]:
+        with pytest.raises(SystemExit) as pytest_wrapped_error:
+            Loader(file_path, {'workers': 2, 'range_size': 64})
+
+        assert pytest_wrapped_error.value.code == 2
+
+
+def test_builder_streaming_method():
+    """Test Builder Streaming Method."""
+    loader = Loader('../../Examples/TXT Examples/Pedigree7.txt', {'streaming': True})
+    pedigrees = list(Builder.stream_file_pedigrees(loader.stream_file_data()))
+
+    assert len(pedigrees) == 1
+    assert pedigrees[0] == PedigreeFamily('ped1')
+    assert len(pedigrees[0].pedigree_individuals) == 14
+    assert pedigrees[0].max_generation_rank == 4
+
+
+def test_builder_fused_method():
+    """Test Builder Fused Method."""
+    for file_path in [
+        '../../Examples/CSV Examples/Pedigree1.csv',
+        '../../Examples/PED Examples/Pedigree1.ped',
+        '../../Examples/TXT Examples/Pedigree7.txt',
+    ]:
+        builder = Builder(Loader(file_path).file_data)
+        pedigrees = Builder.build_loader_pedigrees(Loader(file_path, {'streaming': True}))
+
+        assert pedigrees == builder.file_pedigrees
+        assert [
+            {
+                individual_identifier: individual.generation_rank
+                for individual_identifier, individual in pedigree.pedigree_individuals.items()
+            }
+            for pedigree in pedigrees
+        ] == [
+            {
+                individual_identifier: individual.generation_rank
+                for individual_identifier, individual in pedigree.pedigree_individuals.items()
+            }
+            for pedigree in builder.file_pedigrees
+        ]
+
+    with pytest.raises(AssertionError):
+        Builder.build_loader_pedigrees(Loader('../../Examples/PED Examples/Pedigree1.ped'))
+
+    with pytest.raises(SystemExit) as pytest_wrapped_error:
+        Builder.build_loader_pedigrees(
+            Loader('../../Examples/PED Examples/Pedigree7.ped', {'streaming': True})
+        )
+
+    assert pytest_wrapped_error.value.code == 1
+
+
+def test_builder_index_method():
+    """Test Builder Index Method."""
+    file_data = [
+        ['ped2', 'father', '0', '0', '1', '1', 'null'],
+        ['ped1', 'father', '0', '0', '1', '1', 'null'],
+        ['ped2', 'mother', '0', '0', '2', '1', 'null'],
+        ['ped1', 'mother', '0', '0', '2', '1', 'null'],
+        ['ped2', 'father', '0', '0', '1', '2', 'null'],
+        ['ped2', 'son', 'father', 'mother', '1', '2', 'prb'],
+        ['ped1', 'dau', 'father', 'mother', '2', '2', 'prb'],
+    ]
+    builder = Builder(file_data)
+
+    assert list(builder.pedigree_index) == ['ped2', 'ped1']
+    assert builder.file_pedigrees == list(builder.pedigree_index.values())
+    assert [repr(individual) for individual in builder.file_individuals] == \
+        ['father', 'father', 'mother', 'mother', 'son', 'dau']
+
+    assert builder.find_pedigree('ped1') is builder.file_pedigrees[1]
+    assert builder.find_pedigree('ped3') is None
+    assert builder.find_individual('ped2', 'father') is builder.file_individuals[0]
+    assert builder.find_individual('ped2', 'dau') is None
+    assert builder.find_individual('ped3', 'father') is None
+
+    pedigree_family = Builder.build_pedigree_family([file_data[0], file_data[2], file_data[4], file_data[5]])
+    assert pedigree_family.pedigree_individuals['father'].individual_status == \
+        builder.find_individual('ped2', 'father').individual_status
+
+
+def test_builder_parallel_method():
+    """Test Builder Parallel Method."""
+    pedigree_data = Loader('../../Examples/TXT Examples/Pedigree7.txt').file_data
+    file_data = [
+        ['ped{}'.format(pedigree)] + data_unit[1:]
+        for pedigree in range(40)
+        for data_unit in pedigree_data
+    ]
+    builder = Builder(file_data)
+    parallel_builder = Builder(file_data, 2, 3)
+    assert gc.isenabled()
+
+    assert parallel_builder.file_pedigrees == builder.file_pedigrees
+    assert list(parallel_builder.pedigree_index) == list(builder.pedigree_index)
+    assert parallel_builder.file_individuals == builder.file_individuals
+
+    for pedigree, parallel_pedigree in zip(builder.file_pedigrees, parallel_builder.file_pedigrees):
+        assert list(parallel_pedigree.pedigree_mating_units) == list(pedigree.pedigree_mating_units)
+        assert list(parallel_pedigree.pedigree_sibship_units) == list(pedigree.pedigree_sibship_units)
+        assert [
+            individual.generation_rank for individual in parallel_pedigree.pedigree_individuals.values()
+        ] == [
+            individual.generation_rank for individual in pedigree.pedigree_individuals.values()
+        ]
+        assert parallel_pedigree.encode_pedigree_structure() == pedigree.encode_pedigree_structure()
+        assert [
+            individual.mating_instances for individual in parallel_pedigree.pedigree_individuals.values()
+        ] == [
+            individual.mating_instances for individual in pedigree.pedigree_individuals.values()
+        ]
+        assert parallel_pedigree.adjacency_index.sibship_spouses == pedigree.adjacency_index.sibship_spouses
+
+    chain_data = [['chain', 'm0', '0', '0', '1', '1', 'null'], ['chain', 'f0', '0', '0', '2', '1', 'null']]
+
+    for generation in range(1, 150):
+        chain_data.append(['chain', 'f{}'.format(generation), '0', '0', '2', '1', 'null'])
+        chain_data.append([
+            'chain', 'm{}'.format(generation), 'm{}'.format(generation - 1),
+            'f{}'.format(generation - 1), '1', '2', 'prb' if generation == 149 else 'null'
+        ])
+
+    chain_pedigree = Builder(chain_data).file_pedigrees[0]
+    parallel_pedigree = Builder(chain_data, 2).file_pedigrees[0]
+
+    assert parallel_pedigree.max_generation_rank == chain_pedigree.max_generation_rank == 150
+    assert parallel_pedigree.min_generation_rank == chain_pedigree.min_generation_rank == 1
+    assert parallel_pedigree.encode_pedigree_structure() == chain_pedigree.encode_pedigree_structure()
+    assert [
+        len(parallel_pedigree.get_mating_units_by_generation(generation_rank))
+        for generation_rank in range(1, 151)
+    ] == [
+        len(chain_pedigree.get_mating_units_by_generation(generation_rank))
+        for generation_rank in range(1, 151)
+    ]
+
+    loader = Loader('../../Examples/TXT Examples/Pedigree7.txt', {'streaming': True, 'workers': 2})
+    assert Builder.build_loader_pedigrees(loader) == \
+        Builder(Loader('../../Examples/TXT Examples/Pedigree7.txt').file_data).file_pedigrees
+
+    with pytest.raises(SystemExit) as pytest_wrapped_error:
+        Builder(file_data, 0)
+
+    assert pytest_wrapped_error.value.code == 4
@@ -0,0 +1,136 @@
+# This Python file uses the following encoding: UTF-8
+
+"""Test module on the class ParseCache."""
+
+from unittest import mock
+
+import os
+import shutil
+import inspect
+import pytest
+
+from logic.pedigree_cache import ParseCache
+from logic.pedigree_table import PedigreeTable
+from logic.pedigree_builder import Loader
+
+
+@pytest.fixture(name='file_path')
+def fixture_file_path(tmp_path) -> str:
+    """Return a fixture of a copied valid pedigree file."""
+    file_path = str(tmp_path / 'Pedigree7.txt')
+    shutil.copy('../../Examples/TXT Examples/Pedigree7.txt', file_path)
+    return file_path
+
+
+@pytest.fixture(name='parse_cache')
+def fixture_parse_cache(tmp_path) -> ParseCache:
+    """Return a fixture of ParseCache class in a temporary directory."""
+    return ParseCache(str(tmp_path / 'cache'), 1 << 20)
+
+
+def test_cache_instances(parse_cache, tmp_path):
+    """Test ParseCache Class Instances."""
+    assert isinstance(parse_cache, ParseCache)
+    assert inspect.isclass(ParseCache)
+    assert parse_cache.cache_directory == tmp_path / 'cache'
+    assert parse_cache.cache_directory.is_dir()
+    assert parse_cache.maximum_size == 1 << 20
+
+
+def test_cache_constructor(tmp_path):
+    """Test ParseCache Class Constructor."""
+    with pytest.raises(AssertionError, match='The cache constructor arguments are not correct!'):
+        ParseCache(tmp_path, 1 << 20)
+
+    with pytest.raises(AssertionError, match='The cache constructor arguments are not correct!'):
+        ParseCache(str(tmp_path), 0)
+
+
+def test_cache_table_methods(parse_cache, file_path):
+    """Test ParseCache Table Methods."""
+    pedigree_table = PedigreeTable.build_table(Loader(file_path).file_data)
+
+    assert parse_cache.load_table(file_path) is None
+    parse_cache.store_table(file_path, pedigree_table)
+    assert list(parse_cache.load_table(file_path)) == list(pedigree_table)
+
+    parse_cache.invalidate(file_path)
+    assert parse_cache.load_table(file_path) is None
+
+    parse_cache.store_table(file_path, pedigree_table)
+    parse_cache.locate_entry(file_path).write_bytes(b'broken')
+    assert parse_cache.load_table(file_path) is None
+    assert not parse_cache.locate_entry(file_path).exists()
+
+    parse_cache.store_table(file_path, pedigree_table)
+
+    with open(file_path, 'a') as file:
+        file.write('\n')
+
+    assert parse_cache.load_table(file_path) is None
+    assert not parse_cache.locate_entry(file_path).exists()
+
+    parse_cache.store_table(file_path, pedigree_table)
+    parse_cache.clear()
+    assert parse_cache.collect_entries() == []
+
+
+def test_cache_eviction_method(tmp_path, file_path):
+    """Test ParseCache Eviction Method."""
+    pedigree_table = PedigreeTable.build_table(Loader(file_path).file_data)
+    parse_cache = ParseCache(str(tmp_path / 'cache'), 1)
+    file_paths = []
+
+    for index in range(3):
+        copied_path = str(tmp_path / 'Pedigree{}.txt'.format(index))
+        shutil.copy(file_path, copied_path)
+        parse_cache.store_table(copied_path, pedigree_table)
+        file_paths.append(copied_path)
+
+    assert parse_cache.collect_entries() == \
+        [parse_cache.locate_entry(file_paths[-1])]
+
+
+def test_loader_cache_method(tmp_path, file_path):
+    """Test Loader Cache Method."""
+    file_options = {'cache_directory': str(tmp_path / 'cache')}
+    loader1 = Loader(file_path, file_options)
+
+    with mock.patch.object(Loader, 'iterate_file_data') as iterate_method:
+        with mock.patch.object(Loader, 'validate_file_data') as validate_method:
+            loader2 = Loader(file_path, file_options)
+            loader3 = Loader(file_path, dict(file_options, columnar=True))
+
+    assert not iterate_method.called
+    assert not validate_method.called
+
+    assert loader2.file_data == loader1.file_data
+    assert isinstance(loader3.file_data, PedigreeTable)
+    assert list(loader3.file_data) == loader1.file_data
+
+    os.utime(file_path, ns=(0, 0))
+
+    with mock.patch.object(Loader, 'validate_file_data', return_value=[]) as validate_method:
+        loader4 = Loader(file_path, file_options)
+
+    assert validate_method.called
+    assert loader4.file_data == loader1.file_data
+
+
+def test_loader_cache_options(tmp_path):
+    """Test Loader Cache Options."""
+    file_path = str(tmp_path / 'Family.fam')
+    file_options = {'cache_directory': str(tmp_path / 'cache')}
+
+    with open(file_path, 'w') as file:
+        file.write('fam dad 0 0 1 1\nfam mom 0 0 2 2\nfam kid dad mom 1 1\n')
+
+    for proband_rule, proband_identifier in [('affected', 'mom'), ('first', 'dad'), ('affected', 'mom')]:
+        loader = Loader(file_path, dict(file_options, proband_rule=proband_rule))
+        assert [data_unit[1] for data_unit in loader.file_data if data_unit[6] == 'prb'] == [proband_identifier]
+
+    loader = Loader(file_path, dict(file_options, probands={'fam': 'kid'}))
+    assert [data_unit[1] for data_unit in loader.file_data if data_unit[6] == 'prb'] == ['kid']
+
+    assert ParseCache.build_file_key(file_path, {'proband_rule': 'first'}) != \
+        ParseCache.build_file_key(file_path, {'proband_rule': 'affected'})
@@ -0,0 +1,124 @@
+# This Python file uses the following encoding: UTF-8
+
+"""Test module on the functions for the layouts of the components."""
+
+import pickle
+import pytest
+
+from logic.pedigree_builder import Builder
+from logic.pedigree_layouter import Layout
+from logic.pedigree_units import Individual
+from logic.pedigree_composer import build_component_layout
+from logic.pedigree_composer import build_component_layouts
+from logic.pedigree_composer import encode_component_data
+from logic.pedigree_composer import solve_component_data
+from logic.pedigree_composer import decode_component_layout
+
+
+@pytest.fixture(name='component_lines')
+def fixture_component_lines() -> list:
+    """Return a fixture of the lines of a pedigree with two components."""
+    return [
+        ['ped1', 'father', '0', '0', '1', '1', 'null'],
+        ['ped1', 'mother', '0', '0', '2', '1', 'null'],
+        ['ped1', 'son', 'father', 'mother', '1', '2', 'prb'],
+        ['ped1', 'uncle', '0', '0', '1', '1', 'null'],
+        ['ped1', 'aunt', '0', '0', '2', '1', 'null'],
+        ['ped1', 'cousin1', 'uncle', 'aunt', '2', '1', 'null'],
+        ['ped1', 'cousin2', 'uncle', 'aunt', '1', '1', 'null'],
+    ]
+
+
+def collect_layout_positions(layout: Layout) -> list:
+    """Collect the identifiers and the coordinates of a layout."""
+    return [
+        [(str(shape.individual), shape.x_coordinate, shape.y_coordinate) for shape in level]
+        for level in layout.positions
+    ]
+
+
+def test_composer_layout_method(component_lines):
+    """Test Composer Layout Method."""
+    component_families = Builder.build_pedigree_family(component_lines).split_pedigree_components()
+    component_layout = build_component_layout(component_families[0])
+
+    assert isinstance(component_layout, Layout)
+    assert [[identifier for identifier, _, _ in level] for level in collect_layout_positions(component_layout)] == \
+        [['mother', 'father'], ['son']]
+
+
+def test_composer_layouts_method(component_lines):
+    """Test Composer Layouts Method."""
+    pedigree_family = Builder.build_pedigree_family(component_lines)
+    component_layouts = build_component_layouts(pedigree_family)
+    parallel_layouts = build_component_layouts(pedigree_family, 2)
+
+    assert len(component_layouts) == 2
+    assert sorted(identifier for level in collect_layout_positions(component_layouts[1])
+                  for identifier, _, _ in level) == ['aunt', 'cousin1', 'cousin2', 'uncle']
+    assert list(map(collect_layout_positions, parallel_layouts)) == \
+        list(map(collect_layout_positions, component_layouts))
+
+    connected_family = Builder.build_pedigree_family(component_lines[:3])
+    assert len(build_component_layouts(connected_family, 2)) == 1
+
+
+def build_chain_lines(number_generations: int) -> list:
+    """Build the lines of a chain of fathers and sons with founder wives."""
+    chain_lines = [['chain', 'm0', '0', '0', '1', '1', 'null'], ['chain', 'f0', '0', '0', '2', '1', 'null']]
+
+    for generation in range(1, number_generations):
+        chain_lines.append(['chain', 'f{}'.format(generation), '0', '0', '2', '1', 'null'])
+        chain_lines.append([
+            'chain', 'm{}'.format(generation), 'm{}'.format(generation - 1),
+            'f{}'.format(generation - 1), '1', '2', 'null'
+        ])
+
+    chain_lines[-1][6] = 'prb'
+    return chain_lines
+
+
+def test_composer_encoding_method(component_lines):
+    """Test Composer Encoding Method."""
+    chain_family = Builder.build_pedigree_family(build_chain_lines(150) + component_lines[3:])
+    component_families = chain_family.split_pedigree_components()
+    component_data = pickle.loads(pickle.dumps(encode_component_data(component_families[0])))
+    linked_family = Builder.link_pedigree_family(*component_data)
+
+    assert component_data[0][-1] == ['chain', 'm149', 'm148', 'f148', '1', '2', 'prb']
+    assert linked_family.encode_pedigree_structure() == component_families[0].encode_pedigree_structure()
+    assert list(linked_family.pedigree_mating_units) == list(component_families[0].pedigree_mating_units)
+    assert linked_family.max_generation_rank == 150
+
+    chain_family = Builder.build_pedigree_family(build_chain_lines(4) + component_lines[3:])
+    component_families = chain_family.split_pedigree_components()
+    encoded_intervals = solve_component_data(encode_component_data(component_families[0]))
+
+    assert all(isinstance(unit_kind, int) and isinstance(unit_key, str)
+               for unit_kind, unit_key, _, _ in encoded_intervals)
+    assert collect_layout_positions(decode_component_layout(component_families[0], encoded_intervals)) == \
+        collect_layout_positions(build_component_layout(component_families[0]))
+    assert list(map(collect_layout_positions, build_component_layouts(chain_family, 2))) == \
+        list(map(collect_layout_positions, build_component_layouts(chain_family)))
+    assert decode_component_layout(component_families[0], None) is None
+
+
+def test_composer_editing_method(component_lines):
+    """Test Composer Editing Method."""
+    pedigree_family = Builder.build_pedigree_family(component_lines)
+    pedigree_family.add_relative(Individual(['ped1', 'wife', '0', '0', '2', '1', 'null']))
+    change_set = pedigree_family.add_mating('son', 'wife')
+
+    assert pedigree_family.pedigree_sibship_units['SU(son, wife)'].generation_rank == 3
+    assert 'SU(son, wife)' in [str(unit) for unit in change_set.added_units]
+    assert sorted(identifier for level in collect_layout_positions(build_component_layouts(pedigree_family)[0])
+                  for identifier, _, _ in level) == ['father', 'mother', 'son', 'wife']
+
+    pedigree_family.add_relative(Individual(['ped1', 'grandson', 'son', 'wife', '1', '1', 'null']))
+    assert [[identifier for identifier, _, _ in level]
+            for level in collect_layout_positions(build_component_layouts(pedigree_family)[0])][-1] == ['grandson']
+
+    change_set = pedigree_family.remove_relative('grandson')
+    assert [str(unit) for unit in change_set.changed_units] == ['SU(son, wife)']
+    assert list(map(collect_layout_positions, build_component_layouts(pedigree_family, 2))) == \
+        list(map(collect_layout_positions, build_component_layouts(pedigree_family)))
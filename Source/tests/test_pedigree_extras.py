@@ -0,0 +1,105 @@
+# This Python file uses the following encoding: UTF-8
+
+"""Test module on the class ExtraColumns."""
+
+import gzip
+import inspect
+import pytest
+
+from logic.pedigree_builder import Loader
+from logic.pedigree_extras import ExtraColumns
+
+
+TAB_LINES = (
+    '#pedigree_identifier\t#individual_identifier\t#height\t#individual_father\t'
+    '#individual_mother\t#individual_sex\t#individual_status\t#individual_role\t#snp1\n'
+    'ped1\tfather\t180\t0\t0\t1\t1\tnull\tAA\n'
+    'ped1\tmother\t165\t0\t0\t2\t1\tnull\tAG\n'
+    'ped1\tson\t175\tfather\tmother\t1\t2\tprb\tGG\n'
+    '\n'
+)
+
+CSV_LINES = (
+    'pedigree_identifier,individual_identifier,individual_father,individual_mother,'
+    'individual_sex,individual_status,individual_role,note\n'
+    'ped1,father,0,0,1,1,null,"tall, dark"\n'
+    'ped1,mother,0,0,2,1,null,\n'
+    'ped1,son,father,mother,1,2,prb,young\n'
+)
+
+
+@pytest.fixture(name='tab_loader')
+def fixture_tab_loader(tmp_path) -> Loader:
+    """Return a fixture of a loader of a file with extra columns."""
+    file_path = tmp_path / 'Extra.ped'
+    file_path.write_text(TAB_LINES)
+    return Loader(str(file_path), {'extra_columns': True})
+
+
+def test_extras_instances(tab_loader):
+    """Test ExtraColumns Class Instances."""
+    extra_columns = ExtraColumns(tab_loader)
+
+    assert isinstance(extra_columns, ExtraColumns)
+    assert inspect.isclass(ExtraColumns)
+    assert extra_columns.loader is tab_loader
+    assert extra_columns.column_names == ['height', 'snp1']
+    assert extra_columns.decoded_columns == {}
+
+
+def test_extras_constructor(tmp_path):
+    """Test ExtraColumns Class Constructor."""
+    with pytest.raises(AssertionError, match='The extra constructor arguments are not correct!'):
+        ExtraColumns(None)
+
+    with pytest.raises(AssertionError, match='The extra constructor arguments are not correct!'):
+        ExtraColumns(Loader('../../Examples/PED Examples/Pedigree1.ped'))
+
+    (tmp_path / 'Extra.ped').write_text(TAB_LINES)
+
+    with pytest.raises(SystemExit) as pytest_wrapped_error:
+        Loader(str(tmp_path / 'Extra.ped'))
+
+    assert pytest_wrapped_error.value.code == 2
+
+
+def test_extras_loading_method(tab_loader):
+    """Test ExtraColumns Loading Method."""
+    assert tab_loader.file_data == [
+        ['ped1', 'father', '0', '0', '1', '1', 'null'],
+        ['ped1', 'mother', '0', '0', '2', '1', 'null'],
+        ['ped1', 'son', 'father', 'mother', '1', '2', 'prb'],
+    ]
+
+
+def test_extras_value_method(tab_loader):
+    """Test ExtraColumns Value Method."""
+    extra_columns = ExtraColumns(tab_loader)
+
+    assert extra_columns.get_value(2, 'snp1') == 'GG'
+    assert extra_columns.get_value(0, 'height') == '180'
+    assert extra_columns.decoded_columns == {}
+    assert list(extra_columns.index_line_offsets()) == [
+        TAB_LINES.index(name + '\t') for name in ['ped1\tfather', 'ped1\tmother', 'ped1\tson']
+    ]
+
+    with pytest.raises(ValueError, match='The column individual_sex is not an extra column!'):
+        extra_columns.get_value(0, 'individual_sex')
+
+
+def test_extras_column_method(tab_loader, tmp_path):
+    """Test ExtraColumns Column Method."""
+    extra_columns = ExtraColumns(tab_loader)
+
+    assert extra_columns.get_column('height') == ['180', '165', '175']
+    assert extra_columns.decoded_columns == {'height': ['180', '165', '175']}
+    assert extra_columns.get_value(1, 'height') == '165'
+
+    file_path = tmp_path / 'Extra.csv.gz'
+    file_path.write_bytes(gzip.compress(CSV_LINES.encode('utf-8')))
+    csv_columns = ExtraColumns(Loader(str(file_path), {'extra_columns': True}))
+
+    assert csv_columns.column_names == ['note']
+    assert csv_columns.get_value(2, 'note') == 'young'
+    assert csv_columns.decoded_columns == {'note': ['tall, dark', '', 'young']}
+    assert csv_columns.get_column('note') == ['tall, dark', '', 'young']
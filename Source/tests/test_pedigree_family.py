@@ -0,0 +1,330 @@
+# This Python file uses the following encoding: UTF-8
+
+"""Test module on the classes AdjacencyIndex, GenerationIndex, LineageIndex, ChangeSet and PedigreeFamily."""
+
+import inspect
+import pytest
+
+from logic.pedigree_builder import Builder
+from logic.pedigree_units import Individual
+from logic.pedigree_family import AdjacencyIndex
+from logic.pedigree_family import ChangeSet
+from logic.pedigree_family import GenerationIndex
+from logic.pedigree_family import LineageIndex
+from logic.pedigree_family import PedigreeFamily
+
+
+FAMILY_LINES = [
+    ['ped1', 'grandpa', '0', '0', '1', '1', 'null'],
+    ['ped1', 'grandma', '0', '0', '2', '1', 'null'],
+    ['ped1', 'father', 'grandpa', 'grandma', '1', '1', 'null'],
+    ['ped1', 'mother', '0', '0', '2', '1', 'null'],
+    ['ped1', 'second', '0', '0', '2', '1', 'null'],
+    ['ped1', 'son', 'father', 'mother', '1', '2', 'prb'],
+    ['ped1', 'dau', 'father', 'mother', '2', '1', 'null'],
+    ['ped1', 'half', 'father', 'second', '1', '1', 'null'],
+]
+
+DISCONNECTED_LINES = [
+    ['ped1', 'father', '0', '0', '1', '1', 'null'],
+    ['ped1', 'mother', '0', '0', '2', '1', 'null'],
+    ['ped1', 'son', 'father', 'mother', '1', '2', 'prb'],
+    ['ped1', 'uncle', '0', '0', '1', '1', 'null'],
+    ['ped1', 'aunt', '0', '0', '2', '1', 'null'],
+    ['ped1', 'cousin', 'uncle', 'aunt', '2', '1', 'null'],
+]
+
+
+def collect_family_structure(pedigree_family: PedigreeFamily) -> tuple:
+    """Collect the units of a pedigree with their relations and ranks."""
+    return (
+        sorted((str(individual), individual.generation_rank, sorted(map(str, individual.mating_instances)),
+                str(individual.sibship_unit_relation))
+               for individual in pedigree_family.pedigree_individuals.values()),
+        sorted((key, mating_unit.generation_rank)
+               for key, mating_unit in pedigree_family.pedigree_mating_units.items()),
+        sorted((key, sibship_unit.generation_rank, sorted(map(str, sibship_unit.siblings_individuals)),
+                sorted(map(str, sibship_unit.siblings_extended)))
+               for key, sibship_unit in pedigree_family.pedigree_sibship_units.items()),
+        pedigree_family.min_generation_rank,
+        pedigree_family.max_generation_rank,
+    )
+
+
+@pytest.fixture(name='pedigree_family')
+def fixture_pedigree_family() -> PedigreeFamily:
+    """Return a fixture of a pedigree with half siblings and spouses."""
+    return Builder.build_pedigree_family(FAMILY_LINES)
+
+
+def test_family_instances(pedigree_family):
+    """Test PedigreeFamily Class Instances."""
+    assert isinstance(pedigree_family, PedigreeFamily)
+    assert isinstance(pedigree_family.adjacency_index, AdjacencyIndex)
+    assert isinstance(pedigree_family.generation_index, GenerationIndex)
+    assert inspect.isclass(PedigreeFamily)
+    assert inspect.isclass(AdjacencyIndex)
+    assert inspect.isclass(GenerationIndex)
+    assert inspect.isclass(LineageIndex)
+    assert pedigree_family.lineage_index is None
+
+    with pytest.raises(AssertionError, match='The pedigree family constructor arguments are not correct!'):
+        PedigreeFamily(None)
+
+
+def test_family_adjacency_method(pedigree_family):
+    """Test PedigreeFamily Adjacency Method."""
+    adjacency_index = pedigree_family.adjacency_index
+    individuals = pedigree_family.pedigree_individuals
+
+    assert list(pedigree_family.pedigree_mating_units) == [
+        'MU(grandpa, grandma)', 'MU(father, mother)', 'MU(father, second)'
+    ]
+    assert [str(mating_unit) for mating_unit in adjacency_index.individual_matings['father']] == \
+        ['MU(father, mother)', 'MU(father, second)']
+    assert adjacency_index.get_individual_matings(individuals['son']) == []
+    assert adjacency_index.mating_sibships['MU(father, mother)'] is \
+        pedigree_family.pedigree_sibship_units['SU(father, mother)']
+    assert [str(child) for child in adjacency_index.sibship_children['SU(father, mother)']] == \
+        ['son', 'dau']
+    assert [str(spouse) for spouse in adjacency_index.sibship_spouses['SU(grandpa, grandma)']] == \
+        ['mother', 'second']
+
+
+def test_family_linking_method(pedigree_family):
+    """Test PedigreeFamily Linking Method."""
+    individuals = pedigree_family.pedigree_individuals
+    sibship_unit = pedigree_family.pedigree_sibship_units['SU(father, mother)']
+    mating_unit = pedigree_family.pedigree_mating_units['MU(father, mother)']
+
+    assert sibship_unit.siblings_individuals == [individuals['son'], individuals['dau']]
+    assert pedigree_family.pedigree_sibship_units['SU(grandpa, grandma)'].siblings_extended == \
+        [individuals['mother'], individuals['second']]
+    assert individuals['son'].mating_unit_relation is mating_unit
+    assert individuals['dau'].sibship_unit_relation is sibship_unit
+    assert mating_unit.sibship_unit_relation is sibship_unit
+    assert individuals['father'].mating_instances == [
+        mating_unit, pedigree_family.pedigree_mating_units['MU(father, second)']
+    ]
+    assert individuals['mother'].mating_instances == [mating_unit]
+    assert individuals['son'].mating_instances == []
+
+    pedigree_family.collect_mating_units_for_individuals()
+    assert len(individuals['father'].mating_instances) == 2
+
+
+def test_family_ranking_method(pedigree_family):
+    """Test PedigreeFamily Ranking Method."""
+    individuals = pedigree_family.pedigree_individuals
+
+    assert [individual.generation_rank for individual in individuals.values()] == [1, 1, 2, 2, 2, 3, 3, 3]
+    assert pedigree_family.min_generation_rank == 1
+    assert pedigree_family.max_generation_rank == 3
+    assert pedigree_family.pedigree_mating_units['MU(father, second)'].generation_rank == 2
+    assert pedigree_family.pedigree_sibship_units['SU(father, mother)'].generation_rank == 3
+    assert pedigree_family.collect_unreachable_individuals() == []
+
+
+def test_family_generation_method(pedigree_family):
+    """Test PedigreeFamily Generation Method."""
+    individuals = pedigree_family.pedigree_individuals
+
+    assert [str(individual) for individual in pedigree_family.get_individuals_by_generation(2)] == \
+        ['father', 'mother', 'second']
+    assert pedigree_family.get_individuals_by_generation(4) == []
+    assert [str(mating_unit) for mating_unit in pedigree_family.get_mating_units_by_generation(2)] == \
+        ['MU(father, mother)', 'MU(father, second)']
+    assert [str(sibship_unit) for sibship_unit in pedigree_family.get_sibship_units_by_generation(3)] == \
+        ['SU(father, mother)', 'SU(father, second)']
+    assert sorted(pedigree_family.generation_index.individual_generations) == [1, 2, 3]
+
+    pedigree_family.change_generation_rank(individuals['half'], 4)
+    assert [str(individual) for individual in pedigree_family.get_individuals_by_generation(3)] == ['son', 'dau']
+    assert pedigree_family.get_individuals_by_generation(4) == [individuals['half']]
+    assert pedigree_family.max_generation_rank == 4
+
+    pedigree_family.change_generation_rank(individuals['grandpa'], 2)
+    pedigree_family.change_generation_rank(individuals['grandma'], 2)
+    assert 1 not in pedigree_family.generation_index.individual_generations
+    assert pedigree_family.min_generation_rank == 2
+
+
+def test_family_addition_method(pedigree_family):
+    """Test PedigreeFamily Addition Method."""
+    partial_family = Builder.build_pedigree_family(FAMILY_LINES[:4] + FAMILY_LINES[5:7])
+
+    change_set = partial_family.add_relative(Individual(FAMILY_LINES[4]))
+    assert isinstance(change_set, ChangeSet)
+    assert change_set.added_units == [partial_family.pedigree_individuals['second']]
+    assert partial_family.pedigree_individuals['second'].generation_rank is None
+
+    change_set = partial_family.add_relative(Individual(FAMILY_LINES[7]))
+    mating_unit = partial_family.pedigree_mating_units['MU(father, second)']
+    assert [str(unit) for unit in change_set.added_units] == ['half', 'MU(father, second)', 'SU(father, second)']
+    assert [str(unit) for unit in change_set.changed_units] == ['father', 'SU(grandpa, grandma)', 'second']
+    assert change_set.removed_units == []
+    assert mating_unit.generation_rank == 2
+    assert partial_family.get_individuals_by_generation(3)[-1] is partial_family.pedigree_individuals['half']
+    assert collect_family_structure(partial_family) == collect_family_structure(pedigree_family)
+
+    with pytest.raises(ValueError, match='The individual half cannot be added to the pedigree!'):
+        partial_family.add_relative(Individual(FAMILY_LINES[7]))
+
+    with pytest.raises(ValueError, match='The individual nobody cannot be added to the pedigree!'):
+        partial_family.add_relative(Individual(['ped1', 'nobody', 'father', 'third', '1', '1', 'null']))
+
+
+def test_family_removal_method(pedigree_family):
+    """Test PedigreeFamily Removal Method."""
+    with pytest.raises(ValueError, match='The individual second has matings in the pedigree!'):
+        pedigree_family.remove_relative('second')
+
+    with pytest.raises(ValueError, match='The mating unit MU\\(father, second\\) has children in the pedigree!'):
+        pedigree_family.remove_mating('father', 'second')
+
+    change_set = pedigree_family.remove_relative('half')
+    assert [str(unit) for unit in change_set.removed_units] == ['half']
+    assert [str(unit) for unit in change_set.changed_units] == ['SU(father, second)']
+
+    change_set = pedigree_family.remove_mating('father', 'second')
+    assert [str(unit) for unit in change_set.removed_units] == ['MU(father, second)', 'SU(father, second)']
+    assert [str(unit) for unit in change_set.changed_units] == ['father', 'SU(grandpa, grandma)', 'second']
+    assert pedigree_family.get_mating_units_by_generation(2) == [pedigree_family.pedigree_mating_units['MU(father, mother)']]
+
+    pedigree_family.remove_relative('second')
+    assert collect_family_structure(pedigree_family)[:3] == collect_family_structure(
+        Builder.build_pedigree_family(FAMILY_LINES[:4] + FAMILY_LINES[5:7])
+    )[:3]
+
+    with pytest.raises(ValueError, match='The mates father and second do not have a mating unit in the pedigree!'):
+        pedigree_family.remove_mating('father', 'second')
+
+    with pytest.raises(ValueError, match='The individual second is not in the pedigree!'):
+        pedigree_family.remove_relative('second')
+
+
+def test_family_mating_method(pedigree_family):
+    """Test PedigreeFamily Mating Method."""
+    pedigree_family.add_relative(Individual(['ped1', 'third', '0', '0', '2', '1', 'null']))
+    change_set = pedigree_family.add_mating('son', 'third')
+
+    assert [str(unit) for unit in change_set.added_units] == ['MU(son, third)', 'SU(son, third)']
+    assert [str(unit) for unit in change_set.changed_units] == ['son', 'SU(father, mother)', 'third']
+    assert pedigree_family.pedigree_individuals['third'].generation_rank == 3
+    assert pedigree_family.pedigree_sibship_units['SU(father, mother)'].siblings_extended[-1] is \
+        pedigree_family.pedigree_individuals['third']
+    assert not pedigree_family.add_mating('son', 'third')
+
+    change_set = pedigree_family.add_relative(Individual(['ped1', 'grandson', 'son', 'third', '1', '1', 'null']))
+    assert pedigree_family.max_generation_rank == 4
+    assert pedigree_family.pedigree_sibship_units['SU(son, third)'].generation_rank == 4
+    assert [str(unit) for unit in change_set.changed_units] == ['SU(son, third)']
+
+    with pytest.raises(ValueError, match='The mates son and fourth are not in the pedigree!'):
+        pedigree_family.add_mating('son', 'fourth')
+
+
+def test_family_unreachable_method():
+    """Test PedigreeFamily Unreachable Method."""
+    pedigree_index = {}
+
+    for data_unit in DISCONNECTED_LINES:
+        Builder.add_file_unit(pedigree_index, data_unit)
+
+    pedigree_family = pedigree_index['ped1']
+    pedigree_family.build_mating_units()
+    pedigree_family.build_sibship_units()
+
+    with pytest.raises(ValueError, match='The individuals uncle, aunt, cousin are not reachable from the proband!'):
+        pedigree_family.build_generation_rank()
+
+
+def test_family_component_method():
+    """Test PedigreeFamily Component Method."""
+    pedigree_family = Builder.build_pedigree_family(DISCONNECTED_LINES)
+    individuals = pedigree_family.pedigree_individuals
+    pedigree_components = pedigree_family.split_pedigree_components()
+
+    assert [[str(individual) for individual in component] for component in pedigree_family.find_pedigree_components()] == \
+        [['father', 'mother', 'son'], ['uncle', 'aunt', 'cousin']]
+    assert [list(component.pedigree_individuals) for component in pedigree_components] == \
+        [['father', 'mother', 'son'], ['uncle', 'aunt', 'cousin']]
+    assert list(pedigree_components[1].pedigree_mating_units) == ['MU(uncle, aunt)']
+    assert pedigree_components[1].pedigree_sibship_units['SU(uncle, aunt)'] is \
+        pedigree_family.pedigree_sibship_units['SU(uncle, aunt)']
+    assert pedigree_components[1].get_individuals_by_generation(2) == [individuals['cousin']]
+    assert [individual.generation_rank for individual in individuals.values()] == [1, 1, 2, 1, 1, 2]
+    assert pedigree_family.get_individuals_by_generation(1) == \
+        [individuals['father'], individuals['mother'], individuals['uncle'], individuals['aunt']]
+    assert pedigree_family.max_generation_rank == 2
+
+    connected_family = Builder.build_pedigree_family(FAMILY_LINES)
+    assert connected_family.split_pedigree_components()[0] is connected_family
+
+
+def test_family_lineage_method(pedigree_family):
+    """Test PedigreeFamily Lineage Method."""
+    lineage_index = pedigree_family.build_lineage_index()
+
+    assert isinstance(lineage_index, LineageIndex)
+    assert pedigree_family.lineage_index is lineage_index
+    assert [str(individual) for individual in lineage_index.bit_individuals] == \
+        ['grandpa', 'grandma', 'mother', 'second', 'father', 'son', 'dau', 'half']
+    assert lineage_index.is_ancestor('grandpa', 'son')
+    assert not lineage_index.is_ancestor('mother', 'half')
+    assert not lineage_index.is_ancestor('son', 'grandpa')
+    assert [str(individual) for individual in lineage_index.get_ancestors('half')] == \
+        ['grandpa', 'grandma', 'second', 'father']
+    assert [str(individual) for individual in lineage_index.get_descendants('grandpa')] == \
+        ['father', 'son', 'dau', 'half']
+    assert [str(individual) for individual in lineage_index.get_common_ancestors('son', 'half')] == \
+        ['grandpa', 'grandma', 'father']
+    assert [str(individual) for individual in lineage_index.get_lineage_founders('son')] == \
+        ['grandpa', 'grandma', 'mother']
+    assert lineage_index.is_founder_lineage('second', 'half')
+    assert not lineage_index.is_founder_lineage('second', 'son')
+    assert not lineage_index.is_founder_lineage('father', 'son')
+
+    with pytest.raises(ValueError, match='The individual nobody is not in the lineage index!'):
+        lineage_index.is_ancestor('nobody', 'son')
+
+
+def test_family_lineage_update_method(pedigree_family):
+    """Test PedigreeFamily Lineage Update Method."""
+    lineage_index = pedigree_family.build_lineage_index()
+
+    pedigree_family.add_relative(Individual(['ped1', 'wife', '0', '0', '2', '1', 'null']))
+    pedigree_family.add_relative(Individual(['ped1', 'baby', 'son', 'wife', '1', '1', 'null']))
+
+    assert lineage_index.is_ancestor('grandpa', 'baby')
+    assert lineage_index.is_founder_lineage('wife', 'baby')
+    assert [str(individual) for individual in lineage_index.get_descendants('mother')] == ['son', 'dau', 'baby']
+    assert [str(individual) for individual in lineage_index.get_lineage_founders('baby')] == \
+        ['grandpa', 'grandma', 'mother', 'wife']
+
+    rebuilt_index = LineageIndex(list(pedigree_family.pedigree_individuals.values()))
+
+    for identifier in pedigree_family.pedigree_individuals:
+        assert sorted(map(str, lineage_index.get_descendants(identifier))) == \
+            sorted(map(str, rebuilt_index.get_descendants(identifier)))
+        assert sorted(map(str, lineage_index.get_ancestors(identifier))) == \
+            sorted(map(str, rebuilt_index.get_ancestors(identifier)))
+
+    pedigree_family.remove_relative('baby')
+    assert [str(individual) for individual in lineage_index.get_descendants('mother')] == ['son', 'dau']
+    assert [str(individual) for individual in lineage_index.get_descendants('wife')] == []
+
+    with pytest.raises(ValueError, match='The individual baby is not in the lineage index!'):
+        pedigree_family.lineage_index.get_ancestors('baby')
+
+    lineage_index.remove_individual('dau')
+    with pytest.raises(ValueError, match='The individual dau is not in the lineage index!'):
+        pedigree_family.remove_relative('dau')
+
+    assert 'dau' in pedigree_family.pedigree_individuals
+    assert pedigree_family.pedigree_individuals['dau'] in \
+        pedigree_family.pedigree_individuals['son'].sibship_unit_relation.siblings_individuals
+    assert 'dau' in pedigree_family.generation_index.individual_generations[3]
+
+    with pytest.raises(ValueError, match='The individual mother has descendants in the lineage index!'):
+        LineageIndex(list(pedigree_family.pedigree_individuals.values())).remove_individual('mother')
@@ -0,0 +1,143 @@
+# This Python file uses the following encoding: UTF-8
+
+"""Test module on the class Follower."""
+
+import gzip
+import inspect
+import pytest
+
+from logic.pedigree_builder import Loader
+from logic.pedigree_follower import Follower
+
+
+HEADER_LINE = '#pedigree_identifier\t#individual_identifier\t#individual_father\t' \
+    '#individual_mother\t#individual_sex\t#individual_status\t#individual_role\n'
+
+
+def write_family(file_path, pedigree_identifier: str, members=('father', 'mother', 'son')):
+    """Append the lines of a nuclear family to the file."""
+    family_lines = {
+        'father': '{}\tfather\t0\t0\t1\t1\tprb\n',
+        'mother': '{}\tmother\t0\t0\t2\t1\tnull\n',
+        'son': '{}\tson\tfather\tmother\t1\t1\tnull\n',
+        'dau': '{}\tdau\tfather\tmother\t2\t1\tnull\n',
+    }
+
+    with open(file_path, 'a') as file:
+        for member in members:
+            file.write(family_lines[member].format(pedigree_identifier))
+
+
+@pytest.fixture(name='file_path')
+def fixture_file_path(tmp_path):
+    """Return a fixture of a pedigree file with only a header."""
+    file_path = tmp_path / 'Growing.ped'
+    file_path.write_text(HEADER_LINE)
+    return file_path
+
+
+@pytest.fixture(name='follower')
+def fixture_follower(file_path) -> Follower:
+    """Return a fixture of Follower class on a growing file."""
+    return Follower(Loader(str(file_path), {'streaming': True}))
+
+
+def test_follower_instances(follower):
+    """Test Follower Class Instances."""
+    assert isinstance(follower, Follower)
+    assert inspect.isclass(Follower)
+    assert isinstance(follower.loader, Loader)
+    assert follower.file_offset == 0
+    assert follower.pedigree_violations == {}
+
+
+def test_follower_constructor(file_path, tmp_path):
+    """Test Follower Class Constructor."""
+    with pytest.raises(AssertionError, match='The follower constructor arguments are not correct!'):
+        Follower(str(file_path))
+
+    with pytest.raises(AssertionError, match='The follower constructor arguments are not correct!'):
+        Follower(Loader('../../Examples/PED Examples/Pedigree1.ped'))
+
+    compressed_path = tmp_path / 'Growing.ped.gz'
+    compressed_path.write_bytes(gzip.compress(HEADER_LINE.encode('utf-8')))
+
+    with pytest.raises(AssertionError, match='The follower constructor arguments are not correct!'):
+        Follower(Loader(str(compressed_path), {'streaming': True}))
+
+    headerless_path = tmp_path / 'Growing.fam'
+    headerless_path.write_text('fam dad 0 0 1 1\n')
+
+    with pytest.raises(AssertionError, match='The follower constructor arguments are not correct!'):
+        Follower(Loader(str(headerless_path), {'streaming': True}))
+
+
+def test_follower_poll_method(follower, file_path):
+    """Test Follower Poll Method."""
+    assert follower.poll() == []
+    assert follower.file_offset == len(HEADER_LINE)
+
+    write_family(file_path, 'ped1')
+    write_family(file_path, 'ped2', ('father', 'mother'))
+
+    pedigrees = follower.poll()
+    assert [pedigree.pedigree_identifier for pedigree in pedigrees] == ['ped1']
+    assert list(pedigrees[0].pedigree_individuals) == ['father', 'mother', 'son']
+    assert follower.pedigree_violations == {
+        'ped2': ['Line 5: The pedigree ped2 has less than 3 individuals!']
+    }
+    assert follower.poll() == []
+
+    with open(file_path, 'a') as file:
+        file.write('\nped2\tson\tfather\tmother\t1\t1\tnu')
+
+    assert follower.poll() == []
+    offset = follower.file_offset
+
+    with open(file_path, 'a') as file:
+        file.write('ll\n')
+
+    write_family(file_path, 'ped1', ('dau',))
+
+    pedigrees = follower.poll()
+    assert follower.file_offset > offset
+    assert [pedigree.pedigree_identifier for pedigree in pedigrees] == ['ped2', 'ped1']
+    assert list(pedigrees[1].pedigree_individuals) == ['father', 'mother', 'son', 'dau']
+    assert follower.pedigree_violations == {}
+
+    file_path.write_text(HEADER_LINE)
+    write_family(file_path, 'ped3')
+
+    pedigrees = follower.poll()
+    assert [pedigree.pedigree_identifier for pedigree in pedigrees] == ['ped3']
+
+
+def test_follower_error_method(follower, file_path):
+    """Test Follower Error Method."""
+    write_family(file_path, 'ped1', ('father', 'mother'))
+
+    with open(file_path, 'a') as file:
+        file.write('ped1\tson\n')
+
+    with pytest.raises(ValueError, match='The line 4 has a missing value!'):
+        follower.poll()
+
+    with pytest.raises(ValueError, match='The line 4 has a missing value!'):
+        follower.poll()
+
+
+def test_follower_follow_method(follower, file_path):
+    """Test Follower Follow Method."""
+    write_family(file_path, 'ped1')
+    write_family(file_path, 'ped2')
+
+    pedigrees = list(follower.follow(0.0, 2))
+    assert [pedigree.pedigree_identifier for pedigree in pedigrees] == ['ped1', 'ped2']
+
+    with open(file_path, 'a') as file:
+        file.write('ped3\tson\n')
+
+    with pytest.raises(SystemExit) as pytest_wrapped_error:
+        list(follower.follow(0.0, 1))
+
+    assert pytest_wrapped_error.value.code == 2
@@ -0,0 +1,142 @@
+# This Python file uses the following encoding: UTF-8
+
+"""Test module on the classes FamReader and LinkageReader."""
+
+import io
+import gzip
+import inspect
+import pytest
+
+from logic.pedigree_builder import Loader
+from logic.pedigree_builder import Builder
+from logic.pedigree_batch import BatchLoader
+from logic.pedigree_formats import FORMAT_READERS
+from logic.pedigree_formats import FormatReader
+from logic.pedigree_formats import FamReader
+from logic.pedigree_formats import LinkageReader
+from logic.pedigree_formats import find_format_reader
+
+
+FAM_LINES = (
+    b'fam1 father 0 0 1 1\n'
+    b'fam1 mother 0 0 2 -9\n'
+    b'fam1 son father mother 1 2\n'
+    b'fam1 dau father mother 2 2\n'
+    b'fam2 father 0 0 1 1\n'
+    b'fam2 mother 0 0 2 1\n'
+    b'fam2 son father mother 1 1\n'
+)
+
+LINKAGE_LINES = (
+    b'1\t1\t0\t0\t1\t1\t1 2\t3 3\n'
+    b'1\t2\t0\t0\t2\t0\t1 1\t3 4\n'
+    b'1\t3\t1\t2\t2\t2\t1 1\t3 3\n'
+)
+
+
+def test_formats_instances():
+    """Test FormatReader Class Instances."""
+    fam_reader = FamReader({})
+
+    assert isinstance(fam_reader, FormatReader)
+    assert inspect.isclass(FamReader)
+    assert inspect.isclass(LinkageReader)
+    assert fam_reader.reader_options == {}
+    assert FORMAT_READERS['.fam'] is FamReader
+    assert FORMAT_READERS['.pre'] is LinkageReader
+    assert find_format_reader('.FAM') is FamReader
+    assert find_format_reader('.ped') is None
+    assert inspect.isabstract(FormatReader)
+
+    with pytest.raises(TypeError):
+        FormatReader({})
+
+
+def test_formats_constructor():
+    """Test FormatReader Class Constructor."""
+    with pytest.raises(AssertionError, match='The reader constructor arguments are not correct!'):
+        FamReader(None)
+
+    with pytest.raises(AssertionError, match='The proband options are not correct!'):
+        FamReader({'proband_rule': 'last'})
+
+    with pytest.raises(AssertionError, match='The proband options are not correct!'):
+        FamReader({'probands': ['fam1']})
+
+
+def test_formats_fam_method():
+    """Test FamReader Reading Method."""
+    assert list(FamReader({}).read_lines(io.BytesIO(FAM_LINES))) == [
+        ['fam1', 'father', '0', '0', '1', '1', 'null'],
+        ['fam1', 'mother', '0', '0', '2', '0', 'null'],
+        ['fam1', 'son', 'father', 'mother', '1', '2', 'prb'],
+        ['fam1', 'dau', 'father', 'mother', '2', '2', 'null'],
+        ['fam2', 'father', '0', '0', '1', '1', 'prb'],
+        ['fam2', 'mother', '0', '0', '2', '1', 'null'],
+        ['fam2', 'son', 'father', 'mother', '1', '1', 'null'],
+    ]
+
+    fam_reader = FamReader({'proband_rule': 'first', 'probands': {'fam2': 'son'}})
+    assert [
+        data_unit[1] for data_unit in fam_reader.read_lines(io.BytesIO(FAM_LINES))
+        if data_unit[6] == 'prb'
+    ] == ['father', 'son']
+
+    interleaved_lines = FAM_LINES + b'fam1 other 0 0 2 2\n'
+    assert [
+        data_unit[1] for data_unit in FamReader({}).read_lines(io.BytesIO(interleaved_lines))
+        if data_unit[6] == 'prb'
+    ] == ['son', 'father']
+
+
+def test_formats_error_method():
+    """Test FamReader Error Method."""
+    assert len(list(FamReader({}).read_lines(io.BytesIO(FAM_LINES + b'\n\n')))) == 7
+
+    for file_lines, line_number in [
+        (FAM_LINES + b'fam2 dau father mother 2\n', 8),
+        (b'fam1 father 0 0 1 1\n\nfam1 mother 0 0 2 1\n', 2),
+    ]:
+        with pytest.raises(ValueError, match='The line {} has a missing value!'.format(line_number)):
+            list(FamReader({}).read_lines(io.BytesIO(file_lines)))
+
+
+def test_formats_linkage_method():
+    """Test LinkageReader Reading Method."""
+    assert list(LinkageReader({}).read_lines(io.BytesIO(LINKAGE_LINES))) == [
+        ['1', '1', '0', '0', '1', '1', 'null'],
+        ['1', '2', '0', '0', '2', '0', 'null'],
+        ['1', '3', '1', '2', '2', '2', 'prb'],
+    ]
+
+
+def test_loader_formats_method(tmp_path):
+    """Test Loader Formats Method."""
+    (tmp_path / 'Pedigree.fam').write_bytes(FAM_LINES)
+    (tmp_path / 'Pedigree.pre.gz').write_bytes(gzip.compress(LINKAGE_LINES))
+
+    loader = Loader(str(tmp_path / 'Pedigree.fam'))
+    assert len(loader.file_data) == 7
+    assert [pedigree.pedigree_identifier for pedigree in Builder(loader.file_data).file_pedigrees] == \
+        ['fam1', 'fam2']
+
+    streaming_loader = Loader(str(tmp_path / 'Pedigree.fam'), {'streaming': True})
+    assert list(streaming_loader.stream_file_data()) == \
+        [loader.file_data[:4], loader.file_data[4:]]
+
+    assert Loader(str(tmp_path / 'Pedigree.pre.gz')).file_data == \
+        list(LinkageReader({}).read_lines(io.BytesIO(LINKAGE_LINES)))
+
+    batch_data = list(BatchLoader(str(tmp_path)).stream_batch_data())
+    assert [file_data for _, file_data in batch_data] == \
+        [loader.file_data, Loader(str(tmp_path / 'Pedigree.pre.gz')).file_data]
+
+    first_options = {'proband_rule': 'first'}
+    batch_data = list(BatchLoader(str(tmp_path / '*.fam'), 1, first_options).stream_batch_data())
+    assert batch_data[0][1] == Loader(str(tmp_path / 'Pedigree.fam'), first_options).file_data
+    assert batch_data[0][1] != loader.file_data
+
+    with pytest.raises(SystemExit) as pytest_wrapped_error:
+        Loader(str(tmp_path / 'Pedigree.fam'), {'probands': {'fam1': 'other'}})
+
+    assert pytest_wrapped_error.value.code == 1
@@ -0,0 +1,149 @@
+# This Python file uses the following encoding: UTF-8
+
+"""Test module on the class OffsetIndex."""
+
+from unittest import mock
+
+import os
+import json
+import shutil
+import inspect
+import pytest
+
+from logic.pedigree_builder import Loader
+from logic.pedigree_index import OffsetIndex
+
+
+@pytest.fixture(name='file_path')
+def fixture_file_path(tmp_path) -> str:
+    """Return a fixture of a file with interleaved pedigrees."""
+    file_path = tmp_path / 'Interleaved.ped'
+    file_path.write_bytes(
+        b'#pedigree_identifier\t#individual_identifier\t#individual_father\t'
+        b'#individual_mother\t#individual_sex\t#individual_status\t#individual_role\n'
+        b'ped1\tfather\t0\t0\t1\t1\tprb\n'
+        b'ped1\tmother\t0\t0\t2\t1\tnull\r\n'
+        b'ped2\tfather\t0\t0\t1\t1\tprb\n'
+        b'ped2\tmother\t0\t0\t2\t1\tnull\n'
+        b'ped2\tson\tfather\tmother\t1\t1\tnull\n'
+        b'ped1\tdau\tfather\tmother\t2\t1\tnull\n'
+        b'ped3\tfather\t0\t0\t1\t1\tnull\n'
+        b'\n'
+    )
+    return str(file_path)
+
+
+@pytest.fixture(name='offset_index')
+def fixture_offset_index(file_path) -> OffsetIndex:
+    """Return a fixture of OffsetIndex class on the interleaved file."""
+    return OffsetIndex(Loader(file_path, {'streaming': True}))
+
+
+def test_index_instances(offset_index, file_path):
+    """Test OffsetIndex Class Instances."""
+    assert isinstance(offset_index, OffsetIndex)
+    assert inspect.isclass(OffsetIndex)
+    assert isinstance(offset_index.loader, Loader)
+    assert offset_index.index_path == file_path + '.index'
+    assert os.path.isfile(offset_index.index_path)
+
+
+def test_index_constructor(file_path, tmp_path):
+    """Test OffsetIndex Class Constructor."""
+    with pytest.raises(AssertionError, match='The index constructor arguments are not correct!'):
+        OffsetIndex(file_path)
+
+    with pytest.raises(AssertionError, match='The index constructor arguments are not correct!'):
+        OffsetIndex(Loader('../../Examples/PED Examples/Pedigree1.ped'))
+
+    headerless_path = tmp_path / 'Family.pre'
+    headerless_path.write_text('fam dad 0 0 1 1\nfam mom 0 0 2 2\nfam kid dad mom 1 1\n')
+
+    with pytest.raises(AssertionError, match='The index constructor arguments are not correct!'):
+        OffsetIndex(Loader(str(headerless_path), {'streaming': True}))
+
+
+def test_index_ranges(offset_index):
+    """Test OffsetIndex Ranges."""
+    assert offset_index.pedigree_ranges == {
+        'ped1': [[134, 184, 2], [265, 297, 7]],
+        'ped2': [[184, 265, 4]],
+        'ped3': [[297, 322, 8]],
+    }
+
+    with open(offset_index.index_path, encoding='utf-8') as index_file:
+        index_data = json.load(index_file)
+
+    assert index_data['file_key'] == offset_index.build_file_key()
+    assert index_data['pedigree_ranges'] == offset_index.pedigree_ranges
+
+
+def test_index_reading_method(offset_index, file_path):
+    """Test OffsetIndex Reading Method."""
+    assert offset_index.read_pedigree_data('ped2') == [
+        ['ped2', 'father', '0', '0', '1', '1', 'prb'],
+        ['ped2', 'mother', '0', '0', '2', '1', 'null'],
+        ['ped2', 'son', 'father', 'mother', '1', '1', 'null'],
+    ]
+    assert [data_unit[1] for data_unit in offset_index.read_pedigree_data('ped1')] == \
+        ['father', 'mother', 'dau']
+
+    with pytest.raises(ValueError, match='The pedigree ped4 is not in the file!'):
+        offset_index.read_pedigree_data('ped4')
+
+    with pytest.raises(AssertionError, match='Line 8: The pedigree ped3 has less than 3 individuals!'):
+        offset_index.read_pedigree_data('ped3')
+
+    assert list(offset_index.stream_pedigree_data(['ped2', 'ped1'])) == [
+        offset_index.read_pedigree_data('ped2'),
+        offset_index.read_pedigree_data('ped1'),
+    ]
+
+    with pytest.raises(SystemExit) as pytest_wrapped_error:
+        list(offset_index.stream_pedigree_data(['ped1', 'ped3']))
+
+    assert pytest_wrapped_error.value.code == 1
+
+
+def test_index_rebuilding_method(offset_index, file_path, tmp_path):
+    """Test OffsetIndex Rebuilding Method."""
+    with mock.patch.object(OffsetIndex, 'build_index') as build_method:
+        OffsetIndex(Loader(file_path, {'streaming': True}))
+
+    assert not build_method.called
+
+    with open(file_path, 'ab') as file:
+        file.write(b'ped4\tfather\t0\t0\t1\t1\tprb\n')
+
+    rebuilt_index = OffsetIndex(Loader(file_path, {'streaming': True}))
+    assert rebuilt_index.pedigree_ranges['ped4'] == [[323, 347, 10]]
+
+    with open(file_path, 'ab') as file:
+        file.write(b'ped5\tfather\n')
+
+    with pytest.raises(ValueError, match='The line 11 has a missing value!'):
+        OffsetIndex(Loader(file_path, {'streaming': True})).read_pedigree_data('ped5')
+
+    csv_path = str(tmp_path / 'Pedigree1.csv')
+    shutil.copy('../../Examples/CSV Examples/Pedigree1.csv', csv_path)
+    csv_index = OffsetIndex(Loader(csv_path, {'streaming': True}))
+
+    assert list(csv_index.pedigree_ranges) == ['ped']
+    assert csv_index.read_pedigree_data('ped') == Loader(csv_path).file_data
+
+
+def test_index_separator_method(tmp_path):
+    """Test OffsetIndex Separator Method."""
+    file_path = tmp_path / 'Separators.ped'
+    file_path.write_bytes(
+        b'#pedigree_identifier\t#individual_identifier\t#individual_father\t'
+        b'#individual_mother\t#individual_sex\t#individual_status\t#individual_role\n'
+        b'ped1\tfather\t0\t0\t1\t1\tprb\r\r\n'
+        b'ped1\tmother\t0\t0\t2\t1\tnull\n'
+        b'ped1\tson\tfather\tmother\t1\t1\tnull\n'
+        b'\n'
+    )
+    offset_index = OffsetIndex(Loader(str(file_path), {'streaming': True}))
+
+    assert offset_index.read_pedigree_data('ped1') == Loader(str(file_path)).file_data
+    assert [data_unit[1] for data_unit in offset_index.read_pedigree_data('ped1')] == ['father', 'mother', 'son']
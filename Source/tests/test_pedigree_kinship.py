@@ -0,0 +1,120 @@
+# This Python file uses the following encoding: UTF-8
+
+"""Test module on the class KinshipMatrix."""
+
+import inspect
+import numpy as np
+import pytest
+
+from logic.pedigree_builder import Builder
+from logic.pedigree_kinship import KinshipMatrix
+
+
+@pytest.fixture(name='pedigree_family')
+def fixture_pedigree_family():
+    """Return a fixture of a pedigree with matings of relatives."""
+    return Builder.build_pedigree_family([
+        ['ped1', 'grandpa', '0', '0', '1', '1', 'null'],
+        ['ped1', 'grandma', '0', '0', '2', '1', 'null'],
+        ['ped1', 'uncle', 'grandpa', 'grandma', '1', '1', 'null'],
+        ['ped1', 'aunt', 'grandpa', 'grandma', '2', '1', 'null'],
+        ['ped1', 'wife', '0', '0', '2', '1', 'null'],
+        ['ped1', 'husband', '0', '0', '1', '1', 'null'],
+        ['ped1', 'cousin1', 'uncle', 'wife', '1', '1', 'null'],
+        ['ped1', 'cousin2', 'husband', 'aunt', '2', '1', 'null'],
+        ['ped1', 'proband', 'cousin1', 'cousin2', '1', '2', 'prb'],
+        ['ped1', 'niece', 'husband', 'aunt', '2', '1', 'null'],
+        ['ped1', 'inbred', 'uncle', 'niece', '2', '1', 'null'],
+    ])
+
+
+def test_kinship_instances(pedigree_family):
+    """Test KinshipMatrix Class Instances."""
+    kinship_matrix = pedigree_family.build_kinship_matrix()
+
+    assert isinstance(kinship_matrix, KinshipMatrix)
+    assert inspect.isclass(KinshipMatrix)
+    assert kinship_matrix.sparse_mode is False
+    assert kinship_matrix.kinship_matrix.shape == (11, 11)
+    assert pedigree_family.build_kinship_matrix(True).kinship_matrix is None
+
+    for kinship_arguments in [(None,), ([None],), (list(pedigree_family.pedigree_individuals.values()), 1)]:
+        with pytest.raises(AssertionError, match='The kinship constructor arguments are not correct!'):
+            KinshipMatrix(*kinship_arguments)
+
+
+def test_kinship_ordering_method(pedigree_family):
+    """Test KinshipMatrix Ordering Method."""
+    individuals = pedigree_family.pedigree_individuals
+    kinship_individuals = pedigree_family.build_kinship_matrix().kinship_individuals
+
+    assert individuals['inbred'].generation_rank <= individuals['niece'].generation_rank
+
+    for individual in kinship_individuals:
+        for parent_identifier in (individual.individual_father, individual.individual_mother):
+            if parent_identifier != '0':
+                assert kinship_individuals.index(individuals[parent_identifier]) < \
+                    kinship_individuals.index(individual)
+
+
+def test_kinship_coefficient_method(pedigree_family):
+    """Test KinshipMatrix Coefficient Method."""
+    for kinship_matrix in [pedigree_family.build_kinship_matrix(), pedigree_family.build_kinship_matrix(True)]:
+        assert kinship_matrix.get_kinship('grandpa', 'grandpa') == 0.5
+        assert kinship_matrix.get_kinship('uncle', 'aunt') == 0.25
+        assert kinship_matrix.get_kinship('aunt', 'grandma') == 0.25
+        assert kinship_matrix.get_kinship('wife', 'husband') == 0.0
+        assert kinship_matrix.get_kinship('cousin1', 'cousin2') == 0.0625
+        assert kinship_matrix.get_kinship('uncle', 'cousin2') == 0.125
+        assert kinship_matrix.get_kinship('grandpa', 'proband') == 0.125
+        assert kinship_matrix.get_kinship('proband', 'proband') == 0.53125
+        assert kinship_matrix.get_inbreeding('proband') == 0.0625
+        assert kinship_matrix.get_inbreeding('inbred') == 0.125
+        assert kinship_matrix.get_inbreeding('cousin1') == 0.0
+
+        with pytest.raises(ValueError, match='The individual nobody is not in the kinship matrix!'):
+            kinship_matrix.get_kinship('nobody', 'proband')
+
+
+def test_kinship_sparse_method(pedigree_family):
+    """Test KinshipMatrix Sparse Method."""
+    dense_matrix = pedigree_family.build_kinship_matrix()
+    sparse_matrix = pedigree_family.build_kinship_matrix(True)
+    identifiers = [individual.individual_identifier for individual in dense_matrix.kinship_individuals]
+
+    assert np.array_equal(dense_matrix.kinship_matrix, dense_matrix.kinship_matrix.T)
+    assert np.array_equal(
+        dense_matrix.kinship_matrix,
+        np.array([[sparse_matrix.get_kinship(first, second) for second in identifiers] for first in identifiers])
+    )
+    assert np.array_equal(
+        dense_matrix.build_inbreeding_coefficients(), sparse_matrix.build_inbreeding_coefficients()
+    )
+
+    sparse_matrix = pedigree_family.build_kinship_matrix(True)
+    sparse_matrix.get_kinship('cousin1', 'cousin2')
+    assert len(sparse_matrix.coefficient_cache) < len(identifiers) ** 2 // 2
+
+
+def test_kinship_deep_method():
+    """Test KinshipMatrix Deep Method."""
+    chain_lines = [['chain', 'm0', '0', '0', '1', '1', 'null'], ['chain', 'f0', '0', '0', '2', '1', 'null']]
+
+    for generation in range(1, 1200):
+        chain_lines.append(['chain', 'f{}'.format(generation), '0', '0', '2', '1', 'null'])
+        chain_lines.append([
+            'chain', 'm{}'.format(generation), 'm{}'.format(generation - 1),
+            'f{}'.format(generation - 1), '1', '1', 'null'
+        ])
+
+    chain_lines[-1][6] = 'prb'
+    chain_family = Builder.build_pedigree_family(chain_lines)
+
+    sparse_matrix = chain_family.build_kinship_matrix(True)
+    assert sparse_matrix.get_kinship('m1199', 'm0') == 0.5 ** 1200
+    assert sparse_matrix.get_kinship('m1199', 'm1198') == 0.25
+    assert sparse_matrix.get_inbreeding('m1199') == 0.0
+
+    sparse_matrix = chain_family.build_kinship_matrix(True)
+    assert sparse_matrix.get_kinship('m0', 'm1199') == 0.5 ** 1200
+    assert sparse_matrix.get_kinship('f1198', 'm1199') == 0.25
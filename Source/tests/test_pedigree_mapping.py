@@ -0,0 +1,104 @@
+# This Python file uses the following encoding: UTF-8
+
+"""Test module on the class PedigreeMapping."""
+
+from unittest import mock
+
+import inspect
+import pytest
+
+from logic.pedigree_builder import Loader
+from logic.pedigree_builder import Builder
+from logic.pedigree_mapping import PedigreeMapping
+from logic.pedigree_table import PedigreeTable
+
+
+@pytest.fixture(name='file_data')
+def fixture_file_data() -> list:
+    """Return a fixture of the data of three pedigrees."""
+    return [
+        [pedigree_identifier, individual_identifier, father, mother, sex, '1', role]
+        for pedigree_identifier in ['ped1', 'ped2', 'ped3']
+        for individual_identifier, father, mother, sex, role in [
+            ('father', '0', '0', '1', 'null'),
+            ('mother', '0', '0', '2', 'null'),
+            ('son', 'father', 'mother', '1', 'prb'),
+        ]
+    ]
+
+
+def test_mapping_instances(file_data):
+    """Test PedigreeMapping Class Instances."""
+    pedigree_mapping = PedigreeMapping(file_data, 2)
+
+    assert isinstance(pedigree_mapping, PedigreeMapping)
+    assert inspect.isclass(PedigreeMapping)
+    assert pedigree_mapping.maximum_size == 2
+    assert list(pedigree_mapping) == ['ped1', 'ped2', 'ped3']
+    assert len(pedigree_mapping) == 3
+    assert 'ped2' in pedigree_mapping
+    assert 'ped4' not in pedigree_mapping
+    assert len(pedigree_mapping.built_pedigrees) == 0
+
+
+def test_mapping_constructor(file_data):
+    """Test PedigreeMapping Class Constructor."""
+    for mapping_arguments in [(None,), (tuple(file_data),), (file_data, 0), (file_data, '2')]:
+        with pytest.raises(AssertionError, match='The mapping constructor arguments are not correct!'):
+            PedigreeMapping(*mapping_arguments)
+
+
+def test_mapping_access_method(file_data):
+    """Test PedigreeMapping Access Method."""
+    pedigree_mapping = PedigreeMapping(file_data)
+    pedigree_family = pedigree_mapping['ped2']
+
+    assert pedigree_family.pedigree_identifier == 'ped2'
+    assert list(pedigree_family.pedigree_individuals) == ['father', 'mother', 'son']
+    assert pedigree_family.max_generation_rank == 2
+    assert list(pedigree_mapping.built_pedigrees) == ['ped2']
+    assert pedigree_mapping['ped2'] is pedigree_family
+    assert pedigree_mapping.get('ped4') is None
+
+    with pytest.raises(KeyError):
+        pedigree_mapping['ped4']
+
+    assert list(pedigree_mapping.values()) == Builder(file_data).file_pedigrees
+
+
+def test_mapping_eviction_method(file_data):
+    """Test PedigreeMapping Eviction Method."""
+    pedigree_mapping = PedigreeMapping(file_data, 2)
+    first_family = pedigree_mapping['ped1']
+
+    pedigree_mapping['ped2']
+    pedigree_mapping['ped1']
+    pedigree_mapping['ped3']
+
+    assert list(pedigree_mapping.built_pedigrees) == ['ped1', 'ped3']
+    assert pedigree_mapping['ped1'] is first_family
+    assert pedigree_mapping['ped2'] is not None
+    assert list(pedigree_mapping.built_pedigrees) == ['ped1', 'ped2']
+
+    table_mapping = PedigreeMapping(
+        Loader('../../Examples/TXT Examples/Pedigree7.txt', {'columnar': True}).file_data, 1
+    )
+    assert len(table_mapping['ped1'].pedigree_individuals) == 14
+
+
+def test_mapping_table_method(file_data):
+    """Test PedigreeMapping Table Method."""
+    pedigree_table = PedigreeTable.build_table(file_data)
+
+    with mock.patch.object(PedigreeTable, '__iter__') as iterate_method:
+        with mock.patch.object(PedigreeTable, '__getitem__', side_effect=file_data.__getitem__) as get_method:
+            pedigree_mapping = PedigreeMapping(pedigree_table)
+            assert list(pedigree_mapping) == ['ped1', 'ped2', 'ped3']
+            assert not get_method.called
+
+            pedigree_family = pedigree_mapping['ped2']
+            assert [call.args[0] for call in get_method.call_args_list] == [3, 4, 5]
+
+    assert not iterate_method.called
+    assert list(pedigree_family.pedigree_individuals) == ['father', 'mother', 'son']
+    assert list(PedigreeMapping(pedigree_table).values()) == Builder(file_data).file_pedigrees
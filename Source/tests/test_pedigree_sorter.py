@@ -0,0 +1,101 @@
+# This Python file uses the following encoding: UTF-8
+
+"""Test module on the class ExternalSorter."""
+
+import random
+import inspect
+import pytest
+
+from logic.pedigree_builder import Loader
+from logic.pedigree_builder import Builder
+from logic.pedigree_sorter import ExternalSorter
+
+
+@pytest.fixture(name='file_lines')
+def fixture_file_lines() -> list:
+    """Return a fixture of numbered lines of interleaved pedigrees."""
+    shuffler = random.Random(1331)
+    pedigree_lines = [
+        ['ped{}'.format(pedigree), 'ind{}'.format(individual)]
+        for pedigree in range(20)
+        for individual in range(5)
+    ]
+    shuffler.shuffle(pedigree_lines)
+    return list(enumerate(pedigree_lines, 2))
+
+
+def test_sorter_instances():
+    """Test ExternalSorter Class Instances."""
+    sorter = ExternalSorter(16)
+
+    assert isinstance(sorter, ExternalSorter)
+    assert inspect.isclass(ExternalSorter)
+    assert sorter.run_size == 16
+    assert sorter.merge_fan_in == ExternalSorter.MERGE_FAN_IN
+
+
+def test_sorter_constructor():
+    """Test ExternalSorter Class Constructor."""
+    with pytest.raises(AssertionError, match='The sorter constructor arguments are not correct!'):
+        ExternalSorter(0)
+
+    with pytest.raises(AssertionError, match='The sorter constructor arguments are not correct!'):
+        ExternalSorter('16')
+
+    with pytest.raises(AssertionError, match='The sorter constructor arguments are not correct!'):
+        ExternalSorter(16, 1)
+
+
+def test_sorter_sorting_method(file_lines):
+    """Test ExternalSorter Sorting Method."""
+    first_lines = {}
+
+    for line_number, data_unit in file_lines:
+        first_lines.setdefault(data_unit[0], line_number)
+
+    expected_lines = sorted(
+        file_lines, key=lambda file_line: (first_lines[file_line[1][0]], file_line[0])
+    )
+
+    for run_size in [1, 3, 7, 100, 1000]:
+        assert list(ExternalSorter(run_size).sort_file_lines(file_lines)) == expected_lines
+
+    for merge_fan_in in [2, 3, 10]:
+        assert list(ExternalSorter(1, merge_fan_in).sort_file_lines(file_lines)) == expected_lines
+
+    assert list(ExternalSorter(3).sort_file_lines([])) == []
+
+
+def test_loader_interleaved_method(tmp_path):
+    """Test Loader Interleaved Method."""
+    file_path = tmp_path / 'Interleaved.ped'
+    file_path.write_text(
+        '#pedigree_identifier\t#individual_identifier\t#individual_father\t'
+        '#individual_mother\t#individual_sex\t#individual_status\t#individual_role\n'
+        'ped1\tfather\t0\t0\t1\t1\tprb\n'
+        'ped2\tfather\t0\t0\t1\t1\tprb\n'
+        'ped1\tmother\t0\t0\t2\t1\tnull\n'
+        'ped2\tmother\t0\t0\t2\t1\tnull\n'
+        'ped2\tson\tfather\tmother\t1\t1\tnull\n'
+        'ped1\tdau\tfather\tmother\t2\t1\tnull\n'
+        '\n'
+    )
+    loader = Loader(str(file_path), {'streaming': True, 'interleaved': True, 'run_size': 2})
+    pedigree_groups = list(loader.stream_file_data())
+
+    assert [
+        [data_unit[1] for data_unit in pedigree_data]
+        for pedigree_data in pedigree_groups
+    ] == [['father', 'mother', 'dau'], ['father', 'mother', 'son']]
+
+    pedigrees = list(Builder.stream_file_pedigrees(pedigree_groups))
+    assert [pedigree.pedigree_identifier for pedigree in pedigrees] == ['ped1', 'ped2']
+
+    file_path.write_text(file_path.read_text()[:-1] + 'ped3\tfather\t0\t0\t1\t1\tprb\n\n')
+
+    loader = Loader(str(file_path), {'streaming': True, 'interleaved': True, 'run_size': 2})
+
+    with pytest.raises(SystemExit) as pytest_wrapped_error:
+        list(loader.stream_file_data())
+
+    assert pytest_wrapped_error.value.code == 1
@@ -0,0 +1,136 @@
+# This Python file uses the following encoding: UTF-8
+
+"""Test module on the class PedigreeTable."""
+
+from array import array
+
+import inspect
+import pytest
+
+from logic.pedigree_table import PedigreeTable
+from logic.pedigree_builder import Loader
+from logic.pedigree_builder import Builder
+from logic.pedigree_validator import Validator
+
+
+@pytest.fixture(name='table_data')
+def fixture_table_data() -> list:
+    """Return a fixture of lines of two pedigrees."""
+    return [
+        ['ped1', 'father', '0', '0', '1', '1', 'null'],
+        ['ped1', 'mother', '0', '0', '2', '1', 'null'],
+        ['ped1', 'child', 'father', 'mother', '1', '2', 'prb'],
+        ['ped2', 'father', '0', '0', '1', '1', 'null'],
+        ['ped2', 'mother', '0', '0', '2', '1', 'null'],
+        ['ped2', 'child', 'father', 'mother', '2', '0', 'prb'],
+    ]
+
+
+@pytest.fixture(name='pedigree_table')
+def fixture_pedigree_table(table_data) -> PedigreeTable:
+    """Return a fixture of PedigreeTable class with two pedigrees."""
+    return PedigreeTable.build_table(table_data)
+
+
+def test_table_instances(pedigree_table):
+    """Test PedigreeTable Class Instances."""
+    assert isinstance(pedigree_table, PedigreeTable)
+    assert inspect.isclass(PedigreeTable)
+    assert len(pedigree_table) == 6
+
+
+def test_table_rows(pedigree_table, table_data):
+    """Test PedigreeTable Rows."""
+    assert list(pedigree_table) == table_data
+    assert pedigree_table[2] == table_data[2]
+    assert pedigree_table[-1] == table_data[-1]
+
+
+def test_table_interning(pedigree_table):
+    """Test PedigreeTable Interning."""
+    assert pedigree_table.identifiers == [
+        '0', 'ped1', 'father', 'mother', 'child', 'ped2'
+    ]
+    assert pedigree_table.intern_identifier('child') == 4
+    assert pedigree_table.intern_identifier('0') == 0
+
+    assert isinstance(pedigree_table.get_column('individual_father'), array)
+    assert list(pedigree_table.get_column('individual_father')) == \
+        [0, 0, 2, 0, 0, 2]
+    assert list(pedigree_table.get_column('individual_role')) == \
+        [0, 0, 1, 0, 0, 1]
+
+
+def test_table_values(pedigree_table):
+    """Test PedigreeTable Values."""
+    assert pedigree_table.count_values('individual_sex') == {'1': 3, '2': 3}
+    assert pedigree_table.count_values('pedigree_identifier') == \
+        {'ped1': 3, 'ped2': 3}
+
+    pedigree_table.add_data_unit(['ped3', 'x', '0', '0', 'other', '1', 'proband'])
+    assert pedigree_table[-1] == ['ped3', 'x', '0', '0', 'other', '1', 'proband']
+    assert pedigree_table.column_values['individual_sex'] == ['0', '1', '2', 'other']
+
+    for index in range(PedigreeTable.MAXIMUM_VALUES - 4):
+        pedigree_table.encode_value('individual_sex', str(index + 3))
+
+    with pytest.raises(ValueError, match='The column individual_sex has too many different values!'):
+        pedigree_table.encode_value('individual_sex', 'overflow')
+
+
+def test_loader_columnar_method():
+    """Test Loader Columnar Method."""
+    for file_path in [
+        '../../Examples/CSV Examples/Pedigree1.csv',
+        '../../Examples/PED Examples/Pedigree1.ped',
+        '../../Examples/TXT Examples/Pedigree6.txt',
+        '../../Examples/TXT Examples/Pedigree7.txt',
+    ]:
+        loader = Loader(file_path, {'columnar': True})
+
+        assert isinstance(loader.file_data, PedigreeTable)
+        assert list(loader.file_data) == Loader(file_path).file_data
+
+    with pytest.raises(SystemExit) as system_exit:
+        Loader('../../Examples/PED Examples/Pedigree7.ped', {'columnar': True})
+
+    assert system_exit.value.code == 1
+
+
+def test_builder_columnar_method():
+    """Test Builder Columnar Method."""
+    file_path = '../../Examples/TXT Examples/Pedigree7.txt'
+    builder1 = Builder(Loader(file_path, {'columnar': True}).file_data)
+    builder2 = Builder(Loader(file_path).file_data)
+
+    assert len(builder1.file_pedigrees) == len(builder2.file_pedigrees)
+    assert len(builder1.file_individuals) == len(builder2.file_individuals)
+
+    for pedigree1, pedigree2 in zip(builder1.file_pedigrees, builder2.file_pedigrees):
+        assert pedigree1.pedigree_identifier == pedigree2.pedigree_identifier
+        assert list(pedigree1.pedigree_individuals) == \
+            list(pedigree2.pedigree_individuals)
+        assert pedigree1.max_generation_rank == pedigree2.max_generation_rank
+
+
+def test_validator_table_method(table_data):
+    """Test Validator Table Method."""
+    invalid_data = table_data + [
+        ['ped3', 'child', 'mother', 'father', '1', '1', 'prb'],
+        ['ped3', 'father', '0', '0', '1', '1', 'null'],
+        ['ped3', 'mother', 'nobody', '0', '2', '1', 'prb'],
+        ['ped4', 'alone', '0', '0', '1', '1', 'null'],
+    ]
+
+    for data in [table_data, invalid_data]:
+        assert Validator.validate_pedigree_table(PedigreeTable.build_table(data), 2) == \
+            Validator.validate_pedigree_data(data, range(2, len(data) + 2))
+
+    assert len(Validator.validate_pedigree_table(PedigreeTable.build_table(invalid_data), 2)) == 6
+
+
+def test_builder_table_grouping(pedigree_table, table_data):
+    """Test Builder Table Grouping."""
+    assert list(pedigree_table.group_row_indices()) == ['ped1', 'ped2']
+    assert list(pedigree_table.group_row_indices()['ped2']) == [3, 4, 5]
+    assert Builder.group_file_units(pedigree_table) == Builder.group_file_units(table_data)
@@ -0,0 +1,136 @@
+# This Python file uses the following encoding: UTF-8
+
+"""Test module on the class Tokenizer."""
+
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+
+import inspect
+import pytest
+
+from logic.pedigree_tokenizer import Tokenizer
+from logic.pedigree_tokenizer import map_file_ranges
+from logic.pedigree_tokenizer import split_file_ranges
+
+
+@pytest.fixture(name='tokenizer')
+def fixture_tokenizer() -> Tokenizer:
+    """Return a fixture of Tokenizer class with reordered columns."""
+    return Tokenizer((1, 0, 2, 3, 4, 5, 6))
+
+
+def test_tokenizer_instances(tokenizer):
+    """Test Tokenizer Class Instances."""
+    assert isinstance(tokenizer, Tokenizer)
+    assert inspect.isclass(Tokenizer)
+    assert tokenizer.column_indices == (1, 0, 2, 3, 4, 5, 6)
+
+
+def test_tokenizer_constructor():
+    """Test Tokenizer Class Constructor."""
+    with pytest.raises(AssertionError, match='The tokenizer constructor arguments are not correct!'):
+        Tokenizer([0, 1, 2])
+
+    with pytest.raises(AssertionError, match='The tokenizer constructor arguments are not correct!'):
+        Tokenizer((0, '1'))
+
+
+def test_tokenizer_header_method():
+    """Test Tokenizer Header Method."""
+    header_line = '#pedigree_identifier\t\t#individual_identifier  #individual_father\n'
+    result = Tokenizer.tokenize_header(header_line)
+
+    assert result == ['pedigree_identifier', 'individual_identifier', 'individual_father']
+
+
+def test_tokenizer_line_method(tokenizer):
+    """Test Tokenizer Line Method."""
+    file_line = 'father\t\tped  \t 0\t0\t1\t2\tprb\t\t\n'.encode('utf-8')
+    result = tokenizer.tokenize_line(file_line)
+
+    assert result == ['ped', 'father', '0', '0', '1', '2', 'prb']
+
+
+def test_tokenizer_lines_method(tokenizer):
+    """Test Tokenizer Lines Method."""
+    file_object = BytesIO(b'father\tped\t0\t0\t1\t2\tprb\nmother\tped\t0\t0\t2\t1\tnull\r\n\n')
+    result = list(tokenizer.tokenize_lines(file_object))
+
+    assert result == [
+        ['ped', 'father', '0', '0', '1', '2', 'prb'],
+        ['ped', 'mother', '0', '0', '2', '1', 'null'],
+    ]
+
+    with pytest.raises(ValueError, match='The file must end with a new line!'):
+        list(tokenizer.tokenize_lines(BytesIO(b'father\tped\t0\t0\t1\t2\tprb\n')))
+
+    with pytest.raises(ValueError, match='The line 3 has a missing value!'):
+        list(tokenizer.tokenize_lines(BytesIO(b'father\tped\t0\t0\t1\t2\tprb\nmother\tped\n\n')))
+
+
+def collect_tokenized_lines(tokenize_method, *arguments) -> tuple:
+    """Collect the tokenized lines or the message of the error."""
+    try:
+        return list(tokenize_method(*arguments)), None
+    except ValueError as value_error:
+        return None, str(value_error)
+
+
+@pytest.mark.parametrize('file_bytes', [
+    b'father\tped\t0\t0\t1\t2\tprb\nmother\tped\t0\t0\t2\t1\tnull\r\n'
+    b'son\tped\tfather\tmother\t1\t1\tnull\nfather\tped2\t0\t0\t1\t2\tprb\n\n',
+    b'father\tped\t0\t0\t1\t2\tprb\nmother\tped\t0\t0\t2\t1\tnull\r\n\r\n',
+    b'father\tped\t0\t0\t1\t2\tprb\nmother\tped\t0\t0\t2\t1\tnull\n',
+    b'father\tped\t0\t0\t1\t2\tprb\nmother\tped\t0\t0\t2\t1\tnull',
+    b'father\tped\t0\t0\t1\t2\tprb\nmother\tped\n\n',
+    b'father\tped\t0\t0\t1\t2\tprb\n\nmother\tped\t0\t0\t2\t1\tnull\n',
+    b'',
+])
+def test_tokenizer_ranges_method(tokenizer, tmp_path, file_bytes):
+    """Test Tokenizer Ranges Method."""
+    file_path = tmp_path / 'Pedigree.ped'
+    file_path.write_bytes(b'#header\n' + file_bytes)
+
+    file_object = BytesIO(file_bytes)
+    expected_result = collect_tokenized_lines(tokenizer.tokenize_lines, file_object)
+
+    for range_size in [1, 7, 30, 1 << 20]:
+        result = collect_tokenized_lines(
+            tokenizer.tokenize_file_ranges, str(file_path), 2, range_size
+        )
+        assert result == expected_result
+
+
+def test_tokenizer_split_method(tmp_path):
+    """Test Tokenizer Split Method."""
+    file_path = tmp_path / 'Pedigree.ped'
+    file_path.write_bytes(b'#header\nline1\nline22\nline333\n\n')
+
+    with open(file_path, 'rb') as file_object:
+        assert split_file_ranges(file_object, 8, 1) == \
+            [(8, 14), (14, 21), (21, 29), (29, 30)]
+        assert split_file_ranges(file_object, 8, 10) == [(8, 21), (21, 30)]
+        assert split_file_ranges(file_object, 8, 100) == [(8, 30)]
+        assert split_file_ranges(file_object, 30, 1) == []
+
+
+def test_tokenizer_window_method(tmp_path):
+    """Test Tokenizer Window Method."""
+    file_path = tmp_path / 'Pedigree.ped'
+    file_line = b'father\tped\t0\t0\t1\t2\tprb\n'
+    file_path.write_bytes(b'#header\n' + file_line * 8 + b'\n')
+    submitted_ranges = []
+
+    def range_arguments():
+        for range_index in range(8):
+            range_start = 8 + range_index * len(file_line)
+            submitted_ranges.append(range_start)
+            yield str(file_path), (1, 0), range_start, range_start + len(file_line), False
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        range_results = map_file_ranges(executor, range_arguments(), 2)
+
+        assert next(range_results)[0] == [['ped', 'father']]
+        assert len(submitted_ranges) == 3
+        assert len(list(range_results)) == 7
+        assert len(submitted_ranges) == 8
@@ -0,0 +1,74 @@
+# This Python file uses the following encoding: UTF-8
+
+"""Test module on the class Validator."""
+
+import inspect
+import pytest
+
+from logic.pedigree_validator import Validator
+
+
+@pytest.fixture(name='valid_data')
+def fixture_valid_data() -> list:
+    return [
+        ['ped', 'son1', 'father', 'mother', '1', '2', 'null'],
+        ['ped', 'father', '0', '0', '1', '2', 'prb'],
+        ['ped', 'mother', '0', '0', '2', '1', 'null'],
+        ['pedigree', 'father', '0', '0', '1', '1', 'null'],
+        ['pedigree', 'mother', '0', '0', '2', '1', 'null'],
+        ['pedigree', 'dau', 'father', 'mother', '2', '1', 'prb'],
+    ]
+
+
+@pytest.fixture(name='invalid_data')
+def fixture_invalid_data() -> list:
+    return [
+        ['ped', 'father', '0', '0', '2', '2', 'prb'],
+        ['ped', 'mother', '0', '0', '2', '1', 'null'],
+        ['ped', 'son1', 'father', 'mother', '1', '2', 'prb'],
+        ['ped', 'son2', 'father', 'unknown', '1', '1', 'null'],
+        ['pedigree', 'father', '0', '0', '1', '1', 'null'],
+        ['pedigree', 'dau', 'father', 'father', '2', '1', 'null'],
+    ]
+
+
+def test_validator_instances():
+    """Test Validator Class Instances."""
+    assert isinstance(Validator(), Validator)
+    assert inspect.isclass(Validator)
+    assert Validator.MINIMUM_INDIVIDUALS == 3
+
+
+def test_validator_valid_data(valid_data):
+    """Test Validator With Valid Data."""
+    validator = Validator()
+    validator.add_data_units(valid_data, range(2, 8))
+
+    assert validator.pedigree_lines == {'ped': 2, 'pedigree': 5}
+    assert validator.collect_violations() == []
+    assert Validator.validate_pedigree_data(valid_data, range(2, 8)) == []
+
+
+def test_validator_invalid_data(invalid_data):
+    """Test Validator With Invalid Data."""
+    result = Validator.validate_pedigree_data(invalid_data, range(2, 8))
+
+    assert result == [
+        'Line 4: The father father of the individual son1 is not a male!',
+        'Line 4: The pedigree ped has more than one proband!',
+        'Line 5: The father father of the individual son2 is not a male!',
+        'Line 5: The mother unknown of the individual son2 is not in the pedigree ped!',
+        'Line 6: The pedigree pedigree has less than 3 individuals!',
+        'Line 6: The pedigree pedigree has not any proband!',
+        'Line 7: The mother father of the individual dau is not a female!',
+    ]
+
+
+def test_validator_parallel_data(valid_data, invalid_data):
+    """Test Validator With Parallel Workers."""
+    data = valid_data + invalid_data
+    sequential_result = Validator.validate_pedigree_data(data, range(2, 14))
+    parallel_result = Validator.validate_parallel_data(data, range(2, 14), 2, 1)
+
+    assert parallel_result == sequential_result
+    assert Validator.validate_parallel_data(valid_data, range(2, 8), 2, 4) == []